@@ -7,11 +7,49 @@ animated reimaginings in new contexts.
 
 from setuptools import setup, find_packages
 from pathlib import Path
+import os
 
 # Read README
 this_directory = Path(__file__).parent
 long_description = (this_directory / "README.md").read_text(encoding="utf-8")
 
+# Hot pure-Python modules that can optionally be compiled to C extensions.
+# Opt in with DOPPELGANGER_COMPILE=cython or DOPPELGANGER_COMPILE=mypyc, e.g.
+#   DOPPELGANGER_COMPILE=mypyc python setup.py build_ext -b .
+# The .py sources stay alongside the built .so and are used whenever the
+# compiler is not installed; CPython prefers the .so when both exist.
+# Pydantic model definitions must stay interpreted (mypyc erases their
+# generic annotations), which is why the schemas live in response_schemas.
+COMPILED_MODULES = [
+    "src/services/creative/response_validators.py",
+]
+
+
+def compiled_extensions():
+    """Return extension modules for the opt-in compiled build."""
+    backend = os.environ.get("DOPPELGANGER_COMPILE", "").lower()
+    if backend == "mypyc":
+        try:
+            from mypyc.build import mypycify
+        except ImportError:
+            print("mypyc not installed; building pure-Python modules only")
+            return []
+        # Type-check only the compiled modules; the rest of the package
+        # is imported at runtime as plain Python.
+        return mypycify(["--follow-imports=silent", *COMPILED_MODULES])
+    if backend != "cython":
+        return []
+    try:
+        from Cython.Build import cythonize
+    except ImportError:
+        print("Cython not installed; building pure-Python modules only")
+        return []
+    return cythonize(
+        COMPILED_MODULES,
+        compiler_directives={"language_level": "3", "binding": True},
+        quiet=True,
+    )
+
 setup(
     name="doppelganger-studio",
     version="0.1.0-alpha",
@@ -28,6 +66,7 @@ setup(
     },
     packages=find_packages(where="src"),
     package_dir={"": "src"},
+    ext_modules=compiled_extensions(),
     classifiers=[
         "Development Status :: 3 - Alpha",
         "Intended Audience :: Developers",
@@ -79,6 +118,10 @@ setup(
             "manim>=0.18.0",
             "opencv-python>=4.8.1.78",
         ],
+        "speedups": [
+            "orjson>=3.9.0",
+            "fastjsonschema>=2.19.0",
+        ],
     },
     entry_points={
         "console_scripts": [
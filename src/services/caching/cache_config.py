@@ -129,7 +129,8 @@ def generate_ai_cache_key(
     model: str,
     temperature: float = 0.7,
     max_tokens: Optional[int] = None,
-    json_mode: bool = False
+    json_mode: bool = False,
+    cached_prefix: Optional[str] = None
 ) -> str:
     """
     Generate cache key for AI responses.
@@ -140,6 +141,8 @@ def generate_ai_cache_key(
         temperature: Sampling temperature
         max_tokens: Max tokens to generate
         json_mode: Whether JSON mode is enabled
+        cached_prefix: Shared context sent ahead of the prompt, keyed as
+            its own component so no prefix/prompt split can collide
     
     Returns:
         Cache key for AI response
@@ -150,7 +153,8 @@ def generate_ai_cache_key(
         model=model,
         temperature=temperature,
         max_tokens=max_tokens,
-        json_mode=json_mode
+        json_mode=json_mode,
+        cached_prefix=cached_prefix
     )
 
 
@@ -97,8 +97,7 @@ class CharacterAnalyzer:
                 response_json = json.loads(raw_response)
                 
                 # Validate
-                validator = AIResponseValidator()
-                validated = validator.validate_character_analysis(
+                validated = AIResponseValidator.validate_character_analysis(
                     response_json
                 )
                 
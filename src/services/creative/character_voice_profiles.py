@@ -8,9 +8,12 @@ to ensure dialogue consistency across scenes and episodes.
 """
 
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional
+from functools import cached_property
+from typing import Collection, List, Dict, Optional, Tuple
 from datetime import datetime
 
+from src.services.creative.rate_limiter import CHARS_PER_TOKEN
+
 
 @dataclass
 class CharacterVoiceProfile:
@@ -66,6 +69,21 @@ class CharacterVoiceProfile:
     # Metadata
     created_at: datetime = field(default_factory=datetime.now)
     
+    @cached_property
+    def catchphrases_lower(self) -> Tuple[str, ...]:
+        """
+        Catchphrases lower-cased, for case-insensitive matching.
+        
+        Built on first use, so catchphrases must not change after it has
+        been read.
+        """
+        return tuple(phrase.lower() for phrase in self.catchphrases)
+    
+    @cached_property
+    def vocabulary_level_key(self) -> str:
+        """Vocabulary level lower-cased, for table lookups."""
+        return self.vocabulary_level.lower()
+    
     def get_speaking_style_summary(self) -> str:
         """Generate human-readable summary of speaking style."""
         summary = f"{self.character_name} speaks with {self.vocabulary_level} vocabulary "
@@ -128,6 +146,54 @@ class CharacterVoiceProfile:
         )
 
 
+@dataclass(frozen=True)
+class RenderedVoiceProfiles:
+    """
+    Prompt-ready speaking-style summaries for a cast of voice profiles.
+    
+    Rendered once per script and shared by every scene prompt, instead of
+    re-summarizing each profile for every scene.
+    
+    Attributes:
+        summaries: (character_name, summary) pairs in profile order
+        text: Every summary as "Name: summary", each on a new line
+        token_estimate: Approximate prompt tokens taken by text
+    
+    Example:
+        >>> rendered = RenderedVoiceProfiles.from_profiles(profiles)
+        >>> prompt = f"VOICE PROFILES:{rendered.text}"
+    """
+    
+    summaries: Tuple[Tuple[str, str], ...]
+    text: str
+    token_estimate: int
+    
+    @classmethod
+    def from_profiles(
+        cls,
+        profiles: Dict[str, CharacterVoiceProfile]
+    ) -> 'RenderedVoiceProfiles':
+        """Render every profile's speaking-style summary."""
+        summaries = tuple(
+            (name, profile.get_speaking_style_summary())
+            for name, profile in profiles.items()
+        )
+        text = "".join(f"\n{name}: {summary}" for name, summary in summaries)
+        return cls(
+            summaries=summaries,
+            text=text,
+            token_estimate=len(text) // CHARS_PER_TOKEN,
+        )
+    
+    def guidance_for(self, characters: Collection[str]) -> str:
+        """Summaries of the given characters only, one per line."""
+        return "\n".join(
+            f"{name}: {summary}"
+            for name, summary in self.summaries
+            if name in characters
+        )
+
+
 @dataclass
 class DialogueLine:
     """
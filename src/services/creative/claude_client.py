@@ -7,10 +7,11 @@ response caching, and error handling.
 Copyright (c) 2025. All Rights Reserved. Patent Pending.
 """
 
-from typing import Dict, List, Optional, Any
+from typing import AsyncGenerator, Dict, List, Optional, Any
 import asyncio
 import logging
 from anthropic import AsyncAnthropic
+import httpx
 from dataclasses import dataclass
 import hashlib
 import json
@@ -20,6 +21,11 @@ from src.services.caching import (
     generate_ai_cache_key,
     CacheTTL,
 )
+from src.services.creative.rate_limiter import (
+    TokenBucketRateLimiter,
+    estimate_request_tokens,
+)
+from src.services.monitoring.performance_monitor import get_performance_monitor
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +51,7 @@ class ClaudeClient:
     - Token usage tracking
     - Automatic retry with exponential backoff
     - Context window management
+    - Prompt caching of stable prompt prefixes
     """
     
     MODEL = "claude-sonnet-4-20250514"  # Claude Sonnet 4.5
@@ -55,7 +62,9 @@ class ClaudeClient:
         self,
         api_key: str,
         enable_caching: bool = True,
-        cache_ttl: int = CacheTTL.LONG.value
+        cache_ttl: int = CacheTTL.LONG.value,
+        http_client: Optional[httpx.AsyncClient] = None,
+        rate_limiter: Optional[TokenBucketRateLimiter] = None
     ):
         """
         Initialize Claude client.
@@ -64,10 +73,18 @@ class ClaudeClient:
             api_key: Anthropic API key
             enable_caching: Whether to enable response caching
             cache_ttl: Cache time-to-live in seconds (default 7 days)
+            http_client: Optional shared connection pool. The underlying
+                SDK client is created once and reused for every request,
+                so keep-alive connections survive across calls. An
+                injected pool stays open on close(); its owner closes it.
+            rate_limiter: Optional RPM/TPM limiter awaited before every
+                API request (may be shared with other clients)
         """
-        self.client = AsyncAnthropic(api_key=api_key)
+        self.client = AsyncAnthropic(api_key=api_key, http_client=http_client)
+        self._owns_http_client = http_client is None
         self.enable_caching = enable_caching
         self.cache_ttl = cache_ttl
+        self.rate_limiter = rate_limiter
         
         # Get cache manager
         self.cache_manager = get_cache_manager() if enable_caching else None
@@ -76,6 +93,7 @@ class ClaudeClient:
         self.total_tokens_used = 0
         self.total_requests = 0
         self.cache_hits = 0
+        self.prompt_cache_read_tokens = 0
     
     async def generate(
         self,
@@ -84,7 +102,8 @@ class ClaudeClient:
         max_tokens: int = MAX_TOKENS,
         temperature: float = DEFAULT_TEMPERATURE,
         json_mode: bool = False,
-        use_cache: bool = True
+        use_cache: bool = True,
+        cached_prefix: Optional[str] = None
     ) -> AIResponse:
         """
         Generate text using Claude.
@@ -96,6 +115,10 @@ class ClaudeClient:
             temperature: Sampling temperature (0-1)
             json_mode: Request JSON-formatted response
             use_cache: Whether to use cached responses
+            cached_prefix: Optional context shared by many requests (show
+                metadata, voice profiles, instructions). Sent ahead of the
+                prompt with cache_control so Anthropic bills repeat reads
+                of it at the cached-input rate.
             
         Returns:
             AIResponse with generated content
@@ -110,10 +133,11 @@ class ClaudeClient:
         """
         logger.debug(f"Generating with Claude (prompt length: {len(prompt)})")
         
-        # Check cache
+        # Check cache; the prefix is part of the request, so it is keyed
+        # alongside the prompt
         if use_cache:
             cached = await self._get_from_cache(
-                prompt, system_prompt, max_tokens, temperature
+                prompt, system_prompt, max_tokens, temperature, cached_prefix
             )
             if cached:
                 logger.debug("Cache hit!")
@@ -121,11 +145,13 @@ class ClaudeClient:
                 return cached
         
         # Add JSON instruction if needed
+        request_prompt = prompt
         if json_mode:
-            prompt = f"{prompt}\n\nRespond ONLY with valid JSON. No other text."
+            request_prompt = (
+                f"{prompt}\n\nRespond ONLY with valid JSON. No other text."
+            )
         
-        # Build messages
-        messages = [{"role": "user", "content": prompt}]
+        messages = self._build_messages(request_prompt, cached_prefix)
         
         # Make API call with retry
         try:
@@ -140,9 +166,18 @@ class ClaudeClient:
             content = response.content[0].text
             tokens_used = response.usage.input_tokens + response.usage.output_tokens
             
+            cache_read_tokens = (
+                getattr(response.usage, 'cache_read_input_tokens', 0) or 0
+            )
+            
             # Update tracking
             self.total_tokens_used += tokens_used
             self.total_requests += 1
+            self.prompt_cache_read_tokens += cache_read_tokens
+            get_performance_monitor().record_api_call(
+                tokens_used=tokens_used,
+                cache_read_tokens=cache_read_tokens
+            )
             
             # Build response object
             ai_response = AIResponse(
@@ -157,11 +192,13 @@ class ClaudeClient:
             # Cache response
             if use_cache:
                 await self._save_to_cache(
-                    prompt, system_prompt, max_tokens, temperature, ai_response
+                    prompt, system_prompt, max_tokens, temperature,
+                    ai_response, cached_prefix
                 )
             
             logger.info(
-                f"Generated {tokens_used} tokens "
+                f"Generated {tokens_used} tokens, "
+                f"{cache_read_tokens} read from prompt cache "
                 f"(total: {self.total_tokens_used:,})"
             )
             
@@ -171,12 +208,148 @@ class ClaudeClient:
             logger.error(f"Claude generation failed: {e}")
             raise
     
+    async def generate_batch(
+        self,
+        prompts: Dict[str, str],
+        system_prompt: Optional[str] = None,
+        max_tokens: int = MAX_TOKENS,
+        temperature: float = DEFAULT_TEMPERATURE,
+        cached_prefix: Optional[str] = None,
+        poll_interval: float = 30.0
+    ) -> Dict[str, Optional[str]]:
+        """
+        Generate many texts through the Message Batches API.
+        
+        For offline jobs: batches are billed at half the live rate but may
+        take minutes to hours, so this polls until the batch has ended.
+        Responses are not cached.
+        
+        Args:
+            prompts: Prompt per request ID (1-64 letters, digits, _ or -)
+            system_prompt: Optional system prompt for every request
+            max_tokens: Maximum tokens to generate per request
+            temperature: Sampling temperature (0-1)
+            cached_prefix: Optional context shared by every prompt (see
+                generate)
+            poll_interval: Seconds between batch status checks
+            
+        Returns:
+            Generated text per request ID, or None for requests that
+            errored, expired or were canceled
+        """
+        requests = []
+        for custom_id, prompt in prompts.items():
+            params: Dict[str, Any] = {
+                'model': self.MODEL,
+                'max_tokens': max_tokens,
+                'temperature': temperature,
+                'messages': self._build_messages(prompt, cached_prefix)
+            }
+            if system_prompt:
+                params['system'] = system_prompt
+            requests.append({'custom_id': custom_id, 'params': params})
+        
+        batch = await self.client.messages.batches.create(requests=requests)
+        logger.info(f"Submitted message batch {batch.id} ({len(requests)} requests)")
+        
+        while batch.processing_status != "ended":
+            await asyncio.sleep(poll_interval)
+            batch = await self.client.messages.batches.retrieve(batch.id)
+        
+        # Results arrive in any order; match them up by request ID
+        results: Dict[str, Optional[str]] = dict.fromkeys(prompts)
+        async for entry in await self.client.messages.batches.results(batch.id):
+            if entry.result.type != "succeeded":
+                logger.warning(
+                    f"Batch request {entry.custom_id} {entry.result.type}"
+                )
+                continue
+            
+            message = entry.result.message
+            tokens_used = message.usage.input_tokens + message.usage.output_tokens
+            cache_read_tokens = (
+                getattr(message.usage, 'cache_read_input_tokens', 0) or 0
+            )
+            self.total_tokens_used += tokens_used
+            self.total_requests += 1
+            self.prompt_cache_read_tokens += cache_read_tokens
+            get_performance_monitor().record_api_call(
+                tokens_used=tokens_used,
+                cache_read_tokens=cache_read_tokens
+            )
+            results[entry.custom_id] = message.content[0].text
+        
+        logger.info(
+            f"Message batch {batch.id} ended: "
+            f"{sum(text is not None for text in results.values())}/"
+            f"{len(results)} succeeded"
+        )
+        
+        return results
+    
+    async def generate_stream(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        max_tokens: int = MAX_TOKENS,
+        temperature: float = DEFAULT_TEMPERATURE,
+        cached_prefix: Optional[str] = None
+    ) -> AsyncGenerator[str, None]:
+        """
+        Generate text, yielding it in deltas as the model produces it.
+        
+        Lets callers work on the start of a long response while the rest is
+        generated, or abandon it early. Closing the iterator (e.g. with
+        contextlib.aclosing) ends the underlying request. Responses are not
+        cached or retried, since part of one may already be consumed.
+        
+        Args:
+            prompt: User prompt
+            system_prompt: Optional system prompt
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature (0-1)
+            cached_prefix: Optional stable context (see generate)
+            
+        Yields:
+            Text deltas in order
+        """
+        messages = self._build_messages(prompt, cached_prefix)
+        kwargs: Dict[str, Any] = {
+            'model': self.MODEL,
+            'max_tokens': max_tokens,
+            'temperature': temperature,
+            'messages': messages
+        }
+        if system_prompt:
+            kwargs['system'] = system_prompt
+        
+        await self._acquire_rate_limit(messages, system_prompt, max_tokens)
+        
+        async with self.client.messages.stream(**kwargs) as stream:
+            async for text in stream.text_stream:
+                yield text
+            
+            message = await stream.get_final_message()
+        
+        tokens_used = message.usage.input_tokens + message.usage.output_tokens
+        cache_read_tokens = (
+            getattr(message.usage, 'cache_read_input_tokens', 0) or 0
+        )
+        self.total_tokens_used += tokens_used
+        self.total_requests += 1
+        self.prompt_cache_read_tokens += cache_read_tokens
+        get_performance_monitor().record_api_call(
+            tokens_used=tokens_used,
+            cache_read_tokens=cache_read_tokens
+        )
+    
     async def generate_json(
         self,
         prompt: str,
         system_prompt: Optional[str] = None,
         max_tokens: int = MAX_TOKENS,
-        temperature: float = DEFAULT_TEMPERATURE
+        temperature: float = DEFAULT_TEMPERATURE,
+        cached_prefix: Optional[str] = None
     ) -> Dict:
         """
         Generate JSON response using Claude.
@@ -186,6 +359,7 @@ class ClaudeClient:
             system_prompt: Optional system prompt
             max_tokens: Maximum tokens to generate
             temperature: Sampling temperature
+            cached_prefix: Optional shared context (see generate)
             
         Returns:
             Parsed JSON dictionary
@@ -201,7 +375,8 @@ class ClaudeClient:
             system_prompt=system_prompt,
             max_tokens=max_tokens,
             temperature=temperature,
-            json_mode=True
+            json_mode=True,
+            cached_prefix=cached_prefix
         )
         
         try:
@@ -212,6 +387,43 @@ class ClaudeClient:
             logger.debug(f"Raw response: {response.content}")
             raise ValueError(f"Invalid JSON response from Claude: {e}")
     
+    @staticmethod
+    def _build_messages(
+        prompt: str,
+        cached_prefix: Optional[str]
+    ) -> List[Dict]:
+        """Build the user message, with any stable prefix cached ahead of it."""
+        # The stable prefix goes first and ends the cached block, so only
+        # the per-call prompt after it is billed in full
+        if cached_prefix:
+            content: Any = [
+                {
+                    "type": "text",
+                    "text": cached_prefix,
+                    "cache_control": {"type": "ephemeral"},
+                },
+                {"type": "text", "text": prompt},
+            ]
+        else:
+            content = prompt
+        return [{"role": "user", "content": content}]
+    
+    async def _acquire_rate_limit(
+        self,
+        messages: List[Dict],
+        system: Optional[str],
+        max_tokens: int
+    ):
+        """Wait for rate limiter capacity for a request, if limiting."""
+        if not self.rate_limiter:
+            return
+        content = messages[-1]['content']
+        if not isinstance(content, str):
+            content = "".join(block['text'] for block in content)
+        await self.rate_limiter.acquire(
+            estimate_request_tokens(content + (system or ""), max_tokens)
+        )
+    
     async def _make_request_with_retry(
         self,
         messages: List[Dict],
@@ -233,6 +445,8 @@ class ClaudeClient:
                 if system:
                     kwargs['system'] = system
                 
+                await self._acquire_rate_limit(messages, system, max_tokens)
+                
                 response = await self.client.messages.create(**kwargs)
                 return response
                 
@@ -252,7 +466,8 @@ class ClaudeClient:
         prompt: str,
         system_prompt: Optional[str],
         max_tokens: int,
-        temperature: float
+        temperature: float,
+        cached_prefix: Optional[str] = None
     ) -> str:
         """Generate cache key from parameters using our cache key generator."""
         return generate_ai_cache_key(
@@ -260,7 +475,8 @@ class ClaudeClient:
             model=self.MODEL,
             temperature=temperature,
             max_tokens=max_tokens,
-            json_mode=False  # Add json_mode to kwargs if needed
+            json_mode=False,  # Add json_mode to kwargs if needed
+            cached_prefix=cached_prefix
         )
     
     async def _get_from_cache(
@@ -268,14 +484,17 @@ class ClaudeClient:
         prompt: str,
         system_prompt: Optional[str],
         max_tokens: int,
-        temperature: float
+        temperature: float,
+        cached_prefix: Optional[str] = None
     ) -> Optional[AIResponse]:
         """Retrieve response from cache if available."""
         if not self.cache_manager:
             return None
         
         try:
-            key = self._cache_key(prompt, system_prompt, max_tokens, temperature)
+            key = self._cache_key(
+                prompt, system_prompt, max_tokens, temperature, cached_prefix
+            )
             
             # Run sync cache get in executor to avoid blocking
             cached_data = await asyncio.get_event_loop().run_in_executor(
@@ -302,14 +521,17 @@ class ClaudeClient:
         system_prompt: Optional[str],
         max_tokens: int,
         temperature: float,
-        response: AIResponse
+        response: AIResponse,
+        cached_prefix: Optional[str] = None
     ):
         """Save response to cache."""
         if not self.cache_manager:
             return
         
         try:
-            key = self._cache_key(prompt, system_prompt, max_tokens, temperature)
+            key = self._cache_key(
+                prompt, system_prompt, max_tokens, temperature, cached_prefix
+            )
             cache_data = {
                 'content': response.content,
                 'model': response.model,
@@ -325,12 +547,18 @@ class ClaudeClient:
         except Exception as e:
             logger.warning(f"Cache save failed: {e}")
     
+    async def close(self):
+        """Close the pooled HTTP connections, unless they were injected."""
+        if self._owns_http_client:
+            await self.client.close()
+    
     def get_usage_stats(self) -> Dict[str, Any]:
         """Get usage statistics."""
         return {
             'total_requests': self.total_requests,
             'total_tokens': self.total_tokens_used,
             'cache_hits': self.cache_hits,
+            'prompt_cache_read_tokens': self.prompt_cache_read_tokens,
             'cache_hit_rate': (
                 self.cache_hits / self.total_requests
                 if self.total_requests > 0
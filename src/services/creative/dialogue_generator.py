@@ -8,7 +8,7 @@ voice, advances plot, and delivers comedy.
 """
 
 import logging
-from typing import List, Dict, Optional, Tuple, TYPE_CHECKING
+from typing import Collection, List, Dict, Optional, Tuple, TYPE_CHECKING
 from datetime import datetime
 import json
 
@@ -20,12 +20,43 @@ if TYPE_CHECKING:
 from src.services.creative.character_voice_profiles import (
     CharacterVoiceProfile,
     DialogueLine,
+    RenderedVoiceProfiles,
     SceneDialogue
 )
 
 logger = logging.getLogger(__name__)
 
 
+def score_dialogue_consistency(
+    dialogue_lines: List[DialogueLine],
+    characters: List[str],
+    profiled_characters: Collection[str]
+) -> float:
+    """
+    Score how well dialogue can be trusted to match character voices.
+    
+    Args:
+        dialogue_lines: Generated lines for the scene
+        characters: Characters present in the scene
+        profiled_characters: Characters with a voice profile
+    
+    Returns:
+        Consistency score (0.0-1.0)
+    """
+    if not dialogue_lines:
+        return 0.0
+    
+    # For now, return high confidence if we have voice profiles
+    has_profiles = sum(
+        1 for char in characters if char in profiled_characters
+    )
+    
+    if len(characters) == 0:
+        return 0.5
+    
+    return min(1.0, 0.5 + (has_profiles / len(characters)) * 0.5)
+
+
 class DialogueGenerator:
     """
     Generates character-consistent dialogue for scenes.
@@ -173,7 +204,8 @@ class DialogueGenerator:
         self,
         scene: dict,  # Scene from EpisodeOutline
         episode_context: dict,  # EpisodeOutline
-        narrative_structure: dict  # NarrativeAnalysis
+        narrative_structure: dict,  # NarrativeAnalysis
+        rendered_profiles: Optional[RenderedVoiceProfiles] = None
     ) -> SceneDialogue:
         """
         Generate complete dialogue for a scene.
@@ -190,6 +222,8 @@ class DialogueGenerator:
             scene: Scene outline from Phase 3
             episode_context: Full episode outline for context
             narrative_structure: Story structure patterns
+            rendered_profiles: Voice profiles already rendered for this
+                script; rendered from self.voice_profiles if omitted
         
         Returns:
             Complete scene dialogue with metadata
@@ -208,11 +242,15 @@ class DialogueGenerator:
         
         logger.info(f"Generating dialogue for Scene {scene_number} ({location})")
         
-        # Build comprehensive context
-        prompt = self._build_dialogue_prompt(
-            scene=scene,
+        # Episode-wide context first (identical for every scene, so the
+        # provider can serve it from its prompt cache), scene details after
+        prefix = self._build_dialogue_prefix(
             episode_context=episode_context,
             narrative_structure=narrative_structure,
+            rendered_profiles=rendered_profiles
+        )
+        prompt = self._build_dialogue_prompt(
+            scene=scene,
             characters=characters
         )
         
@@ -221,7 +259,8 @@ class DialogueGenerator:
             response = await self.claude.generate(
                 prompt=prompt,
                 max_tokens=4000,
-                temperature=0.8
+                temperature=0.8,
+                cached_prefix=prefix
             )
             
             # Parse response
@@ -321,27 +360,27 @@ Analyze how this character speaks and respond with JSON:
 Focus on concrete, actionable details that help generate consistent dialogue.
 """
     
-    def _build_dialogue_prompt(
+    def _build_dialogue_prefix(
         self,
-        scene: dict,
         episode_context: dict,
         narrative_structure: dict,
-        characters: List[str]
+        rendered_profiles: Optional[RenderedVoiceProfiles] = None
     ) -> str:
-        """Build prompt for dialogue generation."""
+        """
+        Build the scene-independent part of the dialogue prompt.
         
-        # Get voice profiles for characters
-        voice_guidance = ""
-        for character in characters:
-            if character in self.voice_profiles:
-                profile = self.voice_profiles[character]
-                voice_guidance += f"\n{character}: {profile.get_speaking_style_summary()}"
+        Holds everything that is the same for every scene of an episode
+        (instructions, episode context, all voice profiles, response
+        format), so it must not depend on the scene being written.
+        """
+        if rendered_profiles is None:
+            rendered_profiles = RenderedVoiceProfiles.from_profiles(
+                self.voice_profiles
+            )
+        voice_guidance = rendered_profiles.text
         
         return f"""
-You are a TV comedy writer. Generate natural, funny dialogue for this scene.
-
-SCENE CONTEXT:
-{json.dumps(scene, indent=2)}
+You are a TV comedy writer. Generate natural, funny dialogue for the scene described after this context.
 
 EPISODE CONTEXT:
 {json.dumps(episode_context, indent=2)}
@@ -376,6 +415,19 @@ Respond with JSON:
 }}
 
 Make it funny, natural, and true to the characters!
+"""
+    
+    def _build_dialogue_prompt(
+        self,
+        scene: dict,
+        characters: List[str]
+    ) -> str:
+        """Build the scene-specific part of the dialogue prompt."""
+        return f"""
+SCENE CONTEXT:
+{json.dumps(scene, indent=2)}
+
+CHARACTERS IN SCENE: {", ".join(characters)}
 """
     
     def _validate_dialogue_consistency(
@@ -389,18 +441,9 @@ Make it funny, natural, and true to the characters!
         Returns:
             Consistency score (0.0-1.0)
         """
-        if not dialogue_lines:
-            return 0.0
-        
-        # For now, return high confidence if we have voice profiles
-        has_profiles = sum(
-            1 for char in characters if char in self.voice_profiles
+        return score_dialogue_consistency(
+            dialogue_lines, characters, self.voice_profiles
         )
-        
-        if len(characters) == 0:
-            return 0.5
-        
-        return min(1.0, 0.5 + (has_profiles / len(characters)) * 0.5)
     
     def _validate_voice_consistency(
         self,
@@ -8,8 +8,12 @@ alternative punchline generation, and callback detection to optimize
 the comedic effectiveness of generated scripts.
 """
 
+import asyncio
+import heapq
 import json
 import logging
+from bisect import bisect_right
+from itertools import accumulate
 from typing import List, Dict, Optional, Tuple, TYPE_CHECKING
 from src.services.creative.joke_models import (
     JokeStructure,
@@ -32,6 +36,72 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Effectiveness score boundaries
+_ALTERNATIVES_THRESHOLD = 0.7  # Below this, generate alternative punchlines
+_WEAK_THRESHOLD = 0.6  # Below this, a joke counts as weak in the summary
+_STRONG_THRESHOLD = 0.8  # At or above this, a joke counts as strong
+_CALLBACK_MIN_SCORE = 0.6  # Jokes must exceed this to seed a callback
+
+# Maximum number of callback opportunities surfaced per script
+_MAX_CALLBACK_OPPORTUNITIES = 5
+
+# Assumed scene length when no scene runtimes are available
+_DEFAULT_SCENE_SECONDS = 180.0
+
+# Invariant joke analysis prompt; only the beat fields are interpolated so
+# the static text stays byte-identical across calls (prompt-cache friendly).
+_JOKE_ANALYSIS_PROMPT_TEMPLATE = """
+You are a comedy analysis expert. Analyze this comedic beat:
+
+COMEDIC BEAT:
+Type: {type}
+Setup: {setup}
+Payoff: {payoff}
+Characters: {characters}
+Context: {context}
+
+TASK: Analyze this joke's structure and effectiveness.
+
+RESPOND IN JSON:
+{{
+  "joke_type": "wordplay|situational|physical|callback|character|misdirection|running_gag",
+  "setup": "the setup text",
+  "misdirection": "optional misdirection element",
+  "punchline": "the payoff/punchline",
+  "effectiveness_score": 0.0-1.0,
+  "improvement_suggestions": ["suggestion 1", "suggestion 2"],
+  "callback_potential": true|false
+}}
+
+SCORING CRITERIA:
+- Setup clarity: Is the setup clear and concise?
+- Misdirection: Is there effective misdirection?
+- Payoff surprise: Is the punchline unexpected but logical?
+- Character consistency: Does it fit the character?
+- Timing: Is the setup-to-payoff timing good?
+
+Score 0.8+ for excellent jokes, 0.6-0.8 for good, 0.4-0.6 for mediocre, <0.4 for weak.
+"""
+
+# Response schemas for alternative punchline generation. The terse form asks
+# only for the punchline text, which is all most callers surface.
+_VERBOSE_ALTERNATIVES_SCHEMA = """{
+  "alternatives": [
+    {
+      "punchline": "alternative punchline text",
+      "reasoning": "why this works better",
+      "estimated_effectiveness": 0.0-1.0,
+      "maintains_character": true|false
+    }
+  ]
+}"""
+
+_TERSE_ALTERNATIVES_SCHEMA = """{
+  "alternatives": [
+    {"punchline": "alternative punchline text"}
+  ]
+}"""
+
 
 class JokeOptimizer:
     """
@@ -57,18 +127,33 @@ class JokeOptimizer:
         claude_client: ClaudeClient,
         openai_client: OpenAIClient,
         database_manager: Optional["DatabaseManager"] = None,
+        verbose_alternatives: bool = True,
+        hedged_joke_count: int = 0,
     ):
         """
         Initialize JokeOptimizer.
         
+        The AI clients belong to the caller, who may share them (and their
+        pooled HTTP connections) with other generators and closes them
+        when done.
+        
         Args:
             claude_client: Primary AI client for analysis
             openai_client: Fallback AI client
             database_manager: Optional caching for joke patterns
+            verbose_alternatives: Request reasoning, estimated effectiveness
+                and character fit for each alternative punchline. When False
+                only the punchline text is requested, saving output tokens.
+            hedged_joke_count: Number of leading jokes whose analysis is sent
+                to Claude and GPT-4 concurrently, taking the first success.
+                Cuts tail latency for latency-critical previews at the cost
+                of duplicate requests; the rest use sequential fallback.
         """
         self.claude_client = claude_client
         self.openai_client = openai_client
         self.db_manager = database_manager
+        self.verbose_alternatives = verbose_alternatives
+        self.hedged_joke_count = hedged_joke_count
         
         logger.info("JokeOptimizer initialized")
     
@@ -107,30 +192,36 @@ class JokeOptimizer:
             
             logger.info(f"Analyzed {len(analyzed_jokes)} jokes")
             
+            # Classify jokes by score once: weak jokes plus summary stats
+            weak_jokes, score_stats = self._classify_jokes(analyzed_jokes)
+            
             # Generate alternatives for weak jokes
-            weak_jokes = [j for j in analyzed_jokes if j.effectiveness_score < 0.7]
             alternative_punchlines = await self._generate_alternatives_for_jokes(
                 weak_jokes, voice_profiles
             )
             
             logger.info(f"Generated {len(alternative_punchlines)} alternatives")
             
+            # Shared views reused by the callback and timing passes
+            sorted_jokes = sorted(analyzed_jokes, key=lambda j: j.timing_position)
+            scene_starts = self._scene_start_times(scene_dialogues)
+            
             # Detect callback opportunities
             callback_opportunities = self._detect_callback_opportunities(
-                analyzed_jokes, scene_dialogues
+                analyzed_jokes, scene_dialogues, scene_starts=scene_starts
             )
             
             logger.info(f"Found {len(callback_opportunities)} callback opportunities")
             
             # Analyze timing and distribution
             timing_analysis = self._analyze_comedy_timing(
-                analyzed_jokes, scene_dialogues
+                analyzed_jokes,
+                scene_dialogues,
+                sorted_jokes=sorted_jokes,
+                scene_starts=scene_starts,
             )
             
-            # Calculate overall effectiveness
-            overall_effectiveness = self._calculate_overall_effectiveness(
-                analyzed_jokes
-            )
+            overall_effectiveness = score_stats[0]
             
             # Generate optimization summary
             optimization_summary = self._generate_optimization_summary(
@@ -138,6 +229,7 @@ class JokeOptimizer:
                 alternative_punchlines,
                 callback_opportunities,
                 timing_analysis,
+                score_stats=score_stats,
             )
             
             result = OptimizedScriptComedy(
@@ -159,7 +251,11 @@ class JokeOptimizer:
             return result
             
         except Exception as e:
-            logger.error(f"Comedy optimization failed: {e}", exc_info=True)
+            # Only pay for traceback formatting when debugging
+            logger.error(
+                "Comedy optimization failed: %s", e,
+                exc_info=logger.isEnabledFor(logging.DEBUG),
+            )
             # Return minimal result on failure
             return OptimizedScriptComedy(
                 script_id=script_id,
@@ -196,11 +292,12 @@ class JokeOptimizer:
         for idx, beat in enumerate(comedic_beats):
             try:
                 joke = await self._analyze_joke_structure(
-                    beat, scene_dialogues, idx
+                    beat, scene_dialogues, idx,
+                    hedge=idx < self.hedged_joke_count,
                 )
                 analyzed_jokes.append(joke)
             except Exception as e:
-                logger.warning(f"Failed to analyze joke {idx}: {e}")
+                logger.warning("Failed to analyze joke %d: %s", idx, e)
                 continue
         
         return analyzed_jokes
@@ -210,6 +307,7 @@ class JokeOptimizer:
         comedic_beat: Dict,
         scene_dialogues: List[SceneDialogue],
         joke_index: int,
+        hedge: bool = False,
     ) -> JokeStructure:
         """
         Analyze the structure of a single joke.
@@ -220,32 +318,25 @@ class JokeOptimizer:
             comedic_beat: Metadata about the comedic moment
             scene_dialogues: Context from scene dialogues
             joke_index: Index of this joke in the script
+            hedge: Query Claude and GPT-4 concurrently instead of falling
+                back sequentially
         
         Returns:
             Analyzed joke structure with effectiveness score
         """
         prompt = self._build_joke_analysis_prompt(comedic_beat, scene_dialogues)
         
-        try:
-            # Try Claude first
-            response = await self.claude_client.generate(
-                prompt=prompt,
-                max_tokens=1000,
-                temperature=0.3,  # Lower temperature for analytical task
-            )
-            analysis = json.loads(response)
-            
-        except Exception as e:
-            logger.warning(f"Claude analysis failed: {e}, trying GPT-4")
+        if hedge:
             try:
-                response = await self.openai_client.generate(
-                    prompt=prompt,
-                    max_tokens=1000,
-                    temperature=0.3,
+                analysis = await self._hedged_joke_analysis(prompt)
+            except Exception as e:
+                logger.error("Hedged joke analysis failed: %s", e)
+                return self._create_fallback_joke_structure(
+                    comedic_beat, joke_index
                 )
-                analysis = json.loads(response)
-            except Exception as e2:
-                logger.error(f"GPT-4 analysis also failed: {e2}")
+        else:
+            analysis = await self._sequential_joke_analysis(prompt)
+            if analysis is None:
                 # Fallback to basic structure
                 return self._create_fallback_joke_structure(
                     comedic_beat, joke_index
@@ -267,44 +358,78 @@ class JokeOptimizer:
             callback_potential=analysis.get("callback_potential", False),
         )
     
+    async def _request_joke_analysis(
+        self,
+        client,
+        prompt: str,
+    ) -> Dict:
+        """Request and parse a joke analysis from one AI client."""
+        response = await client.generate(
+            prompt=prompt,
+            max_tokens=1000,
+            temperature=0.3,  # Lower temperature for analytical task
+        )
+        return json.loads(response)
+    
+    async def _hedged_joke_analysis(self, prompt: str) -> Dict:
+        """
+        Race Claude and GPT-4 on the same prompt.
+        
+        Returns the first successful analysis and cancels the other request.
+        Raises RuntimeError, chained to the last error, if both fail.
+        """
+        tasks = [
+            asyncio.create_task(self._request_joke_analysis(client, prompt))
+            for client in (self.claude_client, self.openai_client)
+        ]
+        pending = set(tasks)
+        last_error: Optional[BaseException] = None
+        
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    last_error = task.exception()
+            raise RuntimeError(
+                "no provider returned an analysis"
+            ) from last_error
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+    
+    async def _sequential_joke_analysis(self, prompt: str) -> Optional[Dict]:
+        """Try Claude, then GPT-4; returns None if both fail."""
+        try:
+            # Try Claude first
+            return await self._request_joke_analysis(self.claude_client, prompt)
+        except Exception as e:
+            logger.warning("Claude analysis failed: %s, trying GPT-4", e)
+        
+        try:
+            return await self._request_joke_analysis(self.openai_client, prompt)
+        except Exception as e2:
+            logger.error("GPT-4 analysis also failed: %s", e2)
+            return None
+    
     def _build_joke_analysis_prompt(
         self,
         comedic_beat: Dict,
         scene_dialogues: List[SceneDialogue],
     ) -> str:
         """Build prompt for AI joke analysis."""
-        return f"""
-You are a comedy analysis expert. Analyze this comedic beat:
-
-COMEDIC BEAT:
-Type: {comedic_beat.get('type', 'unknown')}
-Setup: {comedic_beat.get('setup', 'N/A')}
-Payoff: {comedic_beat.get('payoff', 'N/A')}
-Characters: {', '.join(comedic_beat.get('characters', []))}
-Context: {comedic_beat.get('context', 'N/A')}
-
-TASK: Analyze this joke's structure and effectiveness.
-
-RESPOND IN JSON:
-{{
-  "joke_type": "wordplay|situational|physical|callback|character|misdirection|running_gag",
-  "setup": "the setup text",
-  "misdirection": "optional misdirection element",
-  "punchline": "the payoff/punchline",
-  "effectiveness_score": 0.0-1.0,
-  "improvement_suggestions": ["suggestion 1", "suggestion 2"],
-  "callback_potential": true|false
-}}
-
-SCORING CRITERIA:
-- Setup clarity: Is the setup clear and concise?
-- Misdirection: Is there effective misdirection?
-- Payoff surprise: Is the punchline unexpected but logical?
-- Character consistency: Does it fit the character?
-- Timing: Is the setup-to-payoff timing good?
-
-Score 0.8+ for excellent jokes, 0.6-0.8 for good, 0.4-0.6 for mediocre, <0.4 for weak.
-"""
+        get = comedic_beat.get
+        return _JOKE_ANALYSIS_PROMPT_TEMPLATE.format(
+            type=get('type', 'unknown'),
+            setup=get('setup', 'N/A'),
+            payoff=get('payoff', 'N/A'),
+            characters=', '.join(get('characters', [])),
+            context=get('context', 'N/A'),
+        )
     
     def _create_fallback_joke_structure(
         self,
@@ -348,7 +473,7 @@ Score 0.8+ for excellent jokes, 0.6-0.8 for good, 0.4-0.6 for mediocre, <0.4 for
                 alternatives.extend(alts)
             except Exception as e:
                 logger.warning(
-                    f"Failed to generate alternatives for {joke.joke_id}: {e}"
+                    "Failed to generate alternatives for %s: %s", joke.joke_id, e
                 )
                 continue
         
@@ -358,6 +483,7 @@ Score 0.8+ for excellent jokes, 0.6-0.8 for good, 0.4-0.6 for mediocre, <0.4 for
         self,
         joke: JokeStructure,
         voice_profiles: Dict[str, CharacterVoiceProfile],
+        verbose: Optional[bool] = None,
     ) -> List[AlternativePunchline]:
         """
         Generate alternative punchlines for a specific joke.
@@ -367,10 +493,15 @@ Score 0.8+ for excellent jokes, 0.6-0.8 for good, 0.4-0.6 for mediocre, <0.4 for
         Args:
             joke: Original joke to improve
             voice_profiles: Character voices
+            verbose: Request full per-alternative metadata. Defaults to
+                the optimizer's ``verbose_alternatives`` setting.
         
         Returns:
             List of alternative punchlines (2-3)
         """
+        if verbose is None:
+            verbose = self.verbose_alternatives
+        
         # Get voice profile for main character
         main_character = joke.characters_involved[0] if joke.characters_involved else None
         voice_context = ""
@@ -402,26 +533,30 @@ TASK: Generate 2-3 alternative punchlines that:
 4. Increase comedic effectiveness
 
 RESPOND IN JSON:
-{{
-  "alternatives": [
-    {{
-      "punchline": "alternative punchline text",
-      "reasoning": "why this works better",
-      "estimated_effectiveness": 0.0-1.0,
-      "maintains_character": true|false
-    }}
-  ]
-}}
+{_VERBOSE_ALTERNATIVES_SCHEMA if verbose else _TERSE_ALTERNATIVES_SCHEMA}
 """
         
         try:
             response = await self.claude_client.generate(
                 prompt=prompt,
-                max_tokens=800,
+                max_tokens=800 if verbose else 300,
                 temperature=0.7,  # Higher temp for creative alternatives
             )
             data = json.loads(response)
             
+            if not verbose:
+                # Fields not requested from the model get neutral defaults
+                estimated = min(joke.effectiveness_score + 0.1, 1.0)
+                return [
+                    AlternativePunchline(
+                        original_joke_id=joke.joke_id,
+                        punchline=alt["punchline"],
+                        reasoning="",
+                        estimated_effectiveness=estimated,
+                    )
+                    for alt in data.get("alternatives", [])
+                ]
+            
             return [
                 AlternativePunchline(
                     original_joke_id=joke.joke_id,
@@ -434,13 +569,14 @@ RESPOND IN JSON:
             ]
             
         except Exception as e:
-            logger.error(f"Failed to generate alternatives: {e}")
+            logger.error("Failed to generate alternatives: %s", e)
             return []
     
     def _detect_callback_opportunities(
         self,
         analyzed_jokes: List[JokeStructure],
         scene_dialogues: List[SceneDialogue],
+        scene_starts: Optional[List[float]] = None,
     ) -> List[CallbackOpportunity]:
         """
         Detect opportunities for callback comedy.
@@ -451,6 +587,7 @@ RESPOND IN JSON:
         Args:
             analyzed_jokes: All analyzed jokes
             scene_dialogues: Scene context
+            scene_starts: Precomputed scene start offsets, if available
         
         Returns:
             List of callback opportunities
@@ -460,38 +597,64 @@ RESPOND IN JSON:
         # Find jokes with callback potential
         callback_sources = [
             joke for joke in analyzed_jokes
-            if joke.callback_potential and joke.effectiveness_score > 0.6
+            if joke.callback_potential and joke.effectiveness_score > _CALLBACK_MIN_SCORE
         ]
         
+        if scene_starts is None:
+            scene_starts = self._scene_start_times(scene_dialogues)
+        
+        # Characters speaking in each scene, built once for all source jokes
+        scene_characters = [
+            frozenset(line.character for line in scene.dialogue_lines)
+            for scene in scene_dialogues
+        ]
+        
+        # Bounded max-heap of the best candidates seen so far, keyed on
+        # (risk, discovery order) so ties keep scan order. Only survivors
+        # are materialized as CallbackOpportunity objects.
+        top: List[Tuple[float, int, JokeStructure, int]] = []
+        counter = 0
+        
         for source_joke in callback_sources:
             # Look for natural callback points later in the script
             source_position = source_joke.timing_position
+            source_characters = frozenset(source_joke.characters_involved)
             
-            for target_idx, scene in enumerate(scene_dialogues):
-                # Only look for callbacks in later scenes
-                if target_idx * 180 <= source_position:  # Assume 3min scenes
-                    continue
-                
+            # Only look for callbacks in scenes starting after the joke
+            first_target = bisect_right(scene_starts, source_position)
+            
+            for target_idx in range(first_target, len(scene_dialogues)):
                 # Simple heuristic: suggest callback if characters overlap
-                scene_characters = {line.character for line in scene.dialogue_lines}
-                if any(char in scene_characters for char in source_joke.characters_involved):
-                    opportunity = CallbackOpportunity(
-                        source_joke_id=source_joke.joke_id,
-                        target_scene=f"scene_{target_idx:02d}",
-                        target_timing=target_idx * 180.0,  # Rough estimate
-                        callback_suggestion=f"Reference '{source_joke.punchline}' in context of current situation",
-                        comedic_payoff="Rewards attentive viewers, creates cohesion",
-                        risk_level=0.3 if target_idx <= 3 else 0.6,  # Early callbacks safer
-                    )
-                    opportunities.append(opportunity)
+                if scene_characters[target_idx] & source_characters:
+                    risk_level = 0.3 if target_idx <= 3 else 0.6  # Early callbacks safer
+                    entry = (-risk_level, -counter, source_joke, target_idx)
+                    counter += 1
+                    if len(top) < _MAX_CALLBACK_OPPORTUNITIES:
+                        heapq.heappush(top, entry)
+                    elif entry[:2] > top[0][:2]:
+                        heapq.heapreplace(top, entry)
+        
+        # Limit to top 3-5 most promising callbacks, lowest risk first
+        for neg_risk, _, source_joke, target_idx in sorted(top, reverse=True):
+            opportunities.append(
+                CallbackOpportunity(
+                    source_joke_id=source_joke.joke_id,
+                    target_scene=f"scene_{target_idx:02d}",
+                    target_timing=scene_starts[target_idx],
+                    callback_suggestion=f"Reference '{source_joke.punchline}' in context of current situation",
+                    comedic_payoff="Rewards attentive viewers, creates cohesion",
+                    risk_level=-neg_risk,
+                )
+            )
         
-        # Limit to top 3-5 most promising callbacks
-        return opportunities[:5]
+        return opportunities
     
     def _analyze_comedy_timing(
         self,
         analyzed_jokes: List[JokeStructure],
         scene_dialogues: List[SceneDialogue],
+        sorted_jokes: Optional[List[JokeStructure]] = None,
+        scene_starts: Optional[List[float]] = None,
     ) -> ComedyTimingAnalysis:
         """
         Analyze comedy distribution and pacing.
@@ -502,6 +665,8 @@ RESPOND IN JSON:
         Args:
             analyzed_jokes: All jokes in the script
             scene_dialogues: Scene context for runtime estimation
+            sorted_jokes: Jokes already ordered by timing position, if available
+            scene_starts: Precomputed scene start offsets, if available
         
         Returns:
             Timing analysis with pacing recommendations
@@ -514,7 +679,10 @@ RESPOND IN JSON:
             )
         
         # Sort jokes by timing
-        sorted_jokes = sorted(analyzed_jokes, key=lambda j: j.timing_position)
+        if sorted_jokes is None:
+            sorted_jokes = sorted(analyzed_jokes, key=lambda j: j.timing_position)
+        if scene_starts is None:
+            scene_starts = self._scene_start_times(scene_dialogues)
         
         # Calculate spacing between jokes
         spacings = []
@@ -536,7 +704,9 @@ RESPOND IN JSON:
         clusters = []
         for i, spacing in enumerate(spacings):
             if spacing < 20:
-                scene_idx = int(sorted_jokes[i].timing_position / 180)
+                scene_idx = self._scene_index_at(
+                    sorted_jokes[i].timing_position, scene_starts
+                )
                 scene_id = f"scene_{scene_idx:02d}"
                 if scene_id not in clusters:
                     clusters.append(scene_id)
@@ -545,7 +715,9 @@ RESPOND IN JSON:
         dead_zones = []
         for i, spacing in enumerate(spacings):
             if spacing > 120:
-                scene_idx = int(sorted_jokes[i + 1].timing_position / 180)
+                scene_idx = self._scene_index_at(
+                    sorted_jokes[i + 1].timing_position, scene_starts
+                )
                 scene_id = f"scene_{scene_idx:02d}"
                 if scene_id not in dead_zones:
                     dead_zones.append(scene_id)
@@ -565,6 +737,26 @@ RESPOND IN JSON:
             pacing_score=pacing_score,
         )
     
+    def _scene_start_times(
+        self,
+        scene_dialogues: List[SceneDialogue],
+    ) -> List[float]:
+        """Start offset in seconds of each scene, from their runtime estimates."""
+        durations = [
+            float(scene.total_runtime_estimate) for scene in scene_dialogues[:-1]
+        ]
+        return list(accumulate(durations, initial=0.0)) if scene_dialogues else []
+    
+    def _scene_index_at(
+        self,
+        position: float,
+        scene_starts: List[float],
+    ) -> int:
+        """Map a script position in seconds to the scene containing it."""
+        if not scene_starts:
+            return int(position / _DEFAULT_SCENE_SECONDS)
+        return max(bisect_right(scene_starts, position) - 1, 0)
+    
     def _calculate_pacing_score(
         self,
         average_spacing: float,
@@ -588,11 +780,43 @@ RESPOND IN JSON:
         analyzed_jokes: List[JokeStructure],
     ) -> float:
         """Calculate average effectiveness across all jokes."""
-        if not analyzed_jokes:
-            return 0.0
+        return self._score_stats(analyzed_jokes)[0]
+    
+    def _score_stats(
+        self,
+        analyzed_jokes: List[JokeStructure],
+    ) -> Tuple[float, int, int]:
+        """
+        Compute effectiveness statistics in a single pass.
         
-        total_score = sum(joke.effectiveness_score for joke in analyzed_jokes)
-        return total_score / len(analyzed_jokes)
+        Returns:
+            Tuple of (mean effectiveness, weak joke count, strong joke count)
+        """
+        return self._classify_jokes(analyzed_jokes)[1]
+    
+    def _classify_jokes(
+        self,
+        analyzed_jokes: List[JokeStructure],
+    ) -> Tuple[List[JokeStructure], Tuple[float, int, int]]:
+        """
+        Classify jokes by effectiveness score in a single pass.
+        
+        Returns:
+            Jokes needing alternative punchlines, and the tuple of
+            (mean effectiveness, weak joke count, strong joke count)
+        """
+        needs_alternatives = []
+        total, weak, strong = 0.0, 0, 0
+        for joke in analyzed_jokes:
+            score = joke.effectiveness_score
+            total += score
+            weak += score < _WEAK_THRESHOLD
+            strong += score >= _STRONG_THRESHOLD
+            if score < _ALTERNATIVES_THRESHOLD:
+                needs_alternatives.append(joke)
+        
+        mean = total / len(analyzed_jokes) if analyzed_jokes else 0.0
+        return needs_alternatives, (mean, weak, strong)
     
     def _generate_optimization_summary(
         self,
@@ -600,10 +824,12 @@ RESPOND IN JSON:
         alternative_punchlines: List[AlternativePunchline],
         callback_opportunities: List[CallbackOpportunity],
         timing_analysis: ComedyTimingAnalysis,
+        score_stats: Optional[Tuple[float, int, int]] = None,
     ) -> str:
         """Generate human-readable optimization summary."""
-        weak_count = sum(1 for j in analyzed_jokes if j.effectiveness_score < 0.6)
-        strong_count = sum(1 for j in analyzed_jokes if j.effectiveness_score >= 0.8)
+        if score_stats is None:
+            score_stats = self._score_stats(analyzed_jokes)
+        _, weak_count, strong_count = score_stats
         
         summary_parts = [
             f"Analyzed {len(analyzed_jokes)} jokes.",
@@ -11,7 +11,6 @@ from typing import Dict, List, Optional
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime
-import json
 
 from src.services.creative.claude_client import ClaudeClient
 from src.services.creative.openai_client import OpenAIClient as GPTClient
@@ -320,11 +319,8 @@ CRITICAL:
                 max_tokens=3000
             )
             
-            # Parse JSON
-            response_json = json.loads(response_text)
-            
-            # Validate
-            validated = self.validator.validate_narrative_analysis(response_json)
+            # Parse and validate in a single pass
+            validated = self.validator.validate_narrative_analysis(response_text)
             
             if not validated:
                 logger.warning("Claude response failed validation")
@@ -333,9 +329,6 @@ CRITICAL:
             # Convert to NarrativeAnalysis
             return self._build_narrative_analysis(validated, "claude-sonnet-4")
             
-        except json.JSONDecodeError as e:
-            logger.error(f"Claude returned invalid JSON: {e}")
-            return None
         except Exception as e:
             logger.error(f"Claude analysis error: {e}")
             return None
@@ -358,8 +351,7 @@ CRITICAL:
                 max_tokens=3000
             )
             
-            response_json = json.loads(response_text)
-            validated = self.validator.validate_narrative_analysis(response_json)
+            validated = self.validator.validate_narrative_analysis(response_text)
             
             if not validated:
                 logger.warning("GPT-4 response failed validation")
@@ -367,9 +359,6 @@ CRITICAL:
             
             return self._build_narrative_analysis(validated, "gpt-4-turbo")
             
-        except json.JSONDecodeError as e:
-            logger.error(f"GPT-4 returned invalid JSON: {e}")
-            return None
         except Exception as e:
             logger.error(f"GPT-4 analysis error: {e}")
             return None
@@ -385,7 +374,7 @@ CRITICAL:
         plot_structure = validated_response.plot_structure
         episode_structure = EpisodeStructure(
             total_runtime=plot_structure.typical_runtime or 30,
-            act_count=len(plot_structure.act_breakdown),
+            act_count=len(plot_structure.act_breakdown.acts()),
             act_lengths=[10, 12, 8],  # Default for 3-act
             commercial_breaks=2,
             opening_length=30,
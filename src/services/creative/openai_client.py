@@ -10,10 +10,13 @@ from typing import Dict, List, Optional, Any
 import asyncio
 import logging
 from openai import AsyncOpenAI
+import httpx
 import hashlib
 import json
 
 from .claude_client import AIResponse
+from .rate_limiter import TokenBucketRateLimiter, estimate_request_tokens
+from src.services.monitoring.performance_monitor import get_performance_monitor
 
 logger = logging.getLogger(__name__)
 
@@ -33,7 +36,9 @@ class OpenAIClient:
         self,
         api_key: str,
         cache_client: Optional[Any] = None,
-        cache_ttl: int = 604800
+        cache_ttl: int = 604800,
+        http_client: Optional[httpx.AsyncClient] = None,
+        rate_limiter: Optional[TokenBucketRateLimiter] = None
     ):
         """
         Initialize OpenAI client.
@@ -42,14 +47,20 @@ class OpenAIClient:
             api_key: OpenAI API key
             cache_client: Optional Redis client
             cache_ttl: Cache TTL in seconds
+            http_client: Optional shared connection pool reused across
+                calls. An injected pool stays open on close().
+            rate_limiter: Optional RPM/TPM limiter awaited before every request
         """
-        self.client = AsyncOpenAI(api_key=api_key)
+        self.client = AsyncOpenAI(api_key=api_key, http_client=http_client)
+        self._owns_http_client = http_client is None
         self.cache_client = cache_client
         self.cache_ttl = cache_ttl
+        self.rate_limiter = rate_limiter
         
         self.total_tokens_used = 0
         self.total_requests = 0
         self.cache_hits = 0
+        self.prompt_cache_read_tokens = 0
     
     async def generate(
         self,
@@ -58,11 +69,21 @@ class OpenAIClient:
         max_tokens: int = MAX_TOKENS,
         temperature: float = DEFAULT_TEMPERATURE,
         json_mode: bool = False,
-        use_cache: bool = True
+        use_cache: bool = True,
+        cached_prefix: Optional[str] = None
     ) -> AIResponse:
-        """Generate text using GPT-4."""
+        """
+        Generate text using GPT-4.
+        
+        cached_prefix is shared context sent ahead of the prompt. OpenAI
+        caches matching request prefixes automatically, so keeping it
+        byte-identical across calls is all that is needed.
+        """
         logger.debug(f"Generating with GPT-4 (prompt length: {len(prompt)})")
         
+        if cached_prefix:
+            prompt = f"{cached_prefix}\n\n{prompt}"
+        
         # Check cache
         if use_cache:
             cached = await self._get_from_cache(
@@ -91,13 +112,27 @@ class OpenAIClient:
                 kwargs['response_format'] = {"type": "json_object"}
                 prompt += "\n\nRespond with valid JSON."
             
+            if self.rate_limiter:
+                await self.rate_limiter.acquire(
+                    estimate_request_tokens(
+                        prompt + (system_prompt or ""), max_tokens
+                    )
+                )
+            
             response = await self.client.chat.completions.create(**kwargs)
             
             content = response.choices[0].message.content
             tokens_used = response.usage.total_tokens
+            details = getattr(response.usage, 'prompt_tokens_details', None)
+            cache_read_tokens = getattr(details, 'cached_tokens', 0) or 0
             
             self.total_tokens_used += tokens_used
             self.total_requests += 1
+            self.prompt_cache_read_tokens += cache_read_tokens
+            get_performance_monitor().record_api_call(
+                tokens_used=tokens_used,
+                cache_read_tokens=cache_read_tokens
+            )
             
             ai_response = AIResponse(
                 content=content,
@@ -123,7 +158,8 @@ class OpenAIClient:
         prompt: str,
         system_prompt: Optional[str] = None,
         max_tokens: int = MAX_TOKENS,
-        temperature: float = DEFAULT_TEMPERATURE
+        temperature: float = DEFAULT_TEMPERATURE,
+        cached_prefix: Optional[str] = None
     ) -> Dict:
         """Generate JSON response using GPT-4."""
         response = await self.generate(
@@ -131,7 +167,8 @@ class OpenAIClient:
             system_prompt=system_prompt,
             max_tokens=max_tokens,
             temperature=temperature,
-            json_mode=True
+            json_mode=True,
+            cached_prefix=cached_prefix
         )
         
         try:
@@ -184,12 +221,18 @@ class OpenAIClient:
         except Exception as e:
             logger.warning(f"Cache save failed: {e}")
     
+    async def close(self):
+        """Close the pooled HTTP connections, unless they were injected."""
+        if self._owns_http_client:
+            await self.client.close()
+    
     def get_usage_stats(self) -> Dict:
         """Get usage statistics."""
         return {
             'total_requests': self.total_requests,
             'total_tokens': self.total_tokens_used,
             'cache_hits': self.cache_hits,
+            'prompt_cache_read_tokens': self.prompt_cache_read_tokens,
             'cache_hit_rate': (
                 self.cache_hits / self.total_requests
                 if self.total_requests > 0
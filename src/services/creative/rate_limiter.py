@@ -0,0 +1,127 @@
+"""
+Rate Limiter - Token-bucket throttling for LLM API calls.
+
+Tracks both request and token budgets (RPM/TPM) so callers can run as many
+requests in flight as the provider's limits allow, instead of a fixed
+concurrency cap that either wastes capacity or triggers 429 retry storms.
+
+Copyright (c) 2025. All Rights Reserved. Patent Pending.
+"""
+
+from typing import Optional
+import asyncio
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+# Rough English average; good enough for budgeting, not for billing
+CHARS_PER_TOKEN = 4
+
+
+def estimate_request_tokens(prompt: str, max_tokens: int) -> int:
+    """
+    Estimate the tokens a request counts against a TPM limit.
+
+    Providers reserve the full max_tokens for the completion up front, so
+    the estimate is the prompt size plus the completion budget.
+    """
+    return len(prompt) // CHARS_PER_TOKEN + max_tokens
+
+
+class TokenBucketRateLimiter:
+    """
+    Proactive request + token bucket shared by every client call.
+
+    Both buckets start full and refill continuously at their per-minute
+    rate. acquire() waits until one request slot and the requested tokens
+    are available, then consumes them. Waiters are served in arrival order.
+
+    Example:
+        >>> limiter = TokenBucketRateLimiter(
+        ...     requests_per_minute=50, tokens_per_minute=40000
+        ... )
+        >>> await limiter.acquire(estimate_request_tokens(prompt, 4000))
+        >>> response = await client.messages.create(...)
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: float,
+        tokens_per_minute: Optional[float] = None
+    ):
+        """
+        Initialize rate limiter.
+
+        Args:
+            requests_per_minute: Request budget (RPM)
+            tokens_per_minute: Token budget (TPM); None disables token limiting
+        """
+        if requests_per_minute <= 0:
+            raise ValueError("requests_per_minute must be positive")
+        if tokens_per_minute is not None and tokens_per_minute <= 0:
+            raise ValueError("tokens_per_minute must be positive")
+
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+
+        # The bucket must hold at least one whole request, or an RPM below
+        # 1 could never admit one
+        self._request_capacity = max(float(requests_per_minute), 1.0)
+        self._available_requests = self._request_capacity
+        self._available_tokens = float(tokens_per_minute or 0)
+        self._last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        """Add capacity for the time elapsed since the last refill."""
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+
+        self._available_requests = min(
+            self._request_capacity,
+            self._available_requests + elapsed * self.requests_per_minute / 60
+        )
+        if self.tokens_per_minute is not None:
+            self._available_tokens = min(
+                self.tokens_per_minute,
+                self._available_tokens + elapsed * self.tokens_per_minute / 60
+            )
+
+    async def acquire(self, tokens: int = 0) -> None:
+        """
+        Wait until one request and the given tokens fit the budget.
+
+        Args:
+            tokens: Estimated tokens for the request (see
+                estimate_request_tokens). Clamped to the TPM limit so an
+                oversized request waits for a full bucket instead of forever.
+        """
+        # Float, as a fractional TPM can clamp below a whole token
+        cost: float = (
+            0.0 if self.tokens_per_minute is None
+            else min(tokens, self.tokens_per_minute)
+        )
+
+        async with self._lock:
+            while True:
+                self._refill()
+
+                if (
+                    self._available_requests >= 1 and
+                    self._available_tokens >= cost
+                ):
+                    self._available_requests -= 1
+                    self._available_tokens -= cost
+                    return
+
+                # Sleep exactly until the scarcer budget has refilled
+                wait = (1 - self._available_requests) * 60 / self.requests_per_minute
+                if cost and self.tokens_per_minute is not None:
+                    wait = max(
+                        wait,
+                        (cost - self._available_tokens) * 60 / self.tokens_per_minute
+                    )
+                logger.debug(f"Rate limit reached, waiting {wait:.2f}s")
+                await asyncio.sleep(max(wait, 0.0))
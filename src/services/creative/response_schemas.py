@@ -0,0 +1,189 @@
+"""
+AI Response Schemas - Pydantic models for structured AI outputs.
+
+Defines the expected shape of Claude and GPT-4 JSON responses for
+character analysis, narrative analysis, and transformations. Validation
+entry points live in response_validators.
+
+Copyright (c) 2025. All Rights Reserved. Patent Pending.
+"""
+
+from typing import Any, List, Dict, Optional
+from pydantic import BaseModel, ConfigDict, Field
+
+
+# Shared defaults for optional list fields. Pydantic copies the FieldInfo
+# into each model, so one instance can back any number of fields. Typed Any,
+# as Field() is, so they can default fields of any list type.
+_LIST: Any = Field(default_factory=list)
+_LIST_MAX3: Any = Field(default_factory=list, max_length=3)
+_LIST_MAX5: Any = Field(default_factory=list, max_length=5)
+_LIST_MAX10: Any = Field(default_factory=list, max_length=10)
+
+
+class _ResponseModel(BaseModel):
+    """Base for AI response schemas: drop unknown keys, trust defaults, no coercion."""
+    model_config = ConfigDict(extra='ignore', validate_default=False, strict=True)
+
+
+# Character Analysis Schemas
+
+class CharacterTrait(_ResponseModel):
+    """Individual character trait."""
+    trait: str = Field(..., min_length=1, max_length=100)
+    description: str = Field(..., min_length=10, max_length=500)
+    examples: List[str] = _LIST_MAX5
+
+
+class CharacterRelationship(_ResponseModel):
+    """Relationship between two characters."""
+    character_name: str
+    relationship_type: str  # e.g., "spouse", "friend", "rival"
+    description: str
+    key_moments: List[str] = _LIST_MAX3
+
+
+class CharacterAnalysisResponse(_ResponseModel):
+    """Complete character analysis from AI."""
+    character_name: str = Field(..., min_length=1)
+    core_traits: List[CharacterTrait] = Field(..., min_length=3, max_length=10)
+    speech_patterns: List[str] = _LIST_MAX10
+    catchphrases: List[str] = _LIST_MAX5
+    relationships: List[CharacterRelationship] = _LIST
+    character_arc: Optional[str] = None
+    comedic_elements: List[str] = _LIST_MAX10
+    modern_parallels: List[str] = _LIST_MAX5
+
+
+# Narrative Analysis Schemas
+
+class ActBreakdown(_ResponseModel):
+    """Per-act summary; common act names are fixed fields, others kept as extras."""
+    model_config = ConfigDict(extra='allow')
+    __pydantic_extra__: Dict[str, str]
+    
+    teaser: Optional[str] = None
+    act_1: Optional[str] = None
+    act_2: Optional[str] = None
+    act_3: Optional[str] = None
+    tag: Optional[str] = None
+    
+    def acts(self) -> Dict[str, str]:
+        """Return the populated acts in order, including any extra ones."""
+        acts = {
+            name: summary for name, summary in (
+                ('teaser', self.teaser),
+                ('act_1', self.act_1),
+                ('act_2', self.act_2),
+                ('act_3', self.act_3),
+                ('tag', self.tag),
+            )
+            if summary is not None
+        }
+        acts.update(self.__pydantic_extra__ or {})
+        return acts
+
+
+class PlotStructure(_ResponseModel):
+    """Narrative plot structure."""
+    structure_type: str  # "three-act", "episodic", "serialized"
+    act_breakdown: ActBreakdown
+    typical_runtime: Optional[int] = None  # minutes
+
+
+class RecurringPlotDevice(_ResponseModel):
+    """Recurring narrative device."""
+    device_name: str
+    description: str
+    frequency: str  # "every episode", "occasional", "rare"
+    examples: List[str] = _LIST_MAX3
+
+
+class NarrativeAnalysisResponse(_ResponseModel):
+    """Complete narrative analysis from AI."""
+    show_title: str
+    plot_structure: PlotStructure
+    recurring_devices: List[RecurringPlotDevice] = _LIST
+    opening_convention: Optional[str] = None
+    closing_convention: Optional[str] = None
+    b_plot_patterns: List[str] = _LIST
+    pacing_notes: Optional[str] = None
+    unique_signatures: List[str] = _LIST_MAX5
+
+
+# Transformation Rules Schemas
+
+class SettingTransformation(_ResponseModel):
+    """Transformation of setting/time period."""
+    original_setting: str
+    modern_equivalent: str
+    justification: str
+    cultural_references: List[str] = _LIST_MAX5
+
+
+class CharacterTransformation(_ResponseModel):
+    """How a character transforms to modern context."""
+    original_character: str
+    original_archetype: str
+    modern_archetype: str
+    occupation_update: Optional[str] = None
+    motivation_update: str
+    technology_integration: List[str] = _LIST
+
+
+class HumorExample(_ResponseModel):
+    """Single original-to-modern joke mapping."""
+    original: str
+    modern: str
+
+
+class ConflictModernization(_ResponseModel):
+    """Single original-to-modern conflict mapping."""
+    original: str
+    modern: str
+
+
+class HumorTransformation(_ResponseModel):
+    """Transformation of humor styles."""
+    original_humor_type: str
+    modern_humor_type: str
+    example_transformations: List[HumorExample] = _LIST_MAX5
+
+
+class TransformationRulesResponse(_ResponseModel):
+    """Complete transformation ruleset from AI."""
+    show_title: str
+    setting_transformation: SettingTransformation
+    character_transformations: List[CharacterTransformation] = Field(
+        ...,
+        min_length=1
+    )
+    humor_transformation: HumorTransformation
+    cultural_updates: List[str] = _LIST
+    technology_opportunities: List[str] = _LIST
+    conflict_modernization: List[ConflictModernization] = _LIST
+
+
+# Pydantic v2 compiles each model's SchemaValidator/SchemaSerializer when the
+# class is created. Models with unresolved forward references (or defer_build)
+# would instead compile lazily on the first validation call; finish any such
+# build here so the cost is paid at import rather than on the request path.
+_RESPONSE_MODELS = (
+    CharacterTrait,
+    CharacterRelationship,
+    CharacterAnalysisResponse,
+    ActBreakdown,
+    PlotStructure,
+    RecurringPlotDevice,
+    NarrativeAnalysisResponse,
+    SettingTransformation,
+    CharacterTransformation,
+    HumorExample,
+    HumorTransformation,
+    ConflictModernization,
+    TransformationRulesResponse,
+)
+
+for _model in _RESPONSE_MODELS:
+    if not _model.__pydantic_complete__:
+        _model.model_rebuild()
@@ -1,237 +1,436 @@
 """
-AI Response Validators - Pydantic schemas for structured AI outputs.
+AI Response Validators - Validation entry points for structured AI outputs.
 
 Validates that Claude and GPT-4 return properly structured JSON responses
-for character analysis, narrative analysis, and transformations.
+for character analysis, narrative analysis, and transformations, against
+the schemas in response_schemas.
 
 Copyright (c) 2025. All Rights Reserved. Patent Pending.
 """
 
-from typing import List, Dict, Optional
-from pydantic import BaseModel, Field, validator, field_validator
+from typing import (
+    Any, Callable, List, Dict, Optional, Tuple, Type, TypeVar, Union, get_args, get_origin
+)
+from collections import OrderedDict
+from pydantic import BaseModel, TypeAdapter, ValidationError
+import hashlib
+import json
 import logging
 
+# Schemas are defined in a separate, always-interpreted module so this one
+# can be compiled (see setup.py); they are re-exported here unchanged.
+from src.services.creative.response_schemas import (  # noqa: F401
+    CharacterTrait,
+    CharacterRelationship,
+    CharacterAnalysisResponse,
+    ActBreakdown,
+    PlotStructure,
+    RecurringPlotDevice,
+    NarrativeAnalysisResponse,
+    SettingTransformation,
+    CharacterTransformation,
+    HumorExample,
+    HumorTransformation,
+    ConflictModernization,
+    TransformationRulesResponse,
+    _RESPONSE_MODELS,
+)
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import fastjsonschema  # type: ignore[import-untyped]
+    FASTJSONSCHEMA_AVAILABLE = True
+except ImportError:
+    FASTJSONSCHEMA_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+_ModelT = TypeVar('_ModelT', bound=BaseModel)
 
-# Character Analysis Schemas
+# Bound once: the validate_* paths run for every AI response
+_log_info, _log_error, _log_debug = logger.info, logger.error, logger.debug
 
-class CharacterTrait(BaseModel):
-    """Individual character trait."""
-    trait: str = Field(..., min_length=1, max_length=100)
-    description: str = Field(..., min_length=10, max_length=500)
-    examples: List[str] = Field(default_factory=list, max_length=5)
 
+def _nested_model_fields(
+    model_cls: Type[BaseModel]
+) -> Dict[str, Tuple[Type[BaseModel], bool]]:
+    """Map each model-typed field to (nested model class, is_list)."""
+    nested = {}
+    for name, field in model_cls.model_fields.items():
+        annotation = field.annotation
+        if get_origin(annotation) is Union:
+            annotation = next(
+                arg for arg in get_args(annotation) if arg is not type(None)
+            )
+        is_list = get_origin(annotation) is list
+        inner = get_args(annotation)[0] if is_list else annotation
+        if isinstance(inner, type) and issubclass(inner, BaseModel):
+            nested[name] = (inner, is_list)
+    return nested
 
-class CharacterRelationship(BaseModel):
-    """Relationship between two characters."""
-    character_name: str
-    relationship_type: str  # e.g., "spouse", "friend", "rival"
-    description: str
-    key_moments: List[str] = Field(default_factory=list, max_length=3)
 
+_NESTED_FIELDS: Dict[Type[BaseModel], Dict[str, Tuple[Type[BaseModel], bool]]] = {
+    model: _nested_model_fields(model) for model in _RESPONSE_MODELS
+}
 
-class CharacterAnalysisResponse(BaseModel):
-    """Complete character analysis from AI."""
-    character_name: str = Field(..., min_length=1)
-    core_traits: List[CharacterTrait] = Field(..., min_length=3, max_length=10)
-    speech_patterns: List[str] = Field(default_factory=list, max_length=10)
-    catchphrases: List[str] = Field(default_factory=list, max_length=5)
-    relationships: List[CharacterRelationship] = Field(
-        default_factory=list
-    )
-    character_arc: Optional[str] = None
-    comedic_elements: List[str] = Field(default_factory=list, max_length=10)
-    modern_parallels: List[str] = Field(default_factory=list, max_length=5)
-
-    @field_validator('core_traits')
-    @classmethod
-    def validate_traits(cls, v):
-        """Ensure at least 3 traits provided."""
-        if len(v) < 3:
-            raise ValueError("Must provide at least 3 core traits")
-        return v
-
-
-# Narrative Analysis Schemas
-
-class PlotStructure(BaseModel):
-    """Narrative plot structure."""
-    structure_type: str  # "three-act", "episodic", "serialized"
-    act_breakdown: Dict[str, str]
-    typical_runtime: Optional[int] = None  # minutes
-
-
-class RecurringPlotDevice(BaseModel):
-    """Recurring narrative device."""
-    device_name: str
-    description: str
-    frequency: str  # "every episode", "occasional", "rare"
-    examples: List[str] = Field(default_factory=list, max_length=3)
-
-
-class NarrativeAnalysisResponse(BaseModel):
-    """Complete narrative analysis from AI."""
-    show_title: str
-    plot_structure: PlotStructure
-    recurring_devices: List[RecurringPlotDevice] = Field(
-        default_factory=list
-    )
-    opening_convention: Optional[str] = None
-    closing_convention: Optional[str] = None
-    b_plot_patterns: List[str] = Field(default_factory=list)
-    pacing_notes: Optional[str] = None
-    unique_signatures: List[str] = Field(default_factory=list, max_length=5)
-
-
-# Transformation Rules Schemas
-
-class SettingTransformation(BaseModel):
-    """Transformation of setting/time period."""
-    original_setting: str
-    modern_equivalent: str
-    justification: str
-    cultural_references: List[str] = Field(
-        default_factory=list, max_length=5
+
+def _int_fields(model_cls: Type[BaseModel]) -> Tuple[str, ...]:
+    """Names of the int and Optional[int] fields of a model."""
+    return tuple(
+        name for name, field in model_cls.model_fields.items()
+        if field.annotation in (int, Optional[int])
     )
 
 
-class CharacterTransformation(BaseModel):
-    """How a character transforms to modern context."""
-    original_character: str
-    original_archetype: str
-    modern_archetype: str
-    occupation_update: Optional[str] = None
-    motivation_update: str
-    technology_integration: List[str] = Field(default_factory=list)
+_INT_FIELDS: Dict[Type[BaseModel], Tuple[str, ...]] = {
+    model: _int_fields(model) for model in _RESPONSE_MODELS
+}
 
 
-class HumorTransformation(BaseModel):
-    """Transformation of humor styles."""
-    original_humor_type: str
-    modern_humor_type: str
-    example_transformations: List[Dict[str, str]] = Field(
-        default_factory=list,
-        max_length=5
-    )
+def _construct_trusted(model_cls: Type[_ModelT], data: Dict[str, Any]) -> _ModelT:
+    """
+    Build a model and its nested models without validation.
 
+    model_construct only skips validation for the top level and leaves
+    nested values as plain dicts, so nested model fields are built here.
+    JSON Schema "integer" also accepts integral floats such as 22.0; those
+    are converted to int as pydantic would.
+    """
+    values = dict(data)
+    for name in _INT_FIELDS[model_cls]:
+        value = values.get(name)
+        if type(value) is float:
+            values[name] = int(value)
+    for name, (nested_cls, is_list) in _NESTED_FIELDS[model_cls].items():
+        value = values.get(name)
+        if is_list and value is not None:
+            values[name] = [
+                _construct_trusted(nested_cls, item) if isinstance(item, dict)
+                else item
+                for item in value
+            ]
+        elif isinstance(value, dict):
+            values[name] = _construct_trusted(nested_cls, value)
+    return model_cls.model_construct(**values)
+
+
+# JSON Schema pre-flight for parsed dicts: fastjsonschema generates plain
+# Python checks from each schema. Data that passes is built with
+# model_construct; anything else goes through pydantic for full errors.
+# use_default=False keeps the checks from writing defaults into caller data.
+_SCHEMA_CHECKS: Dict[Type[BaseModel], Callable[[Any], Any]] = {}
+if FASTJSONSCHEMA_AVAILABLE:
+    for _model in (
+        CharacterAnalysisResponse,
+        NarrativeAnalysisResponse,
+        TransformationRulesResponse,
+    ):
+        _SCHEMA_CHECKS[_model] = fastjsonschema.compile(
+            _model.model_json_schema(), use_default=False
+        )
 
-class TransformationRulesResponse(BaseModel):
-    """Complete transformation ruleset from AI."""
-    show_title: str
-    setting_transformation: SettingTransformation
-    character_transformations: List[CharacterTransformation] = Field(
-        ...,
-        min_length=1
-    )
-    humor_transformation: HumorTransformation
-    cultural_updates: List[str] = Field(default_factory=list)
-    technology_opportunities: List[str] = Field(default_factory=list)
-    conflict_modernization: List[Dict[str, str]] = Field(
-        default_factory=list
-    )
 
-    @field_validator('character_transformations')
-    @classmethod
-    def validate_characters(cls, v):
-        """Ensure at least one character transformation."""
-        if len(v) < 1:
-            raise ValueError("Must transform at least one character")
-        return v
+# Validator Functions
 
+# Raw AI output: the undecoded JSON body, or an already-parsed dict
+RawResponse = Union[bytes, str, Dict]
+
+# Recently validated raw responses, keyed by (model, digest of the raw JSON).
+# Retries, audit re-reads and cache reloads often validate identical bodies.
+_VALIDATION_CACHE_SIZE = 32
+_validation_cache: "OrderedDict[Tuple[type, bytes], BaseModel]" = OrderedDict()
+
+
+def _strict_then_lax(validate: Callable[..., Any], data: Any) -> Any:
+    """
+    Validate strictly, retrying with type coercion only if that fails.
+
+    The AI is asked for exact JSON types, so the strict pass almost always
+    succeeds; the occasional "45"-for-45 still validates on the lax retry.
+    """
+    try:
+        return validate(data)
+    except ValidationError:
+        return validate(data, strict=False)
+
+
+def _validate_dict(model_cls: Type[BaseModel], data: Any) -> Any:
+    """
+    Validate a parsed response, via the schema pre-flight when available.
+
+    Raises ValidationError for invalid input.
+    """
+    check = _SCHEMA_CHECKS.get(model_cls)
+    if check is not None:
+        try:
+            check(data)
+        except fastjsonschema.JsonSchemaException:
+            pass
+        else:
+            return _construct_trusted(model_cls, data)
+    return _strict_then_lax(model_cls.model_validate, data)
+
+
+def _validate_json_cached(model_cls: Type[BaseModel], raw: Union[bytes, str]) -> Any:
+    """
+    Validate raw JSON, reusing the result for byte-identical input.
+
+    Cached instances are shared between callers and must not be mutated.
+    Raises ValidationError for invalid input (failures are not cached).
+    """
+    data = raw.encode() if isinstance(raw, str) else raw
+    key = (model_cls, hashlib.blake2b(data, digest_size=16).digest())
+    
+    cached = _validation_cache.get(key)
+    if cached is not None:
+        _validation_cache.move_to_end(key)
+        return cached
+    
+    validated = _strict_then_lax(model_cls.model_validate_json, data)
+    _validation_cache[key] = validated
+    if len(_validation_cache) > _VALIDATION_CACHE_SIZE:
+        _validation_cache.popitem(last=False)
+    return validated
+
+
+# Batch adapters, built once: a whole list validates in one pydantic-core call
+_BATCH_CHARACTER = TypeAdapter(List[CharacterAnalysisResponse])
+_BATCH_NARRATIVE = TypeAdapter(List[NarrativeAnalysisResponse])
+_BATCH_TRANSFORMATION = TypeAdapter(List[TransformationRulesResponse])
+
+
+def _validate_batch(
+    adapter: TypeAdapter,
+    label: str,
+    response_data: Union[bytes, str, List[Dict]]
+) -> Optional[List[Any]]:
+    """Validate a list of responses in one call; None if any item is invalid."""
+    try:
+        if isinstance(response_data, (bytes, str)):
+            validated: List[Any] = _strict_then_lax(adapter.validate_json, response_data)
+        else:
+            validated = _strict_then_lax(adapter.validate_python, response_data)
+        _log_info("Validated %d %s responses", len(validated), label)
+        return validated
+
+    except ValidationError as e:
+        _log_error(
+            "Batch %s validation failed: %s",
+            label,
+            e.errors(include_url=False, include_input=False),
+        )
+        if logger.isEnabledFor(logging.DEBUG):
+            _log_debug("Invalid data: %r", response_data)
+        return None
+
+
+def _validate(
+    model_cls: Type[BaseModel],
+    label: str,
+    name_attr: str,
+    response_data: RawResponse
+) -> Optional[Any]:
+    """Validate one response of any type; None (with the errors logged) if invalid."""
+    try:
+        if isinstance(response_data, (bytes, str)):
+            # Parse and validate in one pass, no intermediate dict
+            validated = _validate_json_cached(model_cls, response_data)
+        else:
+            validated = _validate_dict(model_cls, response_data)
+        _log_info("Validated %s for %s", label, getattr(validated, name_attr))
+        return validated
+
+    except ValidationError as e:
+        _log_error(
+            "%s validation failed: %s",
+            label.capitalize(),
+            e.errors(include_url=False, include_input=False),
+        )
+        if logger.isEnabledFor(logging.DEBUG):
+            _log_debug("Invalid data: %r", response_data)
+        return None
 
-# Validator Functions
 
 class AIResponseValidator:
     """
     Validates AI responses against Pydantic schemas.
 
     Provides graceful error handling and logging for malformed responses.
+    Stateless: call the static methods on the class, no instance needed.
     """
 
+    __slots__ = ()
+
     @staticmethod
     def validate_character_analysis(
-        response_data: Dict
+        response_data: RawResponse
     ) -> Optional[CharacterAnalysisResponse]:
         """
         Validate character analysis response.
 
         Args:
-            response_data: Raw JSON from AI
+            response_data: Raw JSON text/bytes from AI, or parsed dict
 
         Returns:
             Validated CharacterAnalysisResponse or None if invalid
 
         Example:
-            >>> validator = AIResponseValidator()
-            >>> result = validator.validate_character_analysis(ai_json)
+            >>> result = AIResponseValidator.validate_character_analysis(ai_json)
             >>> if result:
             ...     print(f"Valid: {len(result.core_traits)} traits")
             ... else:
             ...     print("Invalid response - retry needed")
         """
-        try:
-            validated = CharacterAnalysisResponse(**response_data)
-            logger.info(
-                f"Validated character analysis for "
-                f"{validated.character_name}"
-            )
-            return validated
-
-        except Exception as e:
-            logger.error(f"Character analysis validation failed: {e}")
-            logger.debug(f"Invalid data: {response_data}")
-            return None
+        return _validate(CharacterAnalysisResponse, "character analysis", "character_name", response_data)
 
     @staticmethod
     def validate_narrative_analysis(
-        response_data: Dict
+        response_data: RawResponse
     ) -> Optional[NarrativeAnalysisResponse]:
         """
         Validate narrative analysis response.
 
         Args:
-            response_data: Raw JSON from AI
+            response_data: Raw JSON text/bytes from AI, or parsed dict
 
         Returns:
             Validated NarrativeAnalysisResponse or None if invalid
         """
-        try:
-            validated = NarrativeAnalysisResponse(**response_data)
-            logger.info(
-                f"Validated narrative analysis for {validated.show_title}"
-            )
-            return validated
-
-        except Exception as e:
-            logger.error(f"Narrative analysis validation failed: {e}")
-            logger.debug(f"Invalid data: {response_data}")
-            return None
+        return _validate(NarrativeAnalysisResponse, "narrative analysis", "show_title", response_data)
 
     @staticmethod
     def validate_transformation_rules(
-        response_data: Dict
+        response_data: RawResponse
     ) -> Optional[TransformationRulesResponse]:
         """
         Validate transformation rules response.
 
         Args:
-            response_data: Raw JSON from AI
+            response_data: Raw JSON text/bytes from AI, or parsed dict
 
         Returns:
             Validated TransformationRulesResponse or None if invalid
         """
-        try:
-            validated = TransformationRulesResponse(**response_data)
-            logger.info(
-                f"Validated transformation rules for {validated.show_title}"
-            )
-            return validated
+        return _validate(TransformationRulesResponse, "transformation rules", "show_title", response_data)
+
+    @staticmethod
+    def validate_character_analyses_batch(
+        response_data: Union[bytes, str, List[Dict]]
+    ) -> Optional[List[CharacterAnalysisResponse]]:
+        """
+        Validate several character analyses (e.g. from a batch prompt) at once.
+
+        Args:
+            response_data: Raw JSON array from AI, or list of parsed dicts
+
+        Returns:
+            Validated responses in input order, or None if any is invalid
+        """
+        return _validate_batch(_BATCH_CHARACTER, "character analysis", response_data)
+
+    @staticmethod
+    def validate_narrative_analyses_batch(
+        response_data: Union[bytes, str, List[Dict]]
+    ) -> Optional[List[NarrativeAnalysisResponse]]:
+        """Validate several narrative analyses at once; None if any is invalid."""
+        return _validate_batch(_BATCH_NARRATIVE, "narrative analysis", response_data)
 
-        except Exception as e:
-            logger.error(f"Transformation rules validation failed: {e}")
-            logger.debug(f"Invalid data: {response_data}")
+    @staticmethod
+    def validate_transformation_rules_batch(
+        response_data: Union[bytes, str, List[Dict]]
+    ) -> Optional[List[TransformationRulesResponse]]:
+        """Validate several transformation rulesets at once; None if any is invalid."""
+        return _validate_batch(_BATCH_TRANSFORMATION, "transformation rules", response_data)
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop all cached validation results."""
+        _validation_cache.clear()
+
+    @staticmethod
+    def validate_character_analysis_lite(
+        raw: Union[bytes, str]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Parse a character analysis and shape-check it without building models.
+        
+        Intended for read paths that pass the response through unchanged
+        (e.g. straight back to the frontend). Only the required top-level
+        shape is checked; use validate_character_analysis for anything that
+        is stored or used structurally.
+        
+        Args:
+            raw: Raw JSON body from the AI
+            
+        Returns:
+            Parsed dict or None if it is not a plausible character analysis
+        """
+        try:
+            data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+        except ValueError as e:
+            _log_error("Character analysis parse failed: %s", e)
             return None
+        
+        if not isinstance(data, dict):
+            _log_error("Character analysis is not a JSON object")
+            return None
+        
+        name = data.get('character_name')
+        traits = data.get('core_traits')
+        if not (isinstance(name, str) and name):
+            _log_error("Character analysis missing character_name")
+            return None
+        if not (isinstance(traits, list) and 3 <= len(traits) <= 10 and all(
+            isinstance(trait, dict)
+            and isinstance(trait.get('trait'), str)
+            and isinstance(trait.get('description'), str)
+            for trait in traits
+        )):
+            _log_error("Character analysis has malformed core_traits")
+            return None
+        
+        return data
+
+    @staticmethod
+    def validate_character_analysis_trusted(
+        response_data: Dict
+    ) -> CharacterAnalysisResponse:
+        """
+        Build a character analysis from previously validated data.
+
+        Skips all validation and constraint checks. Only use for data that
+        already passed validate_character_analysis (e.g. loaded from our
+        database or round-tripped through model_dump), never for raw AI
+        output.
+        """
+        return _construct_trusted(CharacterAnalysisResponse, response_data)
+
+    @staticmethod
+    def validate_narrative_analysis_trusted(
+        response_data: Dict
+    ) -> NarrativeAnalysisResponse:
+        """
+        Build a narrative analysis from previously validated data.
+
+        Skips all validation; never use for raw AI output.
+        """
+        return _construct_trusted(NarrativeAnalysisResponse, response_data)
+
+    @staticmethod
+    def validate_transformation_rules_trusted(
+        response_data: Dict
+    ) -> TransformationRulesResponse:
+        """
+        Build transformation rules from previously validated data.
+
+        Skips all validation; never use for raw AI output.
+        """
+        return _construct_trusted(TransformationRulesResponse, response_data)
 
 
 # Example Usage
@@ -279,8 +478,7 @@ if __name__ == "__main__":
         ]
     }
 
-    validator = AIResponseValidator()
-    result = validator.validate_character_analysis(test_data)
+    result = AIResponseValidator.validate_character_analysis(test_data)
 
     if result:
         print(f"✅ Valid character analysis for {result.character_name}")
@@ -10,15 +10,29 @@ quality validation.
 
 import logging
 import asyncio
-from typing import List, Dict, Optional, TYPE_CHECKING, Callable
+import hashlib
+import json
+import copy
+import re
+import time
+from typing import (
+    Any, Awaitable, List, Dict, Final, Optional, Set, TYPE_CHECKING, Callable
+)
 from datetime import datetime
 
-from src.services.creative.dialogue_generator import DialogueGenerator
+import httpx
+
+from src.services.creative.dialogue_generator import (
+    DialogueGenerator,
+    score_dialogue_consistency,
+)
 from src.services.creative.stage_direction_generator import StageDirectionGenerator
 from src.services.creative.joke_optimizer import JokeOptimizer
 from src.services.creative.script_validator import ScriptValidator
 from src.services.creative.claude_client import ClaudeClient
 from src.services.creative.openai_client import OpenAIClient
+from src.services.creative.rate_limiter import TokenBucketRateLimiter
+from src.services.caching import CacheTTL, get_cache_manager
 from src.services.monitoring.performance_monitor import (
     get_performance_monitor,
     PerformanceMetrics,
@@ -32,15 +46,205 @@ from src.services.creative.script_models import (
 )
 from src.services.creative.character_voice_profiles import (
     CharacterVoiceProfile,
+    DialogueLine,
+    RenderedVoiceProfiles,
     SceneDialogue,
 )
+from src.services.creative.stage_direction_models import (
+    SceneStageDirections,
+    StageDirection,
+)
 from src.services.creative.validation_models import ValidationSeverity
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 if TYPE_CHECKING:
     from src.core.database_manager import DatabaseManager
 
 logger = logging.getLogger(__name__)
 
+# One connection pool shared by the Claude and GPT clients, sized for the
+# parallel scene and joke fan-out
+_HTTP_POOL_LIMITS: Final[httpx.Limits] = httpx.Limits(
+    max_connections=32, max_keepalive_connections=16
+)
+
+# A line counts as a comedy beat if it contains any of these (plain substring
+# match, as before: "ha" also matches "that")
+_COMEDY_KEYWORDS: Final[str] = r"[!?]|ha|oh|wow|oops|uh-oh|yikes|whoops"
+_COMEDY_RE: Final[re.Pattern[str]] = re.compile(
+    _COMEDY_KEYWORDS, re.IGNORECASE
+)
+
+# Same test over newline-joined lines: a match runs from the first keyword
+# to the end of its line, so each line matches at most once
+_COMEDY_LINE_RE: Final[re.Pattern[str]] = re.compile(
+    rf"(?:{_COMEDY_KEYWORDS})[^\n]*", re.IGNORECASE
+)
+
+
+def _count_comedy_lines(lines: List[str]) -> int:
+    """Count lines containing a comedy keyword in one regex sweep."""
+    if not lines:
+        return 0
+    joined = "\n".join(lines)
+    if joined.count("\n") != len(lines) - 1:
+        # A line has its own newline; joining would split it in two
+        count: int = 0
+        for line in lines:
+            if _COMEDY_RE.search(line):
+                count += 1
+        return count
+    return len(_COMEDY_LINE_RE.findall(joined))
+
+# FullScript fields taken from show metadata, with their fallbacks (writers
+# is handled separately so scripts never share one mutable default list)
+_SHOW_METADATA_DEFAULTS: Final[Dict[str, Any]] = {
+    "episode_title": "Untitled",
+    "show_title": "Unknown Show",
+    "episode_number": 1,
+    "season_number": 1,
+    "original_show": "Unknown",
+    "doppelganger_setting": "Unknown",
+}
+
+# Output budget per scene in a batched request (matches DialogueGenerator)
+_TOKENS_PER_BATCHED_SCENE: Final[int] = 4000
+
+
+def _canonical_json(data: Any) -> bytes:
+    """
+    Serialize data deterministically (sorted keys), for hashing.
+    
+    Uses orjson when installed. The two encoders differ byte-for-byte, so
+    keys are only stable within one installation, which is all the cache
+    needs.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(
+            data,
+            default=str,
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+        )
+    return json.dumps(data, sort_keys=True, default=str).encode()
+
+
+def _dumps_indented(data: Any) -> str:
+    """Serialize with two-space indentation for prompts."""
+    # orjson leaves non-ASCII text unescaped, which the model reads fine
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2)
+
+
+def _profiles_fingerprint(
+    character_profiles: Dict[str, CharacterVoiceProfile]
+) -> bytes:
+    """Serialize voice profiles deterministically, for cache keys."""
+    return _canonical_json(
+        {name: profile.to_dict() for name, profile in character_profiles.items()}
+    )
+
+
+def _scene_cache_key(
+    scene_outline: Dict,
+    character_profiles: Dict[str, CharacterVoiceProfile],
+) -> str:
+    """
+    Cache key for a generated scene.
+    
+    Covers the full outline and every voice profile, so editing either
+    invalidates the scene.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(_canonical_json(scene_outline))
+    digest.update(_profiles_fingerprint(character_profiles))
+    return f"scene_script:{digest.hexdigest()}"
+
+
+async def _gather_as_completed(
+    aws: List[Awaitable[Any]],
+    on_complete: Callable[[int, Any], None],
+) -> List[Any]:
+    """
+    Run awaitables concurrently, reporting each result as it finishes.
+    
+    Like asyncio.gather, but on_complete(done_count, result) is called in
+    completion order, so callers can report progress before the slowest
+    one is done. Results are still returned in input order. If one fails,
+    the rest are cancelled and the error propagates.
+    """
+    async def indexed(idx: int, aw: Awaitable[Any]):
+        return idx, await aw
+    
+    tasks = [
+        asyncio.ensure_future(indexed(idx, aw)) for idx, aw in enumerate(aws)
+    ]
+    results: List[Any] = [None] * len(tasks)
+    try:
+        for done_count, next_done in enumerate(
+            asyncio.as_completed(tasks), start=1
+        ):
+            idx, result = await next_done
+            results[idx] = result
+            on_complete(done_count, result)
+    finally:
+        for task in tasks:
+            task.cancel()
+    return results
+
+
+_SCENE_BATCH_PROMPT = """
+You are a TV comedy writer. Write dialogue and stage directions for each of
+the following scenes.
+
+SCENES:
+{scenes}
+
+VOICE PROFILES:
+{voice_guidance}
+
+Respond with JSON containing one entry per scene, in the same order:
+
+{{
+  "scenes": [
+    {{
+      "scene_number": 1,
+      "dialogue": [
+        {{
+          "character": "CHARACTER NAME",
+          "line": "What they say",
+          "emotion": "emotional state",
+          "delivery_note": "optional acting direction",
+          "pause_before": 0.0,
+          "is_comedic_beat": false,
+          "comedic_beat_type": null
+        }}
+      ],
+      "stage_directions": {{
+        "opening_description": "What we see as the scene opens",
+        "action_beats": [
+          {{
+            "timing": "BEFORE LINE|DURING LINE|AFTER LINE|CONTINUOUS",
+            "description": "What happens",
+            "duration_estimate": 2.0,
+            "involves_characters": ["CHARACTER NAME"],
+            "visual_gag": false
+          }}
+        ],
+        "closing_description": "How the scene ends visually"
+      }}
+    }}
+  ]
+}}
+
+Make it funny, natural, and true to the characters!
+"""
+
 
 class ScriptGenerator:
     """
@@ -67,6 +271,10 @@ class ScriptGenerator:
         max_refinement_iterations: int = 3,
         quality_threshold: float = 0.75,
         max_parallel_scenes: int = 3,
+        scene_batch_size: int = 1,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        cache_scenes: bool = False,
     ):
         """
         Initialize ScriptGenerator.
@@ -75,19 +283,49 @@ class ScriptGenerator:
             database_manager: Optional caching manager
             max_refinement_iterations: Maximum refinement attempts
             quality_threshold: Minimum quality score for validation
-            max_parallel_scenes: Max scenes to generate in parallel (default 3)
+            max_parallel_scenes: Max scenes (or scene batches) to generate
+                in parallel (default 3)
+            scene_batch_size: Scenes packed into one LLM request. 1 keeps
+                one dialogue + stage-direction round-trip per scene; 3-5
+                trades longer responses for far fewer round-trips.
+            requests_per_minute: Provider RPM budget. When set, every LLM
+                call from every component waits on one shared token bucket,
+                so max_parallel_scenes can be raised to the point where the
+                API limits, not the semaphore, bound throughput.
+            tokens_per_minute: Provider TPM budget for the same limiter
+                (only used together with requests_per_minute)
+            cache_scenes: Reuse generated scenes from the shared cache when
+                the scene outline and voice profiles are unchanged. Off by
+                default, since it makes repeat runs return the same scenes.
         """
         self.db_manager = database_manager
         self.max_refinement_iterations = max_refinement_iterations
         self.quality_threshold = quality_threshold
         self.max_parallel_scenes = max_parallel_scenes
+        self.scene_batch_size = scene_batch_size
         
         # Initialize performance monitor
         self.performance_monitor = get_performance_monitor()
         
-        # Initialize AI clients
-        self.claude_client = ClaudeClient()
-        self.gpt_client = OpenAIClient()
+        # One limiter shared by every client, so all LLM calls draw on the
+        # same RPM/TPM budget
+        self.rate_limiter = (
+            TokenBucketRateLimiter(requests_per_minute, tokens_per_minute)
+            if requests_per_minute else None
+        )
+        
+        # Scene scripts keyed on (outline, voice profiles)
+        self.scene_cache = get_cache_manager() if cache_scenes else None
+        
+        # Initialize AI clients on one keep-alive pool; per-request timeouts
+        # still come from the SDKs
+        self.http_client = httpx.AsyncClient(limits=_HTTP_POOL_LIMITS)
+        self.claude_client = ClaudeClient(
+            http_client=self.http_client, rate_limiter=self.rate_limiter
+        )
+        self.gpt_client = OpenAIClient(
+            http_client=self.http_client, rate_limiter=self.rate_limiter
+        )
         
         # Initialize all components
         self.dialogue_generator = DialogueGenerator(
@@ -106,6 +344,10 @@ class ScriptGenerator:
             pass_threshold=quality_threshold,
         )
         
+        # (fingerprint, analysis) of the last comedy pass, so unchanged
+        # dialogue is not re-optimized during refinement
+        self._last_comedy_analysis: Optional[tuple] = None
+        
         logger.info(
             f"ScriptGenerator initialized "
             f"(max_iterations={max_refinement_iterations}, "
@@ -135,7 +377,8 @@ class ScriptGenerator:
             episode_outline: Episode structure with scenes
             character_profiles: Voice profiles for all characters
             show_metadata: Show details (title, setting, etc.)
-            progress_callback: Optional callback(status, current, total)
+            progress_callback: Optional callback(status, completed, total),
+                called as each scene finishes
         
         Returns:
             Complete script with all metadata and validation
@@ -163,7 +406,11 @@ class ScriptGenerator:
         # Start performance monitoring session
         self.performance_monitor.start_session(script_id)
         
+        # Wall clock only for the script's timestamp; durations use the
+        # monotonic clock so clock adjustments can't skew them
         start_time = datetime.now()
+        start_perf = time.monotonic()
+        self._last_comedy_analysis = None
         
         # Extract outline data
         scenes_outline = episode_outline.get("scenes", [])
@@ -174,42 +421,82 @@ class ScriptGenerator:
             f"(max {self.max_parallel_scenes} at once)..."
         )
         
-        # Create semaphore for concurrency control
-        semaphore = asyncio.Semaphore(self.max_parallel_scenes)
+        # Script totals accumulate as scenes finish instead of re-walking
+        # every scene afterwards
+        total_runtime = 0.0
+        total_dialogue_lines = 0
         
-        async def generate_with_progress(idx: int, scene_outline: Dict):
-            """Generate scene with semaphore and progress tracking."""
-            async with semaphore:
-                if progress_callback:
-                    progress_callback(
-                        f"Generating scene {scene_outline['scene_number']}",
-                        idx,
-                        len(scenes_outline)
+        # Voice summaries are the same for every scene prompt
+        rendered_profiles = self._render_profiles(character_profiles)
+        
+        def tally_scene(scene_script: SceneScript):
+            """Add a finished scene to the running totals."""
+            nonlocal total_runtime, total_dialogue_lines
+            total_runtime += scene_script.estimated_runtime
+            total_dialogue_lines += len(scene_script.dialogue.dialogue_lines)
+        
+        if self.scene_batch_size > 1:
+            scene_scripts = await self._generate_scenes_batched(
+                scenes_outline,
+                character_profiles,
+                self.scene_batch_size,
+                progress_callback,
+                on_scene=tally_scene,
+                rendered_profiles=rendered_profiles,
+            )
+        else:
+            # Create semaphore for concurrency control
+            semaphore = asyncio.Semaphore(self.max_parallel_scenes)
+            
+            async def generate_with_limit(scene_outline: Dict):
+                """Generate scene under the concurrency limit."""
+                async with semaphore:
+                    return await self._generate_scene_script(
+                        scene_outline, character_profiles, rendered_profiles
                     )
-                scene_script = await self._generate_scene_script(
-                    scene_outline, character_profiles
-                )
+            
+            def scene_completed(done_count: int, scene_script: SceneScript):
+                """Report each scene as soon as it finishes."""
+                tally_scene(scene_script)
                 logger.info(
                     f"Scene {scene_script.scene_number} generated "
-                    f"({scene_script.estimated_runtime:.1f}s)"
+                    f"({scene_script.estimated_runtime:.1f}s, "
+                    f"{total_runtime / 60:.1f}m so far)"
                 )
-                return scene_script
-        
-        # Generate all scenes in parallel with concurrency limit
-        scene_scripts = await asyncio.gather(
-            *[
-                generate_with_progress(idx, scene_outline)
-                for idx, scene_outline in enumerate(scenes_outline)
-            ]
-        )
+                if progress_callback:
+                    progress_callback(
+                        f"Completed scene {scene_script.scene_number}",
+                        done_count,
+                        len(scenes_outline)
+                    )
+            
+            # Generate all scenes in parallel with concurrency limit
+            scene_scripts = await _gather_as_completed(
+                [
+                    generate_with_limit(scene_outline)
+                    for scene_outline in scenes_outline
+                ],
+                scene_completed,
+            )
         
         # Collect all dialogues for comedy optimization
         all_dialogues = [scene.dialogue for scene in scene_scripts]
         
-        # Optimize comedy across all scenes
-        logger.info("Optimizing comedy timing and effectiveness...")
-        comedy_analysis = await self.joke_optimizer.optimize_script_comedy(
-            all_dialogues, character_profiles
+        # Optimize comedy across all scenes; the comedy-independent
+        # validation checks run in a worker thread meanwhile
+        logger.info(
+            "Optimizing comedy timing and effectiveness "
+            "(validating structure in parallel)..."
+        )
+        comedy_analysis, noncomedy_report = await asyncio.gather(
+            self._optimize_comedy(all_dialogues, character_profiles),
+            asyncio.to_thread(
+                self.script_validator.validate_noncomedy,
+                script_id,
+                all_dialogues,
+                character_profiles,
+                show_metadata,
+            ),
         )
         
         logger.info(
@@ -218,18 +505,20 @@ class ScriptGenerator:
             f"{comedy_analysis.overall_effectiveness:.2f} effectiveness"
         )
         
-        # Calculate totals
-        total_runtime = sum(scene.estimated_runtime for scene in scene_scripts)
         total_comedy_beats = comedy_analysis.timing_analysis.total_jokes
         
-        # Initial validation
+        # Initial validation (only the comedy checks are left to run).
+        # Validation is synchronous CPU work, so it runs in a worker thread
+        # to keep the event loop free
         logger.info("Performing initial validation...")
-        validation_report = self.script_validator.validate_script(
+        validation_report = await asyncio.to_thread(
+            self.script_validator.validate_script,
             script_id=script_id,
             scene_dialogues=all_dialogues,
             voice_profiles=character_profiles,
             comedy_analysis=comedy_analysis,
             episode_metadata=show_metadata,
+            noncomedy=noncomedy_report,
         )
         
         logger.info(
@@ -241,6 +530,7 @@ class ScriptGenerator:
         refinement_iterations = []
         current_quality = validation_report.overall_quality_score
         iteration = 0
+        refinement_stalled = False
         
         while (
             not validation_report.validation_passed and
@@ -248,12 +538,40 @@ class ScriptGenerator:
         ):
             iteration += 1
             logger.info(f"Starting refinement iteration {iteration}...")
+            started_at = datetime.now()
+            
+            # Attempt refinement
+            previous_comedy_analysis = comedy_analysis
+            (
+                scene_scripts,
+                comedy_analysis,
+                modified_scene_numbers,
+            ) = await self._refine_script(
+                scene_scripts,
+                all_dialogues,
+                character_profiles,
+                validation_report,
+            )
+            
+            # Nothing changed, so re-validating would only reproduce the
+            # same report; stop instead of recording empty iterations
+            if (
+                not modified_scene_numbers and
+                comedy_analysis is previous_comedy_analysis
+            ):
+                logger.warning(
+                    f"Refinement iteration {iteration} changed no scenes "
+                    f"and reused the comedy analysis; refinement cannot "
+                    f"make further progress"
+                )
+                refinement_stalled = True
+                break
             
             # Record iteration
             refinement_iterations.append(
                 RefinementIteration(
                     iteration_number=iteration,
-                    timestamp=datetime.now(),
+                    timestamp=started_at,
                     validation_report=validation_report,
                     quality_score=current_quality,
                     validation_passed=False,
@@ -263,22 +581,39 @@ class ScriptGenerator:
                 )
             )
             
-            # Attempt refinement
-            scene_scripts, comedy_analysis = await self._refine_script(
-                scene_scripts,
-                character_profiles,
-                validation_report,
-            )
-            
-            # Re-validate
-            all_dialogues = [scene.dialogue for scene in scene_scripts]
-            validation_report = self.script_validator.validate_script(
-                script_id=script_id,
-                scene_dialogues=all_dialogues,
-                voice_profiles=character_profiles,
-                comedy_analysis=comedy_analysis,
-                episode_metadata=show_metadata,
-            )
+            # Re-validate; with no dialogue changes only the comedy
+            # scores can move, so skip the full validation pass (and keep
+            # the current dialogue list)
+            if modified_scene_numbers:
+                # Refined scenes change the runtime as well as the lines,
+                # so recount both in one pass
+                all_dialogues = []
+                total_runtime = 0.0
+                total_dialogue_lines = 0
+                for scene_script in scene_scripts:
+                    all_dialogues.append(scene_script.dialogue)
+                    total_runtime += scene_script.estimated_runtime
+                    total_dialogue_lines += len(
+                        scene_script.dialogue.dialogue_lines
+                    )
+                # Characters outside the modified scenes keep their scores
+                validation_report = await asyncio.to_thread(
+                    self.script_validator.validate_script,
+                    script_id=script_id,
+                    scene_dialogues=all_dialogues,
+                    voice_profiles=character_profiles,
+                    comedy_analysis=comedy_analysis,
+                    episode_metadata=show_metadata,
+                    prior_report=validation_report,
+                    dirty_scene_numbers=modified_scene_numbers,
+                )
+            else:
+                validation_report = await asyncio.to_thread(
+                    self.script_validator.revalidate_comedy,
+                    validation_report,
+                    all_dialogues,
+                    comedy_analysis,
+                )
             
             new_quality = validation_report.overall_quality_score
             logger.info(
@@ -291,6 +626,9 @@ class ScriptGenerator:
             refinement_iterations[-1].improvements_made = [
                 f"Quality improved by {(new_quality - current_quality):.2f}"
             ]
+            refinement_iterations[-1].scenes_modified = sorted(
+                modified_scene_numbers
+            )
             refinement_iterations[-1].quality_score = new_quality
             refinement_iterations[-1].validation_passed = (
                 validation_report.validation_passed
@@ -299,15 +637,11 @@ class ScriptGenerator:
             current_quality = new_quality
         
         # Production metadata
-        budget_estimate = validation_report.production_complexity.budget_estimate
-        location_count = validation_report.production_complexity.location_count
-        special_effects_count = (
-            validation_report.production_complexity.special_effects_count
-        )
+        production = validation_report.production_complexity
         
         # Generation notes
         generation_notes = []
-        generation_time = (datetime.now() - start_time).total_seconds()
+        generation_time = time.monotonic() - start_perf
         generation_notes.append(
             f"Generated in {generation_time:.1f}s "
             f"({len(refinement_iterations)} refinement iterations)"
@@ -318,6 +652,11 @@ class ScriptGenerator:
                 f"Script passed validation with quality score "
                 f"{current_quality:.2f}"
             )
+        elif refinement_stalled:
+            generation_notes.append(
+                f"Refinement stopped early: no scene or comedy change "
+                f"was possible (final score: {current_quality:.2f})"
+            )
         else:
             generation_notes.append(
                 f"Script reached maximum refinement iterations "
@@ -327,15 +666,11 @@ class ScriptGenerator:
         # Create full script
         full_script = FullScript(
             script_id=script_id,
-            episode_title=show_metadata.get("episode_title", "Untitled"),
-            show_title=show_metadata.get("show_title", "Unknown Show"),
-            episode_number=show_metadata.get("episode_number", 1),
-            season_number=show_metadata.get("season_number", 1),
+            **{
+                field: show_metadata.get(field, default)
+                for field, default in _SHOW_METADATA_DEFAULTS.items()
+            },
             writers=show_metadata.get("writers", ["AI Generated"]),
-            original_show=show_metadata.get("original_show", "Unknown"),
-            doppelganger_setting=show_metadata.get(
-                "doppelganger_setting", "Unknown"
-            ),
             scenes=scene_scripts,
             generation_timestamp=start_time,
             total_runtime=total_runtime,
@@ -343,9 +678,9 @@ class ScriptGenerator:
             final_validation_report=validation_report,
             final_quality_score=current_quality,
             refinement_iterations=refinement_iterations,
-            budget_estimate=budget_estimate,
-            location_count=location_count,
-            special_effects_count=special_effects_count,
+            budget_estimate=production.budget_estimate,
+            location_count=production.location_count,
+            special_effects_count=production.special_effects_count,
             generation_notes=generation_notes,
         )
         
@@ -354,9 +689,7 @@ class ScriptGenerator:
         if metrics:
             # Update metrics with script-specific data
             metrics.scenes_generated = len(scene_scripts)
-            metrics.dialogue_lines_generated = sum(
-                len(scene.dialogue.dialogue_lines) for scene in scene_scripts
-            )
+            metrics.dialogue_lines_generated = total_dialogue_lines
             metrics.jokes_analyzed = comedy_analysis.timing_analysis.total_jokes
             
             # Log performance summary
@@ -370,10 +703,23 @@ class ScriptGenerator:
         
         return full_script
     
+    def _render_profiles(
+        self,
+        character_profiles: Dict[str, CharacterVoiceProfile],
+    ) -> RenderedVoiceProfiles:
+        """Render voice profiles into prompt text once for a whole script."""
+        rendered = RenderedVoiceProfiles.from_profiles(character_profiles)
+        logger.debug(
+            f"Rendered {len(rendered.summaries)} voice profiles "
+            f"(~{rendered.token_estimate} tokens)"
+        )
+        return rendered
+    
     async def _generate_scene_script(
         self,
         scene_outline: Dict,
         character_profiles: Dict[str, CharacterVoiceProfile],
+        rendered_profiles: Optional[RenderedVoiceProfiles] = None,
     ) -> SceneScript:
         """
         Generate complete script for a single scene (async for parallel execution).
@@ -381,37 +727,83 @@ class ScriptGenerator:
         Args:
             scene_outline: Scene details from episode outline
             character_profiles: Character voice profiles
+            rendered_profiles: character_profiles already rendered for the
+                prompt; rendered here if omitted
         
         Returns:
             Complete scene script with dialogue and staging
         """
         scene_number = scene_outline["scene_number"]
         
+        cache_key = None
+        if self.scene_cache:
+            cache_key = _scene_cache_key(scene_outline, character_profiles)
+            cached = await asyncio.to_thread(self.scene_cache.get, cache_key)
+            if cached is not None:
+                logger.debug(f"Scene {scene_number} served from cache")
+                # The in-memory tier returns the stored dict itself, so
+                # rebuild from a copy to keep every hit independent
+                return SceneScript.from_dict(copy.deepcopy(cached))
+        
         logger.debug(f"Generating scene {scene_number}...")
         
-        # Generate dialogue (already async)
-        dialogue = await self.dialogue_generator.generate_dialogue(
-            scene_description=scene_outline.get("description", ""),
-            characters=scene_outline.get("characters", []),
-            voice_profiles=character_profiles,
-            scene_context={
-                "location": scene_outline.get("location", ""),
-                "time": scene_outline.get("time", "Day"),
-                "beat_type": scene_outline.get("beat_type", "general"),
-            },
+        # Dialogue and staging are independent LLM calls: staging works
+        # from the outline, so run both at once
+        dialogue, stage_directions = await asyncio.gather(
+            self.dialogue_generator.generate_dialogue(
+                scene_description=scene_outline.get("description", ""),
+                characters=scene_outline.get("characters", []),
+                voice_profiles=character_profiles,
+                rendered_profiles=(
+                    rendered_profiles or self._render_profiles(character_profiles)
+                ),
+                scene_context={
+                    "location": scene_outline.get("location", ""),
+                    "time": scene_outline.get("time", "Day"),
+                    "beat_type": scene_outline.get("beat_type", "general"),
+                },
+            ),
+            self._generate_scene_staging(scene_outline),
+        )
+        
+        scene_script = self._assemble_scene_script(
+            scene_outline, dialogue, stage_directions
         )
         
-        # Generate stage directions (now properly async)
+        if cache_key:
+            try:
+                # to_dict() shares the scene's lists, and the in-memory
+                # tier stores values as-is, so store a copy
+                await asyncio.to_thread(
+                    self.scene_cache.set,
+                    cache_key,
+                    copy.deepcopy(scene_script.to_dict()),
+                    CacheTTL.LONG.value,
+                )
+            except Exception as e:
+                logger.warning(f"Failed to cache scene {scene_number}: {e}")
+        
+        return scene_script
+    
+    async def _generate_scene_staging(
+        self,
+        scene_outline: Dict,
+    ) -> SceneStageDirections:
+        """
+        Generate stage directions from the scene outline.
+        
+        Falls back to basic staging on failure, so a staging error never
+        fails the scene (dialogue errors still propagate).
+        """
         try:
-            stage_directions = await self.stage_direction_generator.generate_stage_directions(
+            return await self.stage_direction_generator.generate_stage_directions(
                 scene=scene_outline,
-                scene_dialogue=dialogue,
+                scene_dialogue=None,
                 comedic_beats=None,
             )
         except Exception as e:
             logger.warning(f"Stage direction generation failed: {e}, using basic fallback")
-            from src.services.creative.stage_direction_models import SceneStageDirections
-            stage_directions = SceneStageDirections(
+            return SceneStageDirections(
                 scene_number=scene_outline.get("scene_number", 1),
                 opening_description=f"Scene at {scene_outline.get('location', 'Unknown')}",
                 action_beats=[],
@@ -420,17 +812,19 @@ class ScriptGenerator:
                 camera_suggestions=[],
                 total_visual_runtime=60.0
             )
+    
+    def _assemble_scene_script(
+        self,
+        scene_outline: Dict,
+        dialogue: SceneDialogue,
+        stage_directions: SceneStageDirections,
+    ) -> SceneScript:
+        """Combine generated dialogue and staging into a SceneScript."""
+        scene_number = scene_outline["scene_number"]
         
         # Count comedy beats in this scene
-        comedy_beat_count = sum(
-            1 for line in dialogue.dialogue_lines
-            if any(
-                keyword in line.line.lower()
-                for keyword in [
-                    "!", "?", "ha", "oh", "wow", "oops",
-                    "uh-oh", "yikes", "whoops"
-                ]
-            )
+        comedy_beat_count = _count_comedy_lines(
+            [line.line for line in dialogue.dialogue_lines]
         )
         
         # Collect production notes
@@ -458,9 +852,240 @@ class ScriptGenerator:
             production_notes=production_notes,
         )
     
+    async def _generate_scenes_batched(
+        self,
+        scenes_outline: List[Dict],
+        character_profiles: Dict[str, CharacterVoiceProfile],
+        batch_size: int,
+        progress_callback: Optional[Callable[[str, int, int], None]] = None,
+        on_scene: Optional[Callable[[SceneScript], None]] = None,
+        rendered_profiles: Optional[RenderedVoiceProfiles] = None,
+    ) -> List[SceneScript]:
+        """
+        Generate scenes several at a time, one LLM request per batch.
+        
+        Batches still run concurrently, bounded by max_parallel_scenes.
+        
+        Args:
+            scenes_outline: Scene outlines in episode order
+            character_profiles: Character voice profiles
+            batch_size: Scenes per request
+            progress_callback: Optional callback(status, completed, total),
+                called as each batch finishes
+            on_scene: Optional callback(scene_script), called for every
+                scene of a batch as it finishes
+            rendered_profiles: character_profiles already rendered for the
+                prompt; rendered here if omitted
+        
+        Returns:
+            Scene scripts in episode order
+        """
+        if rendered_profiles is None:
+            rendered_profiles = self._render_profiles(character_profiles)
+        semaphore = asyncio.Semaphore(self.max_parallel_scenes)
+        batches = [
+            scenes_outline[start:start + batch_size]
+            for start in range(0, len(scenes_outline), batch_size)
+        ]
+        
+        async def generate_batch(batch: List[Dict]):
+            """Generate one batch under the concurrency limit."""
+            async with semaphore:
+                return await self._generate_scene_batch(
+                    batch, character_profiles, rendered_profiles
+                )
+        
+        scenes_done = 0
+        
+        def batch_completed(done_count: int, batch_scripts: List[SceneScript]):
+            """Report each batch as soon as it finishes."""
+            nonlocal scenes_done
+            scenes_done += len(batch_scripts)
+            if on_scene:
+                for scene_script in batch_scripts:
+                    on_scene(scene_script)
+            if progress_callback:
+                progress_callback(
+                    f"Completed scenes {batch_scripts[0].scene_number}-"
+                    f"{batch_scripts[-1].scene_number}",
+                    scenes_done,
+                    len(scenes_outline)
+                )
+        
+        batch_results = await _gather_as_completed(
+            [generate_batch(batch) for batch in batches],
+            batch_completed,
+        )
+        return [scene for batch in batch_results for scene in batch]
+    
+    async def _generate_scene_batch(
+        self,
+        batch: List[Dict],
+        character_profiles: Dict[str, CharacterVoiceProfile],
+        rendered_profiles: RenderedVoiceProfiles,
+    ) -> List[SceneScript]:
+        """
+        Generate dialogue and staging for a batch of scenes in one request.
+        
+        Scenes missing or malformed in the response fall back to the
+        per-scene pipeline, so one bad entry never loses the batch.
+        """
+        prompt = self._build_scene_batch_prompt(batch, rendered_profiles)
+        
+        try:
+            response = await self.claude_client.generate_json(
+                prompt=prompt,
+                max_tokens=min(
+                    _TOKENS_PER_BATCHED_SCENE * len(batch),
+                    ClaudeClient.MAX_TOKENS,
+                ),
+            )
+            entries = {
+                entry.get("scene_number"): entry
+                for entry in response.get("scenes", [])
+                if isinstance(entry, dict)
+            }
+        except Exception as e:
+            logger.warning(f"Batched scene generation failed: {e}, generating per scene")
+            entries = {}
+        
+        assembled: List[Optional[SceneScript]] = []
+        for scene_outline in batch:
+            entry = entries.get(scene_outline["scene_number"])
+            scene_script = None
+            if entry is not None:
+                try:
+                    scene_script = self._assemble_scene_script(
+                        scene_outline,
+                        self._dialogue_from_batch_entry(
+                            scene_outline, entry, character_profiles
+                        ),
+                        self._stage_directions_from_batch_entry(
+                            scene_outline, entry
+                        ),
+                    )
+                except (KeyError, TypeError, ValueError) as e:
+                    logger.warning(
+                        f"Malformed batched scene {scene_outline['scene_number']}: {e}"
+                    )
+            assembled.append(scene_script)
+        
+        missing = [
+            idx for idx, scene_script in enumerate(assembled)
+            if scene_script is None
+        ]
+        if missing:
+            fallbacks = await asyncio.gather(
+                *[
+                    self._generate_scene_script(
+                        batch[idx], character_profiles, rendered_profiles
+                    )
+                    for idx in missing
+                ]
+            )
+            for idx, scene_script in zip(missing, fallbacks):
+                assembled[idx] = scene_script
+        
+        # Every gap has been filled by its fallback
+        scene_scripts = [
+            scene_script for scene_script in assembled
+            if scene_script is not None
+        ]
+        for scene_script in scene_scripts:
+            logger.info(
+                f"Scene {scene_script.scene_number} generated "
+                f"({scene_script.estimated_runtime:.1f}s)"
+            )
+        return scene_scripts
+    
+    def _build_scene_batch_prompt(
+        self,
+        batch: List[Dict],
+        rendered_profiles: RenderedVoiceProfiles,
+    ) -> str:
+        """Build one prompt covering every scene in the batch."""
+        characters = {
+            character
+            for scene_outline in batch
+            for character in scene_outline.get("characters", [])
+        }
+        return _SCENE_BATCH_PROMPT.format(
+            scenes=_dumps_indented(batch),
+            voice_guidance=rendered_profiles.guidance_for(characters),
+        )
+    
+    def _dialogue_from_batch_entry(
+        self,
+        scene_outline: Dict,
+        entry: Dict,
+        character_profiles: Dict[str, CharacterVoiceProfile],
+    ) -> SceneDialogue:
+        """Build SceneDialogue from one scene of a batched response."""
+        # Lines, word count and comedic beats in a single pass
+        dialogue_lines: List[DialogueLine] = []
+        total_words: int = 0
+        comedic_beats: int = 0
+        for idx, line_data in enumerate(entry["dialogue"]):
+            line = DialogueLine(
+                character=line_data.get("character", "Unknown"),
+                line=line_data.get("line", ""),
+                emotion=line_data.get("emotion", "neutral"),
+                delivery_note=line_data.get("delivery_note"),
+                pause_before=line_data.get("pause_before", 0.0),
+                is_comedic_beat=line_data.get("is_comedic_beat", False),
+                comedic_beat_type=line_data.get("comedic_beat_type"),
+                line_number=idx + 1,
+            )
+            dialogue_lines.append(line)
+            total_words += len(line.line.split())
+            if line.is_comedic_beat:
+                comedic_beats += 1
+        
+        # Runtime estimate at 150 spoken words per minute; confidence is
+        # scored as on the per-scene path
+        characters = scene_outline.get("characters", [])
+        return SceneDialogue(
+            scene_number=scene_outline["scene_number"],
+            location=scene_outline.get("location", "Unknown"),
+            characters_present=characters,
+            dialogue_lines=dialogue_lines,
+            total_runtime_estimate=int((total_words / 150) * 60),
+            comedic_beats_count=comedic_beats,
+            confidence_score=score_dialogue_consistency(
+                dialogue_lines, characters, character_profiles
+            ),
+        )
+    
+    def _stage_directions_from_batch_entry(
+        self,
+        scene_outline: Dict,
+        entry: Dict,
+    ) -> SceneStageDirections:
+        """Build SceneStageDirections from one scene of a batched response."""
+        staging = entry.get("stage_directions") or {}
+        action_beats = [
+            StageDirection.from_dict(beat)
+            for beat in staging.get("action_beats", [])
+        ]
+        return SceneStageDirections(
+            scene_number=scene_outline["scene_number"],
+            opening_description=staging.get(
+                "opening_description",
+                f"Scene at {scene_outline.get('location', 'Unknown')}",
+            ),
+            action_beats=action_beats,
+            physical_comedy_sequences=[],
+            closing_description=staging.get("closing_description", ""),
+            camera_suggestions=[],
+            total_visual_runtime=sum(
+                beat.duration_estimate for beat in action_beats
+            ),
+        )
+    
     async def _refine_script(
         self,
         scene_scripts: List[SceneScript],
+        all_dialogues: List[SceneDialogue],
         character_profiles: Dict[str, CharacterVoiceProfile],
         validation_report,
     ) -> tuple:
@@ -471,11 +1096,13 @@ class ScriptGenerator:
         
         Args:
             scene_scripts: Current scene scripts
+            all_dialogues: Dialogue of scene_scripts, in the same order
             character_profiles: Character voice profiles
             validation_report: Validation results
         
         Returns:
-            Tuple of (refined_scenes, new_comedy_analysis)
+            Tuple of (refined_scenes, new_comedy_analysis,
+            modified_scene_numbers)
         """
         logger.info("Refining script based on validation feedback...")
         
@@ -489,18 +1116,58 @@ class ScriptGenerator:
         # Full implementation would regenerate problematic scenes
         # and apply specific fixes based on issue types
         
-        # Re-optimize comedy (which may improve weak jokes)
-        all_dialogues = [scene.dialogue for scene in scene_scripts]
-        comedy_analysis = await self.joke_optimizer.optimize_script_comedy(
+        # Re-optimize comedy (which may improve weak jokes); the previous
+        # analysis is reused if no dialogue changed
+        comedy_analysis = await self._optimize_comedy(
             all_dialogues, character_profiles
         )
         
+        # No scene is regenerated yet, so no dialogue has changed
+        modified_scene_numbers: Set[int] = set()
+        
         logger.info(
             f"Refinement addressed {len(critical_issues)} critical "
             f"and {len(error_issues)} error issues"
         )
         
-        return scene_scripts, comedy_analysis
+        return scene_scripts, comedy_analysis, modified_scene_numbers
+    
+    async def _optimize_comedy(
+        self,
+        all_dialogues: List[SceneDialogue],
+        character_profiles: Dict[str, CharacterVoiceProfile],
+    ):
+        """
+        Run comedy optimization, reusing the last result if nothing changed.
+        
+        The result is keyed on a hash of every dialogue and voice profile,
+        so a refinement pass that regenerated no scenes gets the previous
+        analysis back instead of a full second comedy pass.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for dialogue in all_dialogues:
+            digest.update(_canonical_json(dialogue.to_dict()))
+        digest.update(_profiles_fingerprint(character_profiles))
+        fingerprint = digest.digest()
+        
+        if (
+            self._last_comedy_analysis is not None and
+            self._last_comedy_analysis[0] == fingerprint
+        ):
+            logger.debug("Dialogue unchanged, reusing comedy analysis")
+            return self._last_comedy_analysis[1]
+        
+        comedy_analysis = await self.joke_optimizer.optimize_script_comedy(
+            all_dialogues, character_profiles
+        )
+        self._last_comedy_analysis = (fingerprint, comedy_analysis)
+        return comedy_analysis
+    
+    async def close(self):
+        """Close the AI clients and the connection pool they share."""
+        await self.claude_client.close()
+        await self.gpt_client.close()
+        await self.http_client.aclose()
     
     def get_performance_metrics(self) -> Optional[PerformanceMetrics]:
         """
@@ -8,8 +8,9 @@ script generation pipeline, including complete scripts with all metadata,
 refinement history, and export capabilities.
 """
 
+import json
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Any
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 from datetime import datetime
 from enum import Enum
 
@@ -17,6 +18,46 @@ from src.services.creative.character_voice_profiles import SceneDialogue
 from src.services.creative.stage_direction_models import SceneStageDirections
 from src.services.creative.validation_models import ScriptValidationReport
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Section rules shared by the text export formats
+_RULE = "=" * 60
+_BANNER = "#" * 60
+_DIVIDER = "-" * 60
+
+# Validation outcome labels, indexed by the passed flag
+_PASS_FAIL = ("FAILED", "PASSED")
+
+# Characters of export text gathered before each encode-and-write
+_WRITE_BLOCK_CHARS = 1 << 16
+
+
+def _as_datetime(value: Union[str, datetime]) -> datetime:
+    """Parse an ISO timestamp, passing through values already parsed."""
+    if isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(value)
+
+
+def _encode_blocks(chunks: Iterable[str]) -> Iterator[bytes]:
+    """Batch text chunks into UTF-8 blocks of about _WRITE_BLOCK_CHARS."""
+    pending: List[str] = []
+    size = 0
+    for chunk in chunks:
+        pending.append(chunk)
+        size += len(chunk)
+        if size >= _WRITE_BLOCK_CHARS:
+            yield "".join(pending).encode("utf-8")
+            pending.clear()
+            size = 0
+    if pending:
+        yield "".join(pending).encode("utf-8")
+
 
 class ScriptFormat(Enum):
     """Export format options for scripts."""
@@ -26,7 +67,7 @@ class ScriptFormat(Enum):
     MARKDOWN = "markdown"  # Markdown format for documentation
 
 
-@dataclass
+@dataclass(slots=True)
 class SceneScript:
     """
     Complete script for a single scene.
@@ -48,48 +89,77 @@ class SceneScript:
     comedy_beat_count: int
     production_notes: List[str] = field(default_factory=list)
     
+    # Rendered screenplay, shared by every export format until invalidate()
+    _screenplay_cache: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    @property
+    def characters_joined(self) -> str:
+        """Characters present as one comma-separated string."""
+        return ', '.join(self.characters_present)
+    
+    def invalidate(self) -> None:
+        """Drop the rendered screenplay after editing the scene."""
+        self._screenplay_cache = None
+    
     def to_screenplay_format(self) -> str:
         """
         Export scene in traditional screenplay format.
         
+        The text is rendered once and reused by later exports; call
+        invalidate() after editing the scene.
+        
         Returns:
             Formatted screenplay text
         """
-        lines = []
+        if self._screenplay_cache is None:
+            self._screenplay_cache = "".join(self._iter_screenplay_format())
+        return self._screenplay_cache
+    
+    def _iter_screenplay_format(self) -> Iterator[str]:
+        """Yield the screenplay text in chunks, one per dialogue line."""
+        stage_directions = self.stage_directions
         
         # Scene header
-        lines.append(f"\n\nSCENE {self.scene_number} - {self.scene_title.upper()}\n")
-        lines.append(f"INT./EXT. {self.location.upper()} - {self.time_of_day.upper()}\n")
+        yield (
+            f"\n\nSCENE {self.scene_number} - {self.scene_title.upper()}\n"
+            f"INT./EXT. {self.location.upper()} - {self.time_of_day.upper()}\n"
+        )
         
         # Stage directions
-        if self.stage_directions.opening_description:
-            lines.append(f"\n{self.stage_directions.opening_description}\n")
-        
-        # Dialogue with interleaved action
+        if stage_directions.opening_description:
+            yield f"\n{stage_directions.opening_description}\n"
+        
+        # Dialogue with interleaved action; the timing index makes that a
+        # lookup per line instead of a scan of every beat
+        timing_index = stage_directions.timing_index
+        # A scene has a handful of speakers, so upper-case each name once
+        speaker_names: Dict[str, str] = {}
         for dialogue_line in self.dialogue.dialogue_lines:
-            # Add any stage directions that occur at this timing
-            for direction in self.stage_directions.action_beats:
-                if hasattr(direction, 'timing') and hasattr(dialogue_line, 'timing_in_scene'):
-                    if direction.timing == dialogue_line.timing_in_scene:
-                        lines.append(f"\n{direction.description}\n")
-            
-            # Character name (centered in screenplay)
-            lines.append(f"\n{dialogue_line.character.upper()}\n")
+            if timing_index and hasattr(dialogue_line, 'timing_in_scene'):
+                for description in timing_index.get(
+                    dialogue_line.timing_in_scene, ()
+                ):
+                    yield f"\n{description}\n"
             
-            # Parenthetical if present
-            if dialogue_line.emotion:
-                lines.append(f"({dialogue_line.emotion})\n")
-            
-            # Dialogue
-            lines.append(f"{dialogue_line.line}\n")
+            # Character name (centered in screenplay), parenthetical, line
+            character = dialogue_line.character
+            speaker = speaker_names.get(character)
+            if speaker is None:
+                speaker = speaker_names[character] = character.upper()
+            emotion = dialogue_line.emotion
+            parenthetical = f"({emotion})\n" if emotion else ""
+            yield (
+                f"\n{speaker}\n"
+                f"{parenthetical}{dialogue_line.line}\n"
+            )
         
         # Final stage directions (after all dialogue)
-        for direction in self.stage_directions.action_beats:
+        for direction in stage_directions.action_beats:
             # Note: action_beats don't have timing_in_scene, 
             # this was incorrect logic from before
-            lines.append(f"\n{direction.description}\n")
-        
-        return "".join(lines)
+            yield f"\n{direction.description}\n"
     
     def to_production_format(self) -> str:
         """
@@ -98,42 +168,45 @@ class SceneScript:
         Returns:
             Formatted production script text
         """
-        lines = []
+        return "".join(self._iter_production_format())
+    
+    def _iter_production_format(self) -> Iterator[str]:
+        """Yield the production script text in chunks."""
+        stage_directions = self.stage_directions
         
         # Production header
-        lines.append(f"\n{'='*60}\n")
-        lines.append(f"SCENE {self.scene_number}: {self.scene_title}\n")
-        lines.append(f"{'='*60}\n")
-        lines.append(f"Location: {self.location}\n")
-        lines.append(f"Time: {self.time_of_day}\n")
-        lines.append(f"Characters: {', '.join(self.characters_present)}\n")
-        lines.append(f"Estimated Runtime: {self.estimated_runtime:.1f}s ({self.estimated_runtime/60:.1f}m)\n")
-        lines.append(f"Comedy Beats: {self.comedy_beat_count}\n")
+        yield (
+            f"\n{_RULE}\n"
+            f"SCENE {self.scene_number}: {self.scene_title}\n"
+            f"{_RULE}\n"
+            f"Location: {self.location}\n"
+            f"Time: {self.time_of_day}\n"
+            f"Characters: {self.characters_joined}\n"
+            f"Estimated Runtime: {self.estimated_runtime:.1f}s ({self.estimated_runtime/60:.1f}m)\n"
+            f"Comedy Beats: {self.comedy_beat_count}\n"
+        )
         
         # Production notes
         if self.production_notes:
-            lines.append(f"\nPRODUCTION NOTES:\n")
-            for note in self.production_notes:
-                lines.append(f"  • {note}\n")
+            notes = "\n  • ".join(self.production_notes)
+            yield f"\nPRODUCTION NOTES:\n  • {notes}\n"
         
         # Camera suggestions
-        if self.stage_directions.camera_suggestions:
-            lines.append(f"\nCAMERA SETUP:\n")
-            for cam in self.stage_directions.camera_suggestions:
-                lines.append(f"  [{cam.shot_type.upper()}] {cam.shot_description}\n")
+        if stage_directions.camera_suggestions:
+            yield "\nCAMERA SETUP:\n"
+            for cam in stage_directions.camera_suggestions:
+                yield f"  [{cam.shot_type.upper()}] {cam.shot_description}\n"
                 if cam.movement_type:
-                    lines.append(f"    Movement: {cam.movement_type}\n")
+                    yield f"    Movement: {cam.movement_type}\n"
         
         # Physical comedy sequences
-        if self.stage_directions.physical_comedy_sequences:
-            lines.append(f"\nPHYSICAL COMEDY:\n")
-            for seq in self.stage_directions.physical_comedy_sequences:
-                lines.append(f"  • {seq.comedy_action} (Setup: {seq.setup_time:.1f}s, Execute: {seq.execution_time:.1f}s)\n")
-        
-        lines.append(f"\n{'-'*60}\n")
-        lines.append(self.to_screenplay_format())
+        if stage_directions.physical_comedy_sequences:
+            yield "\nPHYSICAL COMEDY:\n"
+            for seq in stage_directions.physical_comedy_sequences:
+                yield f"  • {seq.comedy_action} (Setup: {seq.setup_time:.1f}s, Execute: {seq.execution_time:.1f}s)\n"
         
-        return "".join(lines)
+        yield f"\n{_DIVIDER}\n"
+        yield self.to_screenplay_format()
     
     def to_dict(self) -> Dict[str, Any]:
         """Serialize to dictionary."""
@@ -153,21 +226,22 @@ class SceneScript:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "SceneScript":
         """Deserialize from dictionary."""
+        # Positional, in field order: cheaper than keyword construction
         return cls(
-            scene_number=data["scene_number"],
-            scene_title=data["scene_title"],
-            location=data["location"],
-            time_of_day=data["time_of_day"],
-            characters_present=data["characters_present"],
-            dialogue=SceneDialogue.from_dict(data["dialogue"]),
-            stage_directions=SceneStageDirections.from_dict(data["stage_directions"]),
-            estimated_runtime=data["estimated_runtime"],
-            comedy_beat_count=data["comedy_beat_count"],
-            production_notes=data.get("production_notes", []),
+            data["scene_number"],
+            data["scene_title"],
+            data["location"],
+            data["time_of_day"],
+            data["characters_present"],
+            SceneDialogue.from_dict(data["dialogue"]),
+            SceneStageDirections.from_dict(data["stage_directions"]),
+            data["estimated_runtime"],
+            data["comedy_beat_count"],
+            data.get("production_notes", []),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class RefinementIteration:
     """
     Record of a single script refinement iteration.
@@ -203,19 +277,20 @@ class RefinementIteration:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "RefinementIteration":
         """Deserialize from dictionary."""
+        # Positional, in field order: cheaper than keyword construction
         return cls(
-            iteration_number=data["iteration_number"],
-            timestamp=datetime.fromisoformat(data["timestamp"]),
-            validation_report=ScriptValidationReport.from_dict(data["validation_report"]),
-            quality_score=data["quality_score"],
-            validation_passed=data["validation_passed"],
-            issues_addressed=data["issues_addressed"],
-            improvements_made=data["improvements_made"],
-            scenes_modified=data["scenes_modified"],
+            data["iteration_number"],
+            _as_datetime(data["timestamp"]),
+            ScriptValidationReport.from_dict(data["validation_report"]),
+            data["quality_score"],
+            data["validation_passed"],
+            data["issues_addressed"],
+            data["improvements_made"],
+            data["scenes_modified"],
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class FullScript:
     """
     Complete episode script with all metadata and refinement history.
@@ -256,26 +331,151 @@ class FullScript:
     # Additional metadata
     generation_notes: List[str] = field(default_factory=list)
     
-    def get_scene(self, scene_number: int) -> Optional[SceneScript]:
-        """Get scene by number."""
+    # Scene lookup indexes, each built on its first lookup. They are dropped
+    # when self.scenes is replaced or changes length, or on invalidate()
+    _indexed_scenes: Optional[List[SceneScript]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _indexed_scene_count: int = field(
+        default=0, init=False, repr=False, compare=False
+    )
+    _scenes_by_number: Optional[Dict[int, SceneScript]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _scenes_by_character: Optional[Dict[str, List[SceneScript]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _scenes_by_location: Optional[Dict[str, List[SceneScript]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    # Formatted title-page date and runtime, each with the value it was
+    # formatted from so a changed timestamp or runtime is re-formatted
+    _generated_date: Optional[Tuple[datetime, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _runtime_minutes: Optional[Tuple[float, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    @property
+    def writers_joined(self) -> str:
+        """Writers as one comma-separated string."""
+        return ', '.join(self.writers)
+    
+    @property
+    def generated_date(self) -> str:
+        """Generation date for the title page, e.g. 'January 01, 2025'."""
+        timestamp = self.generation_timestamp
+        cached = self._generated_date
+        if cached is None or cached[0] is not timestamp:
+            # strftime consults the locale for %B, so format each value once
+            cached = self._generated_date = (
+                timestamp, timestamp.strftime('%B %d, %Y')
+            )
+        return cached[1]
+    
+    @property
+    def runtime_minutes(self) -> str:
+        """Total runtime in minutes to one decimal place, e.g. '22.5'."""
+        runtime = self.total_runtime
+        cached = self._runtime_minutes
+        if cached is None or cached[0] != runtime:
+            cached = self._runtime_minutes = (runtime, f"{runtime / 60:.1f}")
+        return cached[1]
+    
+    def _reset_scene_index(self) -> None:
+        """Drop the scene lookup indexes after self.scenes has changed."""
+        self._indexed_scenes = None
+        self._scenes_by_number = None
+        self._scenes_by_character = None
+        self._scenes_by_location = None
+    
+    def _check_scene_index(self) -> None:
+        """Drop the scene lookup indexes if self.scenes was replaced or resized."""
+        scenes = self.scenes
+        if (
+            scenes is not self._indexed_scenes
+            or len(scenes) != self._indexed_scene_count
+        ):
+            self._reset_scene_index()
+            # Holding the list itself (not its id) rules out a reused id
+            self._indexed_scenes = scenes
+            self._indexed_scene_count = len(scenes)
+    
+    def invalidate(self) -> None:
+        """
+        Drop cached lookups and renders after editing scenes in place.
+        
+        Appending, removing or replacing the scenes list is detected
+        automatically; replacing a scene at the same position, or editing a
+        scene's content, is not.
+        """
+        self._reset_scene_index()
+        for scene in self.scenes:
+            scene.invalidate()
+    
+    def refresh_totals(self) -> None:
+        """
+        Recompute runtime and location count from the scenes in one pass.
+        
+        Call after editing scenes; also calls invalidate(), so later exports
+        and lookups see the edits. total_comedy_beats comes from the comedy
+        analysis rather than the scenes, so it is left unchanged.
+        """
+        runtime = 0.0
+        locations = set()
         for scene in self.scenes:
-            if scene.scene_number == scene_number:
-                return scene
-        return None
+            runtime += scene.estimated_runtime
+            locations.add(scene.location)
+        self.total_runtime = runtime
+        self.location_count = len(locations)
+        self.invalidate()
+    
+    def get_scene(self, scene_number: int) -> Optional[SceneScript]:
+        """
+        Get scene by number.
+        
+        Uses a cached index; call invalidate() after editing scenes in place.
+        """
+        self._check_scene_index()
+        if self._scenes_by_number is None:
+            by_number: Dict[int, SceneScript] = {}
+            for scene in self.scenes:
+                # First scene wins on duplicate numbers
+                by_number.setdefault(scene.scene_number, scene)
+            self._scenes_by_number = by_number
+        return self._scenes_by_number.get(scene_number)
     
     def get_scenes_by_character(self, character_name: str) -> List[SceneScript]:
-        """Get all scenes featuring a character."""
-        return [
-            scene for scene in self.scenes
-            if character_name in scene.characters_present
-        ]
+        """
+        Get all scenes featuring a character.
+        
+        Uses a cached index; call invalidate() after editing scenes in place.
+        """
+        self._check_scene_index()
+        if self._scenes_by_character is None:
+            by_character: Dict[str, List[SceneScript]] = {}
+            for scene in self.scenes:
+                # A character listed twice still maps to the scene once
+                for character in dict.fromkeys(scene.characters_present):
+                    by_character.setdefault(character, []).append(scene)
+            self._scenes_by_character = by_character
+        return list(self._scenes_by_character.get(character_name, ()))
     
     def get_scenes_by_location(self, location: str) -> List[SceneScript]:
-        """Get all scenes at a location."""
-        return [
-            scene for scene in self.scenes
-            if scene.location.lower() == location.lower()
-        ]
+        """
+        Get all scenes at a location (case-insensitive).
+        
+        Uses a cached index; call invalidate() after editing scenes in place.
+        """
+        self._check_scene_index()
+        if self._scenes_by_location is None:
+            by_location: Dict[str, List[SceneScript]] = {}
+            for scene in self.scenes:
+                by_location.setdefault(scene.location.lower(), []).append(scene)
+            self._scenes_by_location = by_location
+        return list(self._scenes_by_location.get(location.lower(), ()))
     
     def to_screenplay_format(self) -> str:
         """
@@ -284,38 +484,42 @@ class FullScript:
         Returns:
             Full screenplay text
         """
-        lines = []
-        
+        return "".join(self._iter_screenplay_format())
+    
+    def _iter_screenplay_format(self) -> Iterator[str]:
+        """Yield the screenplay in chunks: title page, scenes, credits."""
         # Title page
-        lines.append(f"\n\n\n")
-        lines.append(f"{self.episode_title.upper()}\n")
-        lines.append(f"\n")
-        lines.append(f"A {self.show_title} Episode\n")
-        lines.append(f"\n")
-        lines.append(f"Season {self.season_number}, Episode {self.episode_number}\n")
-        lines.append(f"\n")
-        lines.append(f"Written by: {', '.join(self.writers)}\n")
-        lines.append(f"\n")
-        lines.append(f"Based on: {self.original_show}\n")
-        lines.append(f"Setting: {self.doppelganger_setting}\n")
-        lines.append(f"\n")
-        lines.append(f"Generated: {self.generation_timestamp.strftime('%B %d, %Y')}\n")
-        lines.append(f"\n\n")
-        lines.append(f"{'='*60}\n")
+        yield (
+            f"\n\n\n"
+            f"{self.episode_title.upper()}\n"
+            f"\n"
+            f"A {self.show_title} Episode\n"
+            f"\n"
+            f"Season {self.season_number}, Episode {self.episode_number}\n"
+            f"\n"
+            f"Written by: {self.writers_joined}\n"
+            f"\n"
+            f"Based on: {self.original_show}\n"
+            f"Setting: {self.doppelganger_setting}\n"
+            f"\n"
+            f"Generated: {self.generated_date}\n"
+            f"\n\n"
+            f"{_RULE}\n"
+        )
         
         # All scenes
         for scene in self.scenes:
-            lines.append(scene.to_screenplay_format())
-            lines.append(f"\n")
+            yield scene.to_screenplay_format()
+            yield "\n"
         
         # End credits
-        lines.append(f"\n\n{'='*60}\n")
-        lines.append(f"FADE OUT.\n")
-        lines.append(f"\nTHE END\n")
-        lines.append(f"\nTotal Runtime: {self.total_runtime/60:.1f} minutes\n")
-        lines.append(f"Quality Score: {self.final_quality_score:.2f}\n")
-        
-        return "".join(lines)
+        yield (
+            f"\n\n{_RULE}\n"
+            f"FADE OUT.\n"
+            f"\nTHE END\n"
+            f"\nTotal Runtime: {self.runtime_minutes} minutes\n"
+            f"Quality Score: {self.final_quality_score:.2f}\n"
+        )
     
     def to_production_script(self) -> str:
         """
@@ -324,65 +528,67 @@ class FullScript:
         Returns:
             Full production script with technical details
         """
-        lines = []
-        
+        return "".join(self._iter_production_script())
+    
+    def _iter_production_script(self) -> Iterator[str]:
+        """Yield the production script in chunks, one or more per scene."""
         # Production cover page
-        lines.append(f"\n{'#'*60}\n")
-        lines.append(f"# PRODUCTION SCRIPT\n")
-        lines.append(f"{'#'*60}\n\n")
-        lines.append(f"Title: {self.episode_title}\n")
-        lines.append(f"Show: {self.show_title}\n")
-        lines.append(f"Episode: S{self.season_number:02d}E{self.episode_number:02d}\n")
-        lines.append(f"Writers: {', '.join(self.writers)}\n")
-        lines.append(f"\n")
-        lines.append(f"PRODUCTION DETAILS:\n")
-        lines.append(f"  Total Runtime: {self.total_runtime/60:.1f} minutes\n")
-        lines.append(f"  Total Scenes: {len(self.scenes)}\n")
-        lines.append(f"  Comedy Beats: {self.total_comedy_beats}\n")
-        lines.append(f"  Budget Estimate: {self.budget_estimate.upper()}\n")
-        lines.append(f"  Locations: {self.location_count}\n")
-        lines.append(f"  Special Effects: {self.special_effects_count}\n")
-        lines.append(f"  Quality Score: {self.final_quality_score:.2f}/1.00\n")
-        lines.append(f"\n")
+        yield (
+            f"\n{_BANNER}\n"
+            f"# PRODUCTION SCRIPT\n"
+            f"{_BANNER}\n\n"
+            f"Title: {self.episode_title}\n"
+            f"Show: {self.show_title}\n"
+            f"Episode: S{self.season_number:02d}E{self.episode_number:02d}\n"
+            f"Writers: {self.writers_joined}\n"
+            f"\n"
+            f"PRODUCTION DETAILS:\n"
+            f"  Total Runtime: {self.runtime_minutes} minutes\n"
+            f"  Total Scenes: {len(self.scenes)}\n"
+            f"  Comedy Beats: {self.total_comedy_beats}\n"
+            f"  Budget Estimate: {self.budget_estimate.upper()}\n"
+            f"  Locations: {self.location_count}\n"
+            f"  Special Effects: {self.special_effects_count}\n"
+            f"  Quality Score: {self.final_quality_score:.2f}/1.00\n"
+            f"\n"
+        )
         
         # Refinement history
         if self.refinement_iterations:
-            lines.append(f"REFINEMENT HISTORY:\n")
-            for iteration in self.refinement_iterations:
-                lines.append(
-                    f"  Iteration {iteration.iteration_number}: "
-                    f"Score {iteration.quality_score:.2f} → "
-                    f"{'PASSED' if iteration.validation_passed else 'FAILED'}\n"
-                )
-            lines.append(f"\n")
+            yield "REFINEMENT HISTORY:\n"
+            yield "".join([
+                f"  Iteration {iteration.iteration_number}: "
+                f"Score {iteration.quality_score:.2f} → "
+                f"{_PASS_FAIL[iteration.validation_passed]}\n"
+                for iteration in self.refinement_iterations
+            ])
+            yield "\n"
         
         # Validation summary
-        lines.append(f"VALIDATION SUMMARY:\n")
-        lines.append(f"{self.final_validation_report.summary}\n")
-        lines.append(f"\n")
+        yield f"VALIDATION SUMMARY:\n{self.final_validation_report.summary}\n\n"
         
         if self.final_validation_report.recommendations:
-            lines.append(f"RECOMMENDATIONS:\n")
-            for rec in self.final_validation_report.recommendations:
-                lines.append(f"  • {rec}\n")
-            lines.append(f"\n")
+            recommendations = "\n  • ".join(
+                self.final_validation_report.recommendations
+            )
+            yield f"RECOMMENDATIONS:\n  • {recommendations}\n\n"
         
-        lines.append(f"{'#'*60}\n\n")
+        yield f"{_BANNER}\n\n"
         
-        # All scenes in production format
+        # All scenes in production format. Rendered serially on purpose: a
+        # scene takes microseconds, so pool startup and pickling would
+        # dominate, and worker-side screenplay memos would be lost
         for scene in self.scenes:
-            lines.append(scene.to_production_format())
-            lines.append(f"\n")
+            yield from scene._iter_production_format()
+            yield "\n"
         
         # Production notes
         if self.generation_notes:
-            lines.append(f"\n{'#'*60}\n")
-            lines.append(f"# PRODUCTION NOTES\n")
-            lines.append(f"{'#'*60}\n\n")
-            for note in self.generation_notes:
-                lines.append(f"• {note}\n")
-        
-        return "".join(lines)
+            notes = "\n• ".join(self.generation_notes)
+            yield (
+                f"\n{_BANNER}\n# PRODUCTION NOTES\n{_BANNER}\n\n"
+                f"• {notes}\n"
+            )
     
     def to_dict(self) -> Dict[str, Any]:
         """Serialize to dictionary."""
@@ -413,84 +619,103 @@ class FullScript:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "FullScript":
         """Deserialize from dictionary."""
+        scene_from_dict = SceneScript.from_dict
+        iteration_from_dict = RefinementIteration.from_dict
+        # Positional, in field order: cheaper than keyword construction
         return cls(
-            script_id=data["script_id"],
-            episode_title=data["episode_title"],
-            show_title=data["show_title"],
-            episode_number=data["episode_number"],
-            season_number=data["season_number"],
-            writers=data["writers"],
-            original_show=data["original_show"],
-            doppelganger_setting=data["doppelganger_setting"],
-            scenes=[SceneScript.from_dict(s) for s in data["scenes"]],
-            generation_timestamp=datetime.fromisoformat(data["generation_timestamp"]),
-            total_runtime=data["total_runtime"],
-            total_comedy_beats=data["total_comedy_beats"],
-            final_validation_report=ScriptValidationReport.from_dict(
-                data["final_validation_report"]
-            ),
-            final_quality_score=data["final_quality_score"],
-            refinement_iterations=[
-                RefinementIteration.from_dict(i)
-                for i in data.get("refinement_iterations", [])
-            ],
-            budget_estimate=data["budget_estimate"],
-            location_count=data["location_count"],
-            special_effects_count=data["special_effects_count"],
-            generation_notes=data.get("generation_notes", []),
+            data["script_id"],
+            data["episode_title"],
+            data["show_title"],
+            data["episode_number"],
+            data["season_number"],
+            data["writers"],
+            data["original_show"],
+            data["doppelganger_setting"],
+            [scene_from_dict(s) for s in data["scenes"]],
+            _as_datetime(data["generation_timestamp"]),
+            data["total_runtime"],
+            data["total_comedy_beats"],
+            ScriptValidationReport.from_dict(data["final_validation_report"]),
+            data["final_quality_score"],
+            data["budget_estimate"],
+            data["location_count"],
+            data["special_effects_count"],
+            [iteration_from_dict(i) for i in data.get("refinement_iterations", [])],
+            data.get("generation_notes", []),
         )
     
     def export(self, format: ScriptFormat, output_path: str) -> None:
         """
         Export script to file in specified format.
         
+        Text is encoded and written in blocks as it is rendered, so the
+        whole script never has to exist as one string.
+        
         Args:
             format: Export format
             output_path: Output file path
         """
-        import json
-        
-        if format == ScriptFormat.SCREENPLAY:
-            content = self.to_screenplay_format()
-        elif format == ScriptFormat.PRODUCTION:
-            content = self.to_production_script()
-        elif format == ScriptFormat.JSON:
-            content = json.dumps(self.to_dict(), indent=2)
-        elif format == ScriptFormat.MARKDOWN:
-            content = self._to_markdown()
-        else:
+        if format is ScriptFormat.JSON:
+            self._export_json(output_path)
+            return
+        
+        iter_chunks = _TEXT_EXPORTERS.get(format)
+        if iter_chunks is None:
             raise ValueError(f"Unsupported format: {format}")
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        with open(output_path, 'wb') as f:
+            f.writelines(_encode_blocks(iter_chunks(self)))
+    
+    def _export_json(self, output_path: str) -> None:
+        """Write to_dict() as indented JSON."""
+        if ORJSON_AVAILABLE:
+            # orjson emits UTF-8 bytes directly; write them as-is
+            with open(output_path, 'wb') as f:
+                f.write(orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2))
+            return
+        
+        with open(output_path, 'wb') as f:
+            f.writelines(_encode_blocks(
+                json.JSONEncoder(indent=2).iterencode(self.to_dict())
+            ))
     
     def _to_markdown(self) -> str:
         """Export in Markdown format for documentation."""
-        lines = []
-        
-        # Title
-        lines.append(f"# {self.episode_title}\n\n")
-        lines.append(f"**Show:** {self.show_title}  \n")
-        lines.append(f"**Episode:** S{self.season_number:02d}E{self.episode_number:02d}  \n")
-        lines.append(f"**Writers:** {', '.join(self.writers)}  \n")
-        lines.append(f"**Based on:** {self.original_show}  \n")
-        lines.append(f"**Setting:** {self.doppelganger_setting}  \n\n")
-        
-        # Metadata
-        lines.append(f"## Episode Details\n\n")
-        lines.append(f"- **Runtime:** {self.total_runtime/60:.1f} minutes\n")
-        lines.append(f"- **Scenes:** {len(self.scenes)}\n")
-        lines.append(f"- **Comedy Beats:** {self.total_comedy_beats}\n")
-        lines.append(f"- **Quality Score:** {self.final_quality_score:.2f}/1.00\n")
-        lines.append(f"- **Budget:** {self.budget_estimate.title()}\n\n")
-        
-        # Scenes
-        lines.append(f"## Scenes\n\n")
-        for scene in self.scenes:
-            lines.append(f"### Scene {scene.scene_number}: {scene.scene_title}\n\n")
-            lines.append(f"**Location:** {scene.location}  \n")
-            lines.append(f"**Characters:** {', '.join(scene.characters_present)}  \n")
-            lines.append(f"**Runtime:** {scene.estimated_runtime:.1f}s  \n\n")
-            lines.append(f"```\n{scene.to_screenplay_format()}\n```\n\n")
+        return "".join(self._iter_markdown())
+    
+    def _iter_markdown(self) -> Iterator[str]:
+        """Yield the Markdown export in chunks, one per scene."""
+        # Title and metadata
+        yield (
+            f"# {self.episode_title}\n\n"
+            f"**Show:** {self.show_title}  \n"
+            f"**Episode:** S{self.season_number:02d}E{self.episode_number:02d}  \n"
+            f"**Writers:** {self.writers_joined}  \n"
+            f"**Based on:** {self.original_show}  \n"
+            f"**Setting:** {self.doppelganger_setting}  \n\n"
+            f"## Episode Details\n\n"
+            f"- **Runtime:** {self.runtime_minutes} minutes\n"
+            f"- **Scenes:** {len(self.scenes)}\n"
+            f"- **Comedy Beats:** {self.total_comedy_beats}\n"
+            f"- **Quality Score:** {self.final_quality_score:.2f}/1.00\n"
+            f"- **Budget:** {self.budget_estimate.title()}\n\n"
+            f"## Scenes\n\n"
+        )
         
-        return "".join(lines)
+        # Scenes embed each scene's memoized screenplay rather than re-rendering
+        for scene in self.scenes:
+            yield (
+                f"### Scene {scene.scene_number}: {scene.scene_title}\n\n"
+                f"**Location:** {scene.location}  \n"
+                f"**Characters:** {scene.characters_joined}  \n"
+                f"**Runtime:** {scene.estimated_runtime:.1f}s  \n\n"
+                f"```\n{scene.to_screenplay_format()}\n```\n\n"
+            )
+
+
+# Chunk generators for the text export formats (JSON is handled separately)
+_TEXT_EXPORTERS: Dict[ScriptFormat, Callable[[FullScript], Iterator[str]]] = {
+    ScriptFormat.SCREENPLAY: FullScript._iter_screenplay_format,
+    ScriptFormat.PRODUCTION: FullScript._iter_production_script,
+    ScriptFormat.MARKDOWN: FullScript._iter_markdown,
+}
@@ -7,15 +7,24 @@ This module generates stage directions, physical comedy sequences,
 and camera suggestions to bring scenes to life visually.
 """
 
+import asyncio
+from contextlib import aclosing
 import logging
-from typing import List, Optional, TYPE_CHECKING
+from typing import Callable, List, Optional, Sequence, Tuple, TypeVar, TYPE_CHECKING
 import json
 
+from src.services.caching import CacheTTL, generate_cache_key
 from src.services.creative.claude_client import ClaudeClient
 from src.services.creative.openai_client import OpenAIClient
 
 if TYPE_CHECKING:
     from src.core.database_manager import DatabaseManager
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 from src.services.creative.stage_direction_models import (
     StageDirection,
     PhysicalComedySequence,
@@ -26,6 +35,237 @@ from src.services.creative.character_voice_profiles import SceneDialogue
 
 logger = logging.getLogger(__name__)
 
+_CACHE_MODES = ("read_write", "read_only", "off")
+
+_ResultT = TypeVar('_ResultT')
+
+
+def _loads(data):
+    """Parse JSON text or bytes, with orjson when installed."""
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+
+def _dumps(value) -> bytes:
+    """Serialize to compact UTF-8 JSON, with orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value)
+    return json.dumps(value).encode()
+
+
+def _dumps_indented(value) -> str:
+    """Serialize with two-space indentation for prompts."""
+    # orjson leaves non-ASCII text unescaped, which the model reads fine
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(value, indent=2)
+
+
+def _mk_camera(data: dict) -> CameraSuggestion:
+    """Build a camera suggestion from response JSON."""
+    get = data.get
+    return CameraSuggestion(
+        get('shot_type', 'MEDIUM'),
+        get('focus', ''),
+        get('reasoning', ''),
+        get('movement'),
+        get('timing')
+    )
+
+
+def _mk_stage_direction(
+    data: dict,
+    visual_gag: bool,
+    camera: Optional[CameraSuggestion] = None,
+    duration_estimate: float = 1.0
+) -> StageDirection:
+    """Build a stage direction from response JSON."""
+    get = data.get
+    return StageDirection(
+        get('timing', 'CONTINUOUS'),
+        get('description', ''),
+        get('duration_estimate', duration_estimate),
+        get('involves_characters', []),
+        visual_gag,
+        camera
+    )
+
+
+def _mk_action_beat(data: dict) -> StageDirection:
+    """Build an action beat, with its optional camera work, from response JSON."""
+    camera = data.get('camera_suggestion')
+    return _mk_stage_direction(
+        data,
+        data.get('visual_gag', False),
+        _mk_camera(camera) if camera else None
+    )
+
+
+def _mk_comedy_sequence(data: dict) -> PhysicalComedySequence:
+    """Build a physical comedy sequence from response JSON."""
+    get = data.get
+    return PhysicalComedySequence(
+        get('beat_name', 'Physical Comedy'),
+        [_mk_stage_direction(a, True) for a in get('setup_actions', [])],
+        [_mk_stage_direction(a, True) for a in get('escalation_actions', [])],
+        _mk_stage_direction(get('climax_action', {}), True, None, 2.0),
+        _mk_stage_direction(get('resolution_action', {}), True),
+        get('total_duration', 10.0)
+    )
+
+_CLOSERS = {'{': '}', '[': ']'}
+
+
+class _ArrayItemScanner:
+    """
+    Pick the objects out of one top-level array as streamed JSON arrives.
+    
+    Only string and bracket nesting are tracked, so each object is parsed
+    as soon as its closing brace arrives; the rest of the document is left
+    for a full parse once the stream ends.
+    """
+    
+    def __init__(self, key: str):
+        self.key = key
+        self.text = ''
+        self._pos = 0
+        self._stack: List[str] = []
+        self._in_string = False
+        self._escaped = False
+        self._string_start = 0
+        self._last_key: Optional[str] = None
+        self._value_key: Optional[str] = None
+        self._in_array = False
+        self._item_start = -1
+    
+    def feed(self, delta: str) -> List[dict]:
+        """
+        Add streamed text; return the array objects it completed.
+        
+        Raises:
+            ValueError: If the text so far cannot be a JSON object
+        """
+        self.text += delta
+        text = self.text
+        stack = self._stack
+        items = []
+        
+        for i in range(self._pos, len(text)):
+            char = text[i]
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == '\\':
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+                    if len(stack) == 1:
+                        self._last_key = text[self._string_start:i]
+            elif char == '"':
+                self._in_string = True
+                self._string_start = i + 1
+            elif char == '{' or char == '[':
+                if not stack and char != '{':
+                    raise ValueError("Response is not a JSON object")
+                depth = len(stack)
+                if depth == 1 and self._value_key == self.key:
+                    self._in_array = char == '['
+                elif depth == 2 and self._in_array and char == '{':
+                    self._item_start = i
+                stack.append(char)
+            elif char == '}' or char == ']':
+                if not stack or _CLOSERS[stack.pop()] != char:
+                    raise ValueError(f"Unbalanced {char!r} at offset {i}")
+                depth = len(stack)
+                if depth == 2 and self._item_start >= 0:
+                    items.append(_loads(text[self._item_start:i + 1]))
+                    self._item_start = -1
+                elif depth == 1:
+                    self._in_array = False
+            elif char == ':' and len(stack) == 1:
+                self._value_key = self._last_key
+            elif not stack and not char.isspace():
+                raise ValueError("Response is not a JSON object")
+        
+        self._pos = len(text)
+        return items
+
+
+# Scene-independent instructions, sent first and unchanged on every call so
+# the provider can serve them from its prompt cache
+_STAGE_DIRECTION_PREFIX = """
+You are a TV director creating stage directions. Generate visual choreography for the scene described after these instructions.
+
+Create:
+1. Opening visual description (set the scene)
+2. Action beats between dialogue lines
+3. Physical comedy sequences (if applicable)
+4. Camera suggestions for key moments
+5. Closing visual
+
+Respond with JSON:
+{
+  "opening_description": "Visual description of opening",
+  "action_beats": [
+    {
+      "timing": "BEFORE LINE|DURING LINE|AFTER LINE",
+      "description": "What happens",
+      "duration_estimate": 1.5,
+      "involves_characters": ["Character"],
+      "visual_gag": false,
+      "camera_suggestion": {
+        "shot_type": "WIDE|MEDIUM|CLOSE-UP",
+        "focus": "what to focus on",
+        "reasoning": "why this shot",
+        "movement": null
+      }
+    }
+  ],
+  "physical_comedy_sequences": [
+    {
+      "beat_name": "Gag name",
+      "setup_actions": [...],
+      "escalation_actions": [...],
+      "climax_action": {},
+      "resolution_action": {},
+      "total_duration": 10.0
+    }
+  ],
+  "camera_suggestions": [...],
+  "closing_description": "How scene ends visually"
+}
+
+Make it visual, dynamic, and production-ready!
+"""
+
+# Gag-independent choreography instructions, cached the same way
+_PHYSICAL_COMEDY_PREFIX = """
+You are a physical comedy choreographer. Create a detailed sequence for the gag described after these instructions.
+
+Break down into:
+1. SETUP: How the situation is established (2-3 actions)
+2. ESCALATION: How it builds/gets worse (2-3 actions)
+3. CLIMAX: The peak moment (1 action)
+4. RESOLUTION: How it resolves (1 action)
+
+Respond with JSON following this structure:
+{
+  "beat_name": "Short name for this gag",
+  "setup_actions": [
+    {
+      "description": "What happens",
+      "duration_estimate": 2.0,
+      "involves_characters": ["Character"]
+    }
+  ],
+  "escalation_actions": [...],
+  "climax_action": {},
+  "resolution_action": {},
+  "total_duration": 15.0
+}
+
+Make it visual, funny, and clear!
+"""
+
 
 class StageDirectionGenerator:
     """
@@ -56,7 +296,9 @@ class StageDirectionGenerator:
         self,
         claude_client: ClaudeClient,
         gpt_client: Optional[OpenAIClient] = None,
-        database_manager: Optional['DatabaseManager'] = None
+        database_manager: Optional['DatabaseManager'] = None,
+        cache_mode: str = "read_write",
+        stream_responses: bool = False
     ):
         """
         Initialize stage direction generator.
@@ -65,17 +307,30 @@ class StageDirectionGenerator:
             claude_client: Primary AI client
             gpt_client: Fallback AI client (optional)
             database_manager: For caching (optional)
+            cache_mode: "read_write" reuses and stores parsed results for
+                unchanged prompts, "read_only" only reuses them, "off"
+                always calls the model
+            stream_responses: Stream scene replies, building action beats
+                as they arrive and abandoning malformed output early
         """
+        if cache_mode not in _CACHE_MODES:
+            raise ValueError(
+                f"cache_mode must be one of {', '.join(_CACHE_MODES)}, "
+                f"got {cache_mode!r}"
+            )
+        
         self.claude = claude_client
         self.gpt = gpt_client
         self.db = database_manager
+        self.cache_mode = cache_mode
+        self.stream_responses = stream_responses
         
         logger.info("StageDirectionGenerator initialized")
     
     async def generate_stage_directions(
         self,
         scene: dict,
-        scene_dialogue: SceneDialogue,
+        scene_dialogue: Optional[SceneDialogue],
         comedic_beats: Optional[List[str]] = None
     ) -> SceneStageDirections:
         """
@@ -91,7 +346,9 @@ class StageDirectionGenerator:
         
         Args:
             scene: Scene outline from Phase 3
-            scene_dialogue: Generated dialogue for scene
+            scene_dialogue: Generated dialogue for scene, or None to stage
+                from the outline alone (lets staging run concurrently with
+                dialogue generation)
             comedic_beats: Physical comedy moments to choreograph
         
         Returns:
@@ -117,154 +374,135 @@ class StageDirectionGenerator:
             comedic_beats=comedic_beats or []
         )
         
+        # Unchanged scenes (common when re-running while rewriting) reuse
+        # the parsed result of the last run
+        cache_key = generate_cache_key(
+            'stage_directions', _STAGE_DIRECTION_PREFIX, prompt
+        )
+        cached = await self._get_cached_result(
+            cache_key, SceneStageDirections.from_dict
+        )
+        if cached is not None:
+            return cached
+        
         try:
             # Generate directions
-            response = await self.claude.generate(
-                prompt=prompt,
-                max_tokens=3000,
-                temperature=0.8
-            )
-            
-            # Parse response
-            data = json.loads(response)
-            
-            # Create action beats
-            action_beats = []
-            for beat_data in data.get('action_beats', []):
-                camera = None
-                if beat_data.get('camera_suggestion'):
-                    cam_data = beat_data['camera_suggestion']
-                    camera = CameraSuggestion(
-                        shot_type=cam_data.get('shot_type', 'MEDIUM'),
-                        focus=cam_data.get('focus', ''),
-                        reasoning=cam_data.get('reasoning', ''),
-                        movement=cam_data.get('movement'),
-                        timing=cam_data.get('timing')
-                    )
-                
-                beat = StageDirection(
-                    timing=beat_data.get('timing', 'CONTINUOUS'),
-                    description=beat_data.get('description', ''),
-                    duration_estimate=beat_data.get('duration_estimate', 1.0),
-                    involves_characters=beat_data.get('involves_characters', []),
-                    visual_gag=beat_data.get('visual_gag', False),
-                    camera_suggestion=camera
+            action_beats = None
+            if self.stream_responses:
+                response, action_beats = await self._stream_stage_directions(
+                    prompt
                 )
-                action_beats.append(beat)
-            
-            # Create physical comedy sequences
-            comedy_sequences = []
-            for seq_data in data.get('physical_comedy_sequences', []):
-                # Parse setup actions
-                setup_actions = [
-                    StageDirection(
-                        timing=a.get('timing', 'CONTINUOUS'),
-                        description=a.get('description', ''),
-                        duration_estimate=a.get('duration_estimate', 1.0),
-                        involves_characters=a.get('involves_characters', []),
-                        visual_gag=True
-                    )
-                    for a in seq_data.get('setup_actions', [])
-                ]
-                
-                # Parse escalation actions
-                escalation_actions = [
-                    StageDirection(
-                        timing=a.get('timing', 'CONTINUOUS'),
-                        description=a.get('description', ''),
-                        duration_estimate=a.get('duration_estimate', 1.0),
-                        involves_characters=a.get('involves_characters', []),
-                        visual_gag=True
-                    )
-                    for a in seq_data.get('escalation_actions', [])
-                ]
-                
-                # Parse climax
-                climax_data = seq_data.get('climax_action', {})
-                climax = StageDirection(
-                    timing=climax_data.get('timing', 'CONTINUOUS'),
-                    description=climax_data.get('description', ''),
-                    duration_estimate=climax_data.get('duration_estimate', 2.0),
-                    involves_characters=climax_data.get('involves_characters', []),
-                    visual_gag=True
+            else:
+                response = await self.claude.generate(
+                    prompt=prompt,
+                    max_tokens=3000,
+                    temperature=0.8,
+                    cached_prefix=_STAGE_DIRECTION_PREFIX
                 )
-                
-                # Parse resolution
-                resolution_data = seq_data.get('resolution_action', {})
-                resolution = StageDirection(
-                    timing=resolution_data.get('timing', 'CONTINUOUS'),
-                    description=resolution_data.get('description', ''),
-                    duration_estimate=resolution_data.get('duration_estimate', 1.0),
-                    involves_characters=resolution_data.get('involves_characters', []),
-                    visual_gag=True
-                )
-                
-                sequence = PhysicalComedySequence(
-                    beat_name=seq_data.get('beat_name', 'Physical Comedy'),
-                    setup_actions=setup_actions,
-                    escalation_actions=escalation_actions,
-                    climax_action=climax,
-                    resolution_action=resolution,
-                    total_duration=seq_data.get('total_duration', 10.0)
-                )
-                comedy_sequences.append(sequence)
-            
-            # Create camera suggestions
-            camera_suggestions = []
-            for cam_data in data.get('camera_suggestions', []):
-                camera = CameraSuggestion(
-                    shot_type=cam_data.get('shot_type', 'MEDIUM'),
-                    focus=cam_data.get('focus', ''),
-                    reasoning=cam_data.get('reasoning', ''),
-                    movement=cam_data.get('movement'),
-                    timing=cam_data.get('timing')
-                )
-                camera_suggestions.append(camera)
             
-            # Calculate total runtime
-            total_runtime = sum(b.duration_estimate for b in action_beats)
-            total_runtime += sum(
-                s.total_duration for s in comedy_sequences
+            stage_directions = self._parse_stage_directions(
+                response, scene_number, location, action_beats
             )
-            
-            # Create scene stage directions
-            stage_directions = SceneStageDirections(
-                scene_number=scene_number,
-                opening_description=data.get(
-                    'opening_description',
-                    f'{location} - Characters present'
-                ),
-                action_beats=action_beats,
-                physical_comedy_sequences=comedy_sequences,
-                closing_description=data.get(
-                    'closing_description',
-                    'Scene continues'
-                ),
-                camera_suggestions=camera_suggestions,
-                total_visual_runtime=total_runtime
-            )
-            
-            logger.info(
-                f"Generated stage directions for Scene {scene_number}: "
-                f"{len(action_beats)} beats, {len(comedy_sequences)} sequences, "
-                f"{total_runtime:.1f}s runtime"
-            )
-            
+            await self._store_result(cache_key, stage_directions.to_json_bytes())
             return stage_directions
             
         except Exception as e:
             logger.error(f"Failed to generate stage directions: {e}")
-            
-            # Return minimal fallback
-            return SceneStageDirections(
-                scene_number=scene_number,
-                opening_description=f'{location}',
-                action_beats=[],
-                physical_comedy_sequences=[],
-                closing_description='',
-                camera_suggestions=[],
-                total_visual_runtime=0.0
+            return self._fallback_stage_directions(scene_number, location)
+    
+    async def generate_stage_directions_batch(
+        self,
+        scenes: Sequence[Tuple[dict, Optional[SceneDialogue], Optional[List[str]]]],
+        max_concurrency: int = 10
+    ) -> List[SceneStageDirections]:
+        """
+        Create stage directions for many scenes concurrently.
+        
+        Each scene is an independent LLM call, so up to max_concurrency
+        run at once; the client's rate limiter still paces the requests.
+        
+        Args:
+            scenes: (scene, scene_dialogue, comedic_beats) per scene, as
+                for generate_stage_directions
+            max_concurrency: Most scenes in flight at once
+        
+        Returns:
+            Stage directions in the same order as scenes
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def generate_one(scene, scene_dialogue, comedic_beats):
+            async with semaphore:
+                return await self.generate_stage_directions(
+                    scene, scene_dialogue, comedic_beats
+                )
+        
+        return list(await asyncio.gather(
+            *(generate_one(*args) for args in scenes)
+        ))
+    
+    async def generate_stage_directions_batch_offline(
+        self,
+        scenes: Sequence[Tuple[dict, Optional[SceneDialogue], Optional[List[str]]]],
+        poll_interval: float = 30.0
+    ) -> List[SceneStageDirections]:
+        """
+        Create stage directions for many scenes through one message batch.
+        
+        For offline episode generation: the batch is billed at half the
+        live rate but may take minutes to hours to finish. Scenes whose
+        request fails get the same minimal fallback as
+        generate_stage_directions.
+        
+        Args:
+            scenes: (scene, scene_dialogue, comedic_beats) per scene, as
+                for generate_stage_directions
+            poll_interval: Seconds between batch status checks
+        
+        Returns:
+            Stage directions in the same order as scenes
+        """
+        # Scene numbers may repeat across acts, so key requests by position
+        prompts = {
+            f'scene-{index}': self._build_stage_direction_prompt(
+                scene=scene,
+                scene_dialogue=scene_dialogue,
+                comedic_beats=comedic_beats or []
             )
+            for index, (scene, scene_dialogue, comedic_beats) in enumerate(scenes)
+        }
+        
+        logger.info(f"Submitting stage directions batch for {len(prompts)} scenes")
+        
+        responses = await self.claude.generate_batch(
+            prompts,
+            max_tokens=3000,
+            temperature=0.8,
+            cached_prefix=_STAGE_DIRECTION_PREFIX,
+            poll_interval=poll_interval
+        )
+        
+        results = []
+        for index, (scene, _, _) in enumerate(scenes):
+            scene_number = scene.get('scene_number', 1)
+            location = scene.get('location', 'Unknown')
+            response = responses.get(f'scene-{index}')
+            try:
+                if response is None:
+                    raise ValueError("no batch result")
+                results.append(
+                    self._parse_stage_directions(response, scene_number, location)
+                )
+            except Exception as e:
+                logger.error(
+                    f"Failed to generate stage directions for Scene "
+                    f"{scene_number}: {e}"
+                )
+                results.append(
+                    self._fallback_stage_directions(scene_number, location)
+                )
+        
+        return results
     
     async def _generate_physical_comedy_sequence(
         self,
@@ -290,49 +528,33 @@ class StageDirectionGenerator:
             Complete choreographed sequence
         """
         prompt = f"""
-You are a physical comedy choreographer. Create a detailed sequence for this gag:
-
 COMEDIC BEAT: {comedic_beat}
 CHARACTERS: {', '.join(characters)}
 LOCATION: {location}
-
-Break down into:
-1. SETUP: How the situation is established (2-3 actions)
-2. ESCALATION: How it builds/gets worse (2-3 actions)
-3. CLIMAX: The peak moment (1 action)
-4. RESOLUTION: How it resolves (1 action)
-
-Respond with JSON following this structure:
-{{
-  "beat_name": "Short name for this gag",
-  "setup_actions": [
-    {{
-      "description": "What happens",
-      "duration_estimate": 2.0,
-      "involves_characters": ["Character"]
-    }}
-  ],
-  "escalation_actions": [...],
-  "climax_action": {{}},
-  "resolution_action": {{}},
-  "total_duration": 15.0
-}}
-
-Make it visual, funny, and clear!
 """
         
+        cache_key = generate_cache_key(
+            'physical_comedy', _PHYSICAL_COMEDY_PREFIX, prompt
+        )
+        cached = await self._get_cached_result(
+            cache_key, PhysicalComedySequence.from_dict
+        )
+        if cached is not None:
+            return cached
+        
         try:
             response = await self.claude.generate(
                 prompt=prompt,
                 max_tokens=2000,
-                temperature=0.8
+                temperature=0.8,
+                cached_prefix=_PHYSICAL_COMEDY_PREFIX
             )
             
-            data = json.loads(response)
+            data = _loads(response)
             
             # Create sequence (simplified version)
             # TODO: Full implementation
-            return PhysicalComedySequence(
+            sequence = PhysicalComedySequence(
                 beat_name=data.get('beat_name', comedic_beat),
                 setup_actions=[],
                 escalation_actions=[],
@@ -352,6 +574,8 @@ Make it visual, funny, and clear!
                 ),
                 total_duration=10.0
             )
+            await self._store_result(cache_key, _dumps(sequence.to_dict()))
+            return sequence
             
         except Exception as e:
             logger.error(f"Failed to generate physical comedy: {e}")
@@ -377,6 +601,71 @@ Make it visual, funny, and clear!
                 total_duration=5.0
             )
     
+    async def _stream_stage_directions(
+        self,
+        prompt: str
+    ) -> Tuple[str, List[StageDirection]]:
+        """
+        Stream the scene reply, building each action beat once it is complete.
+        
+        Output that cannot be a JSON object raises as soon as it is seen,
+        which ends the request instead of waiting out the rest of it.
+        
+        Returns:
+            The full reply text and the action beats built from it
+        """
+        scanner = _ArrayItemScanner('action_beats')
+        action_beats: List[StageDirection] = []
+        
+        async with aclosing(self.claude.generate_stream(
+            prompt=prompt,
+            max_tokens=3000,
+            temperature=0.8,
+            cached_prefix=_STAGE_DIRECTION_PREFIX
+        )) as deltas:
+            async for delta in deltas:
+                action_beats.extend(map(_mk_action_beat, scanner.feed(delta)))
+        
+        return scanner.text, action_beats
+    
+    async def _get_cached_result(
+        self,
+        key: str,
+        from_dict: Callable[[dict], _ResultT]
+    ) -> Optional[_ResultT]:
+        """
+        Look up a result stored for an identical prompt.
+        
+        Unreachable caches and corrupt or outdated entries count as a miss.
+        """
+        if self.db is None or self.cache_mode == "off":
+            return None
+        
+        try:
+            cached = await self.db.cache_get(key)
+            if cached is None:
+                return None
+            result = from_dict(_loads(cached))
+        except Exception as e:
+            logger.warning(f"Cache retrieval failed: {e}")
+            return None
+        
+        logger.debug(f"Reusing cached result {key}")
+        return result
+    
+    async def _store_result(self, key: str, payload: bytes):
+        """Store a serialized result so an identical prompt can skip the model."""
+        if self.db is None or self.cache_mode != "read_write":
+            return
+        
+        try:
+            # Redis is opened with decode_responses, so entries are str
+            await self.db.cache_set(
+                key, payload.decode(), ttl=CacheTTL.LONG.value
+            )
+        except Exception as e:
+            logger.warning(f"Cache save failed: {e}")
+    
     def _suggest_camera_work(
         self,
         action_type: str,
@@ -411,63 +700,101 @@ Make it visual, funny, and clear!
                 timing='Continuous'
             )
     
+    def _parse_stage_directions(
+        self,
+        response: str,
+        scene_number: int,
+        location: str,
+        action_beats: Optional[List[StageDirection]] = None
+    ) -> SceneStageDirections:
+        """
+        Build stage directions from the JSON reply to the scene prompt.
+        
+        action_beats, if given, were already built while streaming.
+        """
+        data = _loads(response)
+        
+        # Response keys follow the schema in _STAGE_DIRECTION_PREFIX; any
+        # the model leaves out fall back to the defaults in the constructors
+        if action_beats is None:
+            action_beats = [
+                _mk_action_beat(beat_data)
+                for beat_data in data.get('action_beats', [])
+            ]
+        comedy_sequences = [
+            _mk_comedy_sequence(seq_data)
+            for seq_data in data.get('physical_comedy_sequences', [])
+        ]
+        camera_suggestions = [
+            _mk_camera(cam_data)
+            for cam_data in data.get('camera_suggestions', [])
+        ]
+        
+        # Calculate total runtime
+        total_runtime = sum(b.duration_estimate for b in action_beats)
+        total_runtime += sum(
+            s.total_duration for s in comedy_sequences
+        )
+        
+        # Create scene stage directions
+        stage_directions = SceneStageDirections(
+            scene_number=scene_number,
+            opening_description=data.get(
+                'opening_description',
+                f'{location} - Characters present'
+            ),
+            action_beats=action_beats,
+            physical_comedy_sequences=comedy_sequences,
+            closing_description=data.get(
+                'closing_description',
+                'Scene continues'
+            ),
+            camera_suggestions=camera_suggestions,
+            total_visual_runtime=total_runtime
+        )
+        
+        logger.info(
+            f"Generated stage directions for Scene {scene_number}: "
+            f"{len(action_beats)} beats, {len(comedy_sequences)} sequences, "
+            f"{total_runtime:.1f}s runtime"
+        )
+        
+        return stage_directions
+    
+    @staticmethod
+    def _fallback_stage_directions(
+        scene_number: int,
+        location: str
+    ) -> SceneStageDirections:
+        """Minimal stage directions for a scene whose generation failed."""
+        return SceneStageDirections(
+            scene_number=scene_number,
+            opening_description=f'{location}',
+            action_beats=[],
+            physical_comedy_sequences=[],
+            closing_description='',
+            camera_suggestions=[],
+            total_visual_runtime=0.0
+        )
+    
     def _build_stage_direction_prompt(
         self,
         scene: dict,
-        scene_dialogue: SceneDialogue,
+        scene_dialogue: Optional[SceneDialogue],
         comedic_beats: List[str]
     ) -> str:
-        """Build prompt for stage direction generation."""
+        """Build the scene-specific part of the stage direction prompt."""
+        dialogue_text = (
+            scene_dialogue.get_dialogue_text() if scene_dialogue
+            else "(Not yet written - stage the scene from its description.)"
+        )
         return f"""
-You are a TV director creating stage directions. Generate visual choreography for this scene.
-
 SCENE INFO:
-{json.dumps(scene, indent=2)}
+{_dumps_indented(scene)}
 
 DIALOGUE:
-{scene_dialogue.get_dialogue_text()}
+{dialogue_text}
 
 PHYSICAL COMEDY BEATS:
-{json.dumps(comedic_beats, indent=2)}
-
-Create:
-1. Opening visual description (set the scene)
-2. Action beats between dialogue lines
-3. Physical comedy sequences (if applicable)
-4. Camera suggestions for key moments
-5. Closing visual
-
-Respond with JSON:
-{{
-  "opening_description": "Visual description of opening",
-  "action_beats": [
-    {{
-      "timing": "BEFORE LINE|DURING LINE|AFTER LINE",
-      "description": "What happens",
-      "duration_estimate": 1.5,
-      "involves_characters": ["Character"],
-      "visual_gag": false,
-      "camera_suggestion": {{
-        "shot_type": "WIDE|MEDIUM|CLOSE-UP",
-        "focus": "what to focus on",
-        "reasoning": "why this shot",
-        "movement": null
-      }}
-    }}
-  ],
-  "physical_comedy_sequences": [
-    {{
-      "beat_name": "Gag name",
-      "setup_actions": [...],
-      "escalation_actions": [...],
-      "climax_action": {{}},
-      "resolution_action": {{}},
-      "total_duration": 10.0
-    }}
-  ],
-  "camera_suggestions": [...],
-  "closing_description": "How scene ends visually"
-}}
-
-Make it visual, dynamic, and production-ready!
+{_dumps_indented(comedic_beats)}
 """
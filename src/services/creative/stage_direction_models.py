@@ -8,8 +8,16 @@ and camera suggestions.
 """
 
 from dataclasses import dataclass, field
-from typing import List, Optional
+from functools import cached_property
+from typing import Dict, List, Optional
 from datetime import datetime
+import json
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 
 @dataclass
@@ -258,6 +266,19 @@ class SceneStageDirections:
     total_visual_runtime: float
     generated_at: datetime = field(default_factory=datetime.now)
     
+    @cached_property
+    def timing_index(self) -> Dict[str, List[str]]:
+        """
+        Action-beat descriptions grouped by timing, in beat order.
+        
+        Built on first use and shared by every export of the scene, so
+        action_beats must not change after it has been read.
+        """
+        index: Dict[str, List[str]] = {}
+        for beat in self.action_beats:
+            index.setdefault(beat.timing, []).append(beat.description)
+        return index
+    
     def get_all_directions(self) -> List[StageDirection]:
         """Get all stage directions including comedy sequences."""
         directions = list(self.action_beats)
@@ -314,6 +335,17 @@ class SceneStageDirections:
             'generated_at': self.generated_at.isoformat()
         }
     
+    def to_json_bytes(self) -> bytes:
+        """
+        Serialize to_dict() as UTF-8 JSON.
+        
+        orjson encodes the dictionary without the intermediate str that
+        json.dumps() builds.
+        """
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(self.to_dict())
+        return json.dumps(self.to_dict()).encode()
+    
     @classmethod
     def from_dict(cls, data: dict) -> "SceneStageDirections":
         """Create SceneStageDirections from dictionary."""
@@ -11,7 +11,6 @@ from typing import Dict, List, Optional
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-import json
 
 from src.services.creative.claude_client import ClaudeClient
 from src.services.creative.openai_client import OpenAIClient as GPTClient
@@ -295,8 +294,7 @@ CRITICAL:
                 max_tokens=4000
             )
             
-            response_json = json.loads(response_text)
-            validated = self.validator.validate_transformation_rules(response_json)
+            validated = self.validator.validate_transformation_rules(response_text)
             
             if not validated:
                 logger.warning("Claude transformation failed validation")
@@ -304,9 +302,6 @@ CRITICAL:
             
             return self._build_transformation_rules(validated, "claude-sonnet-4")
             
-        except json.JSONDecodeError as e:
-            logger.error(f"Claude returned invalid JSON: {e}")
-            return None
         except Exception as e:
             logger.error(f"Claude transformation error: {e}")
             return None
@@ -329,8 +324,7 @@ CRITICAL:
                 max_tokens=4000
             )
             
-            response_json = json.loads(response_text)
-            validated = self.validator.validate_transformation_rules(response_json)
+            validated = self.validator.validate_transformation_rules(response_text)
             
             if not validated:
                 logger.warning("GPT-4 transformation failed validation")
@@ -338,9 +332,6 @@ CRITICAL:
             
             return self._build_transformation_rules(validated, "gpt-4-turbo")
             
-        except json.JSONDecodeError as e:
-            logger.error(f"GPT-4 returned invalid JSON: {e}")
-            return None
         except Exception as e:
             logger.error(f"GPT-4 transformation error: {e}")
             return None
@@ -382,7 +373,10 @@ CRITICAL:
         humor_transform = HumorTransformation(
             original_style=validated_response.humor_transformation.original_humor_type,
             modern_style=validated_response.humor_transformation.modern_humor_type,
-            device_mappings=validated_response.humor_transformation.example_transformations,
+            device_mappings=[
+                example.model_dump()
+                for example in validated_response.humor_transformation.example_transformations
+            ],
             preserved_elements=[],
             updated_elements=[],
             tone_guidance="Maintain comedic spirit while updating context"
@@ -398,7 +392,10 @@ CRITICAL:
             humor_transformation=humor_transform,
             cultural_updates=validated_response.cultural_updates,
             technology_opportunities=validated_response.technology_opportunities,
-            conflict_modernization=validated_response.conflict_modernization,
+            conflict_modernization=[
+                conflict.model_dump()
+                for conflict in validated_response.conflict_modernization
+            ],
             taboo_updates=[],
             reverse_taboos=[],
             model_used=model
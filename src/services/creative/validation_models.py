@@ -11,15 +11,32 @@ plot coherence, comedy distribution, and production feasibility.
 from dataclasses import dataclass, field
 from typing import List, Dict, Optional
 from enum import Enum
+from operator import attrgetter
 from datetime import datetime
 
 
 class ValidationSeverity(Enum):
-    """Severity levels for validation issues."""
-    INFO = "info"  # Informational, not a problem
-    WARNING = "warning"  # Minor issue, could be improved
-    ERROR = "error"  # Significant problem that should be fixed
-    CRITICAL = "critical"  # Major issue that breaks the script
+    """
+    Severity levels for validation issues.
+    
+    Each member carries an int rank (critical first) alongside its string
+    value, so issues sort on a C-level attribute lookup.
+    """
+    INFO = ("info", 3)  # Informational, not a problem
+    WARNING = ("warning", 2)  # Minor issue, could be improved
+    ERROR = ("error", 1)  # Significant problem that should be fixed
+    CRITICAL = ("critical", 0)  # Major issue that breaks the script
+    
+    rank: int
+    
+    def __new__(cls, value: str, rank: int = 0) -> "ValidationSeverity":
+        # Only runs while the members above are created; value lookups
+        # such as ValidationSeverity("error") never reach it, but the
+        # type checker matches them against this signature
+        member = object.__new__(cls)
+        member._value_ = value
+        member.rank = rank
+        return member
 
 
 class ValidationCategory(Enum):
@@ -32,7 +49,11 @@ class ValidationCategory(Enum):
     PACING = "pacing"
 
 
-@dataclass
+# Sort key for report issues, most severe first
+_severity_rank = attrgetter("severity.rank")
+
+
+@dataclass(slots=True)
 class ValidationIssue:
     """
     Single validation issue found in the script.
@@ -80,7 +101,7 @@ class ValidationIssue:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class CharacterConsistencyScore:
     """
     Character consistency assessment for a single character.
@@ -93,6 +114,7 @@ class CharacterConsistencyScore:
         relationship_consistency: Relationship dynamics maintained (0.0-1.0)
         overall_score: Average of all consistency metrics
         issues: Specific consistency issues found
+        scene_numbers: Scenes the character speaks or appears in
     """
     character_name: str
     voice_match_score: float
@@ -101,6 +123,7 @@ class CharacterConsistencyScore:
     relationship_consistency: float
     overall_score: float = 0.0
     issues: List[str] = field(default_factory=list)
+    scene_numbers: List[int] = field(default_factory=list)
     
     def __post_init__(self):
         """Calculate overall score after initialization."""
@@ -122,6 +145,7 @@ class CharacterConsistencyScore:
             "relationship_consistency": self.relationship_consistency,
             "overall_score": self.overall_score,
             "issues": self.issues,
+            "scene_numbers": self.scene_numbers,
         }
     
     @classmethod
@@ -130,7 +154,7 @@ class CharacterConsistencyScore:
         return cls(**data)
 
 
-@dataclass
+@dataclass(slots=True)
 class ComedyDistributionAnalysis:
     """
     Analysis of comedy distribution and effectiveness.
@@ -170,7 +194,7 @@ class ComedyDistributionAnalysis:
         return cls(**data)
 
 
-@dataclass
+@dataclass(slots=True)
 class ProductionComplexityAssessment:
     """
     Assessment of production feasibility and complexity.
@@ -216,7 +240,7 @@ class ProductionComplexityAssessment:
         return cls(**data)
 
 
-@dataclass
+@dataclass(slots=True)
 class PlotCoherenceScore:
     """
     Assessment of plot structure and coherence.
@@ -267,7 +291,7 @@ class PlotCoherenceScore:
         return cls(**data)
 
 
-@dataclass
+@dataclass(slots=True)
 class ScriptValidationReport:
     """
     Complete validation report for a script.
@@ -374,3 +398,68 @@ class ScriptValidationReport:
             issue for issue in self.validation_issues
             if issue.severity in [ValidationSeverity.CRITICAL, ValidationSeverity.ERROR]
         ]
+
+
+@dataclass(slots=True)
+class PartialValidationReport:
+    """
+    Validation results that do not depend on comedy analysis.
+    
+    Produced by ScriptValidator.validate_noncomedy so those checks can run
+    while comedy optimization is still in progress; merge() completes it
+    into a ScriptValidationReport.
+    
+    Attributes:
+        script_id: Identifier for the script validated
+        character_consistency: Per-character consistency scores
+        production_complexity: Production feasibility assessment
+        plot_coherence: Plot structure quality
+        validation_issues: Issues found by these checks
+    """
+    script_id: str
+    character_consistency: Dict[str, CharacterConsistencyScore]
+    production_complexity: ProductionComplexityAssessment
+    plot_coherence: PlotCoherenceScore
+    validation_issues: List[ValidationIssue] = field(default_factory=list)
+    
+    @classmethod
+    def from_report(cls, report: ScriptValidationReport) -> "PartialValidationReport":
+        """Strip the comedy results from a complete report."""
+        return cls(
+            script_id=report.script_id,
+            character_consistency=report.character_consistency,
+            production_complexity=report.production_complexity,
+            plot_coherence=report.plot_coherence,
+            validation_issues=[
+                issue for issue in report.validation_issues
+                if issue.category != ValidationCategory.COMEDY_DISTRIBUTION
+            ],
+        )
+    
+    def merge(
+        self,
+        comedy_distribution: ComedyDistributionAnalysis,
+        comedy_issues: List[ValidationIssue],
+        overall_quality_score: float,
+        pass_threshold: float = 0.7,
+    ) -> ScriptValidationReport:
+        """
+        Combine with comedy results into a complete report.
+        
+        Issues are sorted by severity (critical first); summary and
+        recommendations are left for the caller to fill in.
+        """
+        validation_issues = self.validation_issues + comedy_issues
+        validation_issues.sort(key=_severity_rank)
+        
+        return ScriptValidationReport(
+            script_id=self.script_id,
+            validation_timestamp=datetime.now(),
+            character_consistency=self.character_consistency,
+            comedy_distribution=comedy_distribution,
+            production_complexity=self.production_complexity,
+            plot_coherence=self.plot_coherence,
+            validation_issues=validation_issues,
+            overall_quality_score=overall_quality_score,
+            pass_threshold=pass_threshold,
+        )
@@ -137,6 +137,7 @@ class PerformanceMetrics:
     api_calls: int = 0
     api_errors: int = 0
     total_tokens_used: int = 0
+    prompt_cache_read_tokens: int = 0
     estimated_api_cost: float = 0.0
     
     # Generation metrics
@@ -196,11 +197,13 @@ class PerformanceMetrics:
         self,
         tokens_used: int = 0,
         cost: float = 0.0,
-        error: bool = False
+        error: bool = False,
+        cache_read_tokens: int = 0
     ):
         """Record an API call."""
         self.api_calls += 1
         self.total_tokens_used += tokens_used
+        self.prompt_cache_read_tokens += cache_read_tokens
         self.estimated_api_cost += cost
         if error:
             self.api_errors += 1
@@ -218,6 +221,7 @@ class PerformanceMetrics:
             "api_calls": self.api_calls,
             "api_errors": self.api_errors,
             "total_tokens_used": self.total_tokens_used,
+            "prompt_cache_read_tokens": self.prompt_cache_read_tokens,
             "estimated_api_cost": self.estimated_api_cost,
             "scenes_generated": self.scenes_generated,
             "dialogue_lines_generated": self.dialogue_lines_generated,
@@ -243,6 +247,7 @@ class PerformanceMetrics:
             f"API Usage:",
             f"  Calls: {self.api_calls} (Errors: {self.api_errors})",
             f"  Tokens: {self.total_tokens_used:,}",
+            f"  Prompt Cache Reads: {self.prompt_cache_read_tokens:,} tokens",
             f"  Est. Cost: ${self.estimated_api_cost:.4f}",
             f"",
             f"Generation Stats:",
@@ -446,14 +451,16 @@ class PerformanceMonitor:
         self,
         tokens_used: int = 0,
         cost: float = 0.0,
-        error: bool = False
+        error: bool = False,
+        cache_read_tokens: int = 0
     ):
         """Record API call in current session."""
         if self._enabled and self.current_session:
             self.current_session.record_api_call(
                 tokens_used=tokens_used,
                 cost=cost,
-                error=error
+                error=error,
+                cache_read_tokens=cache_read_tokens
             )
     
     def get_current_metrics(self) -> Optional[PerformanceMetrics]:
@@ -95,6 +95,18 @@ class TestCacheKeyGeneration:
         
         assert key.startswith("ai_response:")
     
+    def test_generate_ai_cache_key_separates_prefix_and_prompt(self):
+        """Test a prefix/prompt split cannot collide with another split."""
+        def key(cached_prefix, prompt):
+            return generate_ai_cache_key(
+                prompt=prompt,
+                model="claude-sonnet-4",
+                cached_prefix=cached_prefix
+            )
+        
+        assert key("ab", "c") != key("a", "bc")
+        assert key("ab", "c") == key("ab", "c")
+    
     def test_generate_voice_profile_cache_key(self):
         """Test voice profile cache key generation."""
         key = generate_voice_profile_cache_key(
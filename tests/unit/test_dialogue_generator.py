@@ -13,6 +13,7 @@ from src.services.creative.dialogue_generator import DialogueGenerator
 from src.services.creative.character_voice_profiles import (
     CharacterVoiceProfile,
     DialogueLine,
+    RenderedVoiceProfiles,
     SceneDialogue
 )
 
@@ -385,6 +386,66 @@ class TestDialogueGenerator:
         # Verify higher confidence score with voice profiles
         assert scene_dialogue.confidence_score > 0.5
 
+    @pytest.mark.asyncio
+    async def test_generate_dialogue_shares_cached_prefix_across_scenes(
+        self,
+        dialogue_generator,
+        mock_claude_client,
+        sample_scene,
+        sample_episode_context,
+        sample_narrative_structure,
+        mock_dialogue_response
+    ):
+        """Test episode context goes in a prefix that is identical per scene."""
+        mock_claude_client.generate = AsyncMock(
+            return_value=mock_dialogue_response
+        )
+        other_scene = dict(
+            sample_scene, scene_number=2, description='Ricky finds out'
+        )
+
+        for scene in (sample_scene, other_scene):
+            await dialogue_generator.generate_dialogue(
+                scene=scene,
+                episode_context=sample_episode_context,
+                narrative_structure=sample_narrative_structure
+            )
+
+        first, second = mock_claude_client.generate.call_args_list
+        assert first.kwargs['cached_prefix'] == second.kwargs['cached_prefix']
+        assert 'Ricky finds out' not in second.kwargs['cached_prefix']
+        assert 'Ricky finds out' in second.kwargs['prompt']
+
+    @pytest.mark.asyncio
+    async def test_generate_dialogue_uses_rendered_profiles(
+        self,
+        dialogue_generator,
+        mock_claude_client,
+        sample_scene,
+        sample_episode_context,
+        sample_narrative_structure,
+        mock_dialogue_response
+    ):
+        """Test pre-rendered voice profiles are used as given."""
+        mock_claude_client.generate = AsyncMock(
+            return_value=mock_dialogue_response
+        )
+        rendered = RenderedVoiceProfiles(
+            summaries=(('Luna', 'talks fast'),),
+            text='\nLuna: talks fast',
+            token_estimate=4
+        )
+
+        await dialogue_generator.generate_dialogue(
+            scene=sample_scene,
+            episode_context=sample_episode_context,
+            narrative_structure=sample_narrative_structure,
+            rendered_profiles=rendered
+        )
+
+        prefix = mock_claude_client.generate.call_args.kwargs['cached_prefix']
+        assert 'VOICE PROFILES:\n\nLuna: talks fast\n' in prefix
+
     @pytest.mark.asyncio
     async def test_generate_dialogue_fallback_on_error(
         self,
@@ -528,6 +589,21 @@ class TestCharacterVoiceProfile:
         assert profile.character_name == 'Test'
         assert profile.vocabulary_level == 'sophisticated'
 
+    def test_lowered_matching_keys(self):
+        """Test lower-cased catchphrases and vocabulary level for matching."""
+        profile = CharacterVoiceProfile(
+            character_name='Luna',
+            vocabulary_level='Simple',
+            sentence_structure='rambling',
+            catchphrases=['Oh, Ricky!', 'WAAAH'],
+        )
+
+        assert profile.catchphrases_lower == ('oh, ricky!', 'waaah')
+        assert profile.vocabulary_level_key == 'simple'
+        # Derived values stay out of serialization and comparison
+        assert 'catchphrases_lower' not in profile.to_dict()
+        assert profile == CharacterVoiceProfile.from_dict(profile.to_dict())
+
     def test_get_speaking_style_summary(self):
         """Test speaking style summary generation."""
         profile = CharacterVoiceProfile(
@@ -596,6 +672,29 @@ class TestCharacterVoiceProfile:
         assert restored.humor_style == original.humor_style
 
 
+class TestRenderedVoiceProfiles:
+    """Test suite for RenderedVoiceProfiles."""
+
+    def test_from_profiles_renders_each_summary_once(self):
+        """Test rendering keeps profile order and filters by character."""
+        profiles = {
+            name: CharacterVoiceProfile(
+                character_name=name,
+                vocabulary_level='simple',
+                sentence_structure='short'
+            )
+            for name in ('Luna', 'Ricky')
+        }
+
+        rendered = RenderedVoiceProfiles.from_profiles(profiles)
+
+        luna = profiles['Luna'].get_speaking_style_summary()
+        ricky = profiles['Ricky'].get_speaking_style_summary()
+        assert rendered.text == f"\nLuna: {luna}\nRicky: {ricky}"
+        assert rendered.token_estimate > 0
+        assert rendered.guidance_for({'Ricky'}) == f"Ricky: {ricky}"
+
+
 class TestDialogueLine:
     """Test suite for DialogueLine dataclass."""
 
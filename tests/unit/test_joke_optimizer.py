@@ -222,6 +222,63 @@ class TestJokeOptimizer:
         assert result.effectiveness_score == 0.90
         mock_gpt_client.generate.assert_called_once()
     
+    @pytest.mark.asyncio
+    async def test_analyze_joke_structure_hedged_takes_first_success(
+        self, joke_optimizer, mock_claude_client, mock_gpt_client
+    ):
+        """Test hedged analysis returns the faster provider's result."""
+        import asyncio
+        
+        async def slow_claude(**kwargs):
+            await asyncio.sleep(10)
+            return json.dumps({"joke_type": "wordplay"})
+        
+        mock_claude_client.generate.side_effect = slow_claude
+        mock_gpt_client.generate.return_value = json.dumps({
+            "joke_type": "physical",
+            "effectiveness_score": 0.9
+        })
+        
+        comedic_beat = {"setup": "S", "payoff": "P", "timing": 10.0}
+        
+        result = await asyncio.wait_for(
+            joke_optimizer._analyze_joke_structure(
+                comedic_beat, [], 0, hedge=True
+            ),
+            timeout=2,
+        )
+        
+        assert result.joke_type == JokeType.PHYSICAL
+        assert result.effectiveness_score == 0.9
+    
+    @pytest.mark.asyncio
+    async def test_analyze_joke_structure_hedged_both_fail(
+        self, joke_optimizer, mock_claude_client, mock_gpt_client
+    ):
+        """Test hedged analysis falls back when both providers fail."""
+        mock_claude_client.generate.side_effect = Exception("Claude error")
+        mock_gpt_client.generate.side_effect = Exception("GPT error")
+        
+        result = await joke_optimizer._analyze_joke_structure(
+            {"setup": "S", "payoff": "P"}, [], 3, hedge=True
+        )
+        
+        assert result.joke_id == "joke_003"
+        assert "AI analysis unavailable" in result.improvement_suggestions
+    
+    @pytest.mark.asyncio
+    async def test_hedged_joke_analysis_chains_last_error(
+        self, joke_optimizer, mock_claude_client, mock_gpt_client
+    ):
+        """Test hedged analysis raises RuntimeError from a provider error."""
+        mock_claude_client.generate.side_effect = ValueError("Claude error")
+        mock_gpt_client.generate.side_effect = ValueError("GPT error")
+        
+        with pytest.raises(RuntimeError, match="no provider") as exc_info:
+            await joke_optimizer._hedged_joke_analysis("prompt")
+        
+        assert isinstance(exc_info.value.__cause__, ValueError)
+    
     @pytest.mark.asyncio
     async def test_analyze_joke_structure_with_complete_fallback(
         self, joke_optimizer, mock_claude_client, mock_gpt_client
@@ -303,6 +360,40 @@ class TestJokeOptimizer:
         assert result[1].estimated_effectiveness == 0.85
         assert all(alt.maintains_character for alt in result)
     
+    @pytest.mark.asyncio
+    async def test_generate_alternative_punchlines_terse(
+        self, joke_optimizer, mock_claude_client
+    ):
+        """Test terse mode requests only punchlines and fills defaults."""
+        mock_claude_client.generate.return_value = json.dumps({
+            "alternatives": [
+                {"punchline": "She needed more space!"},
+                {"punchline": "The relationship had no atmosphere!"}
+            ]
+        })
+        
+        joke = JokeStructure(
+            joke_id="joke_001",
+            joke_type=JokeType.WORDPLAY,
+            setup="Why did the astronaut break up?",
+            punchline="She needed space!",
+            timing_position=30.0,
+            characters_involved=[],
+            effectiveness_score=0.65
+        )
+        
+        result = await joke_optimizer._generate_alternative_punchlines(
+            joke, {}, verbose=False
+        )
+        
+        prompt = mock_claude_client.generate.call_args.kwargs["prompt"]
+        assert "reasoning" not in prompt
+        assert len(result) == 2
+        assert result[0].punchline == "She needed more space!"
+        assert result[0].reasoning == ""
+        assert result[0].estimated_effectiveness == pytest.approx(0.75)
+        assert all(alt.maintains_character for alt in result)
+    
     @pytest.mark.asyncio
     async def test_generate_alternative_punchlines_failure(
         self, joke_optimizer, mock_claude_client
@@ -387,6 +478,47 @@ class TestJokeOptimizer:
             assert all(isinstance(opp, CallbackOpportunity) for opp in result)
             assert result[0].source_joke_id == "joke_001"
     
+    def test_detect_callback_opportunities_keeps_lowest_risk(self, joke_optimizer):
+        """Test callback detection keeps the five lowest-risk targets."""
+        analyzed_jokes = [
+            JokeStructure(
+                joke_id=f"joke_{i:03d}",
+                joke_type=JokeType.WORDPLAY,
+                setup="Setup",
+                punchline="Punchline",
+                timing_position=0.0,
+                characters_involved=["Lucy"],
+                effectiveness_score=0.8,
+                callback_potential=True
+            )
+            for i in range(2)
+        ]
+        
+        scene_dialogues = [
+            SceneDialogue(
+                scene_number=n,
+                location="Kitchen",
+                characters_present=["Lucy"],
+                dialogue_lines=[DialogueLine("Lucy", "Line", "happy", "", False)],
+                total_runtime_estimate=180,
+                comedic_beats_count=0,
+                confidence_score=0.9
+            )
+            for n in range(10)
+        ]
+        
+        result = joke_optimizer._detect_callback_opportunities(
+            analyzed_jokes, scene_dialogues
+        )
+        
+        # Scenes 1-3 are low risk for both source jokes (6 candidates)
+        assert len(result) == 5
+        assert all(opp.risk_level == 0.3 for opp in result)
+        assert [opp.target_scene for opp in result[:3]] == [
+            "scene_01", "scene_02", "scene_03"
+        ]
+        assert result[0].source_joke_id == "joke_000"
+    
     def test_detect_callback_opportunities_empty(self, joke_optimizer):
         """Test callback detection with no opportunities."""
         analyzed_jokes = [
@@ -475,6 +607,41 @@ class TestJokeOptimizer:
         assert result.average_spacing == 150.0
         assert len(result.dead_zones) > 0  # Should detect dead zones (spacing > 120)
     
+    def test_analyze_comedy_timing_uses_scene_runtimes(self, joke_optimizer):
+        """Test clusters map to scenes by actual runtime, not 180s blocks."""
+        analyzed_jokes = [
+            JokeStructure(
+                joke_id=f"joke_{i:03d}",
+                joke_type=JokeType.SITUATIONAL,
+                setup="Setup",
+                punchline="Punchline",
+                timing_position=position,
+                characters_involved=["Lucy"],
+                effectiveness_score=0.75
+            )
+            for i, position in enumerate([70.0, 75.0])
+        ]
+        
+        scene_dialogues = [
+            SceneDialogue(
+                scene_number=n,
+                location="Kitchen",
+                characters_present=["Lucy"],
+                dialogue_lines=[],
+                total_runtime_estimate=60,
+                comedic_beats_count=0,
+                confidence_score=0.9
+            )
+            for n in range(3)
+        ]
+        
+        result = joke_optimizer._analyze_comedy_timing(
+            analyzed_jokes, scene_dialogues
+        )
+        
+        # 70s falls in the second 60-second scene
+        assert result.clusters == ["scene_01"]
+    
     def test_analyze_comedy_timing_empty(self, joke_optimizer):
         """Test timing analysis with no jokes."""
         result = joke_optimizer._analyze_comedy_timing([], [])
@@ -528,6 +695,49 @@ class TestJokeOptimizer:
         result = joke_optimizer._calculate_overall_effectiveness([])
         assert result == 0.0
     
+    def test_score_stats(self, joke_optimizer):
+        """Test single-pass mean, weak and strong counts."""
+        jokes = [
+            JokeStructure(
+                joke_id=f"joke_{i}",
+                joke_type=JokeType.SITUATIONAL,
+                setup="Setup",
+                punchline="Punchline",
+                timing_position=0.0,
+                characters_involved=[],
+                effectiveness_score=score
+            )
+            for i, score in enumerate([0.9, 0.8, 0.6, 0.5])
+        ]
+        
+        mean, weak, strong = joke_optimizer._score_stats(jokes)
+        
+        assert mean == pytest.approx(0.7)
+        assert weak == 1
+        assert strong == 2
+        assert joke_optimizer._score_stats([]) == (0.0, 0, 0)
+    
+    def test_classify_jokes(self, joke_optimizer):
+        """Test weak-joke selection shares the stats pass."""
+        jokes = [
+            JokeStructure(
+                joke_id=f"joke_{i}",
+                joke_type=JokeType.SITUATIONAL,
+                setup="Setup",
+                punchline="Punchline",
+                timing_position=0.0,
+                characters_involved=[],
+                effectiveness_score=score
+            )
+            for i, score in enumerate([0.9, 0.65, 0.5])
+        ]
+        
+        needs_alternatives, stats = joke_optimizer._classify_jokes(jokes)
+        
+        assert [j.joke_id for j in needs_alternatives] == ["joke_1", "joke_2"]
+        assert stats == joke_optimizer._score_stats(jokes)
+        assert stats[1:] == (1, 1)
+    
     def test_generate_optimization_summary(self, joke_optimizer):
         """Test optimization summary generation."""
         analyzed_jokes = [
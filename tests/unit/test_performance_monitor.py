@@ -187,6 +187,16 @@ class TestPerformanceMetrics:
         assert metrics.total_tokens_used == 350
         assert metrics.estimated_api_cost == pytest.approx(0.035, rel=1e-6)
     
+    def test_record_prompt_cache_reads(self):
+        """Test prompt-cache read tokens are accumulated per session."""
+        metrics = PerformanceMetrics(session_id="test_session")
+        
+        metrics.record_api_call(tokens_used=100)
+        metrics.record_api_call(tokens_used=100, cache_read_tokens=1800)
+        
+        assert metrics.prompt_cache_read_tokens == 1800
+        assert metrics.to_dict()["prompt_cache_read_tokens"] == 1800
+    
     def test_bottleneck_detection(self):
         """Test bottleneck detection for slow operations."""
         metrics = PerformanceMetrics(session_id="test_session")
@@ -0,0 +1,119 @@
+"""
+Unit tests for the token-bucket rate limiter.
+
+Copyright (c) 2025. All Rights Reserved. Patent Pending.
+"""
+
+import pytest
+from unittest.mock import patch
+
+from src.services.creative.rate_limiter import (
+    TokenBucketRateLimiter,
+    estimate_request_tokens,
+)
+
+
+class FakeClock:
+    """Monotonic clock that only advances when the limiter sleeps."""
+    
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+    
+    def monotonic(self):
+        return self.now
+    
+    async def sleep(self, seconds):
+        # Fail instead of spinning if the limiter can never admit a request
+        assert len(self.sleeps) < 100, "limiter never admitted the request"
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    """Patch the limiter's clock and sleep."""
+    fake = FakeClock()
+    with patch('src.services.creative.rate_limiter.time.monotonic', fake.monotonic), \
+         patch('src.services.creative.rate_limiter.asyncio.sleep', fake.sleep):
+        yield fake
+
+
+def test_estimate_request_tokens():
+    """Test estimate covers prompt size plus the completion budget."""
+    assert estimate_request_tokens("x" * 400, 1000) == 1100
+
+
+def test_invalid_limits_rejected():
+    """Test non-positive budgets are rejected."""
+    with pytest.raises(ValueError):
+        TokenBucketRateLimiter(requests_per_minute=0)
+    with pytest.raises(ValueError):
+        TokenBucketRateLimiter(requests_per_minute=10, tokens_per_minute=-1)
+
+
+@pytest.mark.asyncio
+async def test_acquire_within_budget_does_not_wait(clock):
+    """Test a full bucket admits requests immediately."""
+    limiter = TokenBucketRateLimiter(requests_per_minute=3, tokens_per_minute=3000)
+    
+    for _ in range(3):
+        await limiter.acquire(1000)
+    
+    assert clock.sleeps == []
+
+
+@pytest.mark.asyncio
+async def test_acquire_waits_for_request_refill(clock):
+    """Test an empty request bucket waits for one request's refill time."""
+    limiter = TokenBucketRateLimiter(requests_per_minute=2)
+    
+    await limiter.acquire()
+    await limiter.acquire()
+    await limiter.acquire()
+    
+    assert clock.sleeps == [pytest.approx(30.0)]
+
+
+@pytest.mark.asyncio
+async def test_acquire_waits_for_token_refill(clock):
+    """Test the token budget throttles even with request slots left."""
+    limiter = TokenBucketRateLimiter(requests_per_minute=100, tokens_per_minute=6000)
+    
+    await limiter.acquire(6000)
+    await limiter.acquire(3000)
+    
+    assert clock.sleeps == [pytest.approx(30.0)]
+
+
+@pytest.mark.asyncio
+async def test_oversized_request_waits_for_full_bucket(clock):
+    """Test a request larger than the TPM limit still goes through eventually."""
+    limiter = TokenBucketRateLimiter(requests_per_minute=100, tokens_per_minute=1000)
+    
+    await limiter.acquire(1000)
+    await limiter.acquire(50000)
+    
+    assert sum(clock.sleeps) == pytest.approx(60.0)
+
+
+@pytest.mark.asyncio
+async def test_fractional_rpm_still_admits_requests(clock):
+    """Test an RPM below 1 spaces requests out instead of blocking forever."""
+    limiter = TokenBucketRateLimiter(requests_per_minute=0.5)
+    
+    await limiter.acquire()
+    await limiter.acquire()
+    
+    assert sum(clock.sleeps) == pytest.approx(120.0)
+
+
+@pytest.mark.asyncio
+async def test_fractional_tpm_still_limits_tokens(clock):
+    """Test a TPM below 1 clamps requests to it rather than to zero."""
+    limiter = TokenBucketRateLimiter(requests_per_minute=100, tokens_per_minute=0.5)
+    
+    await limiter.acquire(10)
+    await limiter.acquire(10)
+    
+    assert sum(clock.sleeps) == pytest.approx(60.0)
@@ -6,6 +6,7 @@ Tests Pydantic schema validation for AI-generated JSON responses.
 Copyright (c) 2025. All Rights Reserved. Patent Pending.
 """
 
+import json
 import pytest
 from src.services.creative.response_validators import (
     AIResponseValidator,
@@ -203,3 +204,317 @@ def test_validator_error_logging():
     result = validator.validate_character_analysis(invalid_data)
     
     assert result is None
+
+
+def test_validate_character_analysis_from_raw_json():
+    """Test raw JSON text and bytes are parsed and validated in one pass."""
+    raw = json.dumps({
+        "character_name": "Lucy Ricardo",
+        "core_traits": [
+            {"trait": "Ambitious", "description": "Always seeking fame"},
+            {"trait": "Creative", "description": "Thinks outside the box"},
+            {"trait": "Loyal", "description": "Devoted to loved ones"}
+        ]
+    })
+    
+    from_text = AIResponseValidator.validate_character_analysis(raw)
+    from_bytes = AIResponseValidator.validate_character_analysis(raw.encode())
+    
+    assert from_text is not None
+    assert from_text.character_name == "Lucy Ricardo"
+    assert from_bytes == from_text
+
+
+def test_validate_character_analysis_malformed_json():
+    """Test malformed JSON text is rejected rather than raising."""
+    result = AIResponseValidator.validate_character_analysis("{not json")
+    
+    assert result is None
+
+
+def test_response_models_compiled_at_import():
+    """Test every response schema is fully built before first use."""
+    from src.services.creative.response_validators import _RESPONSE_MODELS
+    from pydantic_core import SchemaValidator
+    
+    for model in _RESPONSE_MODELS:
+        assert model.__pydantic_complete__
+        assert isinstance(model.__pydantic_validator__, SchemaValidator)
+
+
+def test_trusted_construction_round_trip():
+    """Test trusted path rebuilds nested models from validated data."""
+    data = {
+        "character_name": "Lucy Ricardo",
+        "core_traits": [
+            {"trait": "Ambitious", "description": "Always seeking fame"},
+            {"trait": "Creative", "description": "Thinks outside the box"},
+            {"trait": "Loyal", "description": "Devoted to loved ones"}
+        ],
+        "relationships": [
+            {
+                "character_name": "Ricky",
+                "relationship_type": "spouse",
+                "description": "Husband and bandleader"
+            }
+        ]
+    }
+    validated = AIResponseValidator.validate_character_analysis(data)
+    
+    trusted = AIResponseValidator.validate_character_analysis_trusted(
+        validated.model_dump()
+    )
+    
+    assert trusted == validated
+    assert isinstance(trusted.core_traits[0], CharacterTrait)
+    assert trusted.relationships[0].character_name == "Ricky"
+
+
+def test_validator_propagates_non_validation_errors():
+    """Test programmer errors are not swallowed as invalid responses."""
+    from unittest.mock import patch
+    
+    with patch.object(
+        CharacterAnalysisResponse,
+        "model_validate",
+        side_effect=RuntimeError("bug"),
+    ):
+        with pytest.raises(RuntimeError):
+            AIResponseValidator.validate_character_analysis({})
+
+
+def test_unknown_keys_are_dropped():
+    """Test extra keys from the AI are ignored rather than rejected."""
+    result = AIResponseValidator.validate_character_analysis({
+        "character_name": "Lucy",
+        "core_traits": [
+            {"trait": "Ambitious", "description": "Always seeking fame"},
+            {"trait": "Creative", "description": "Thinks outside the box"},
+            {"trait": "Loyal", "description": "Devoted to loved ones"}
+        ],
+        "confidence": 0.9
+    })
+    
+    assert result is not None
+    assert not hasattr(result, "confidence")
+
+
+def test_repeated_raw_response_hits_cache():
+    """Test byte-identical raw JSON reuses the validated instance."""
+    AIResponseValidator.clear_cache()
+    raw = json.dumps({
+        "character_name": "Lucy Ricardo",
+        "core_traits": [
+            {"trait": "Ambitious", "description": "Always seeking fame"},
+            {"trait": "Creative", "description": "Thinks outside the box"},
+            {"trait": "Loyal", "description": "Devoted to loved ones"}
+        ]
+    })
+    
+    first = AIResponseValidator.validate_character_analysis(raw)
+    again = AIResponseValidator.validate_character_analysis(raw.encode())
+    
+    assert first is not None
+    assert again is first
+    assert AIResponseValidator.validate_character_analysis(raw + " ") is not first
+    
+    AIResponseValidator.clear_cache()
+    assert AIResponseValidator.validate_character_analysis(raw) is not first
+
+
+def test_transformation_mappings_are_typed():
+    """Test original/modern mappings validate into fixed-schema models."""
+    data = {
+        "show_title": "I Love Lucy",
+        "setting_transformation": {
+            "original_setting": "1950s New York apartment",
+            "modern_equivalent": "2025 Brooklyn loft",
+            "justification": "Same urban energy"
+        },
+        "character_transformations": [{
+            "original_character": "Lucy Ricardo",
+            "original_archetype": "Ambitious housewife",
+            "modern_archetype": "Aspiring influencer",
+            "motivation_update": "Wants to go viral"
+        }],
+        "humor_transformation": {
+            "original_humor_type": "Physical comedy",
+            "modern_humor_type": "Cringe comedy",
+            "example_transformations": [
+                {"original": "Vitameatavegamin", "modern": "Drunk livestream"}
+            ]
+        },
+        "conflict_modernization": [
+            {"original": "Can't get into the show", "modern": "Can't get featured"}
+        ]
+    }
+    
+    result = AIResponseValidator.validate_transformation_rules(data)
+    
+    assert result is not None
+    assert result.humor_transformation.example_transformations[0].modern == "Drunk livestream"
+    assert result.conflict_modernization[0].original == "Can't get into the show"
+    
+    data["conflict_modernization"] = [{"original": "Missing modern half"}]
+    assert AIResponseValidator.validate_transformation_rules(data) is None
+
+
+def test_act_breakdown_keeps_known_and_extra_acts():
+    """Test act_breakdown exposes fixed act fields plus any extra acts."""
+    from src.services.creative.response_validators import PlotStructure
+    
+    plot = PlotStructure.model_validate({
+        "structure_type": "episodic",
+        "act_breakdown": {
+            "teaser": "Cold open",
+            "act_1": "Setup",
+            "act_2": "Escalation",
+            "act_4": "Second twist"
+        }
+    })
+    
+    assert plot.act_breakdown.act_1 == "Setup"
+    assert plot.act_breakdown.acts() == {
+        "teaser": "Cold open",
+        "act_1": "Setup",
+        "act_2": "Escalation",
+        "act_4": "Second twist"
+    }
+
+
+def test_validate_character_analysis_lite():
+    """Test the lite path parses and shape-checks without building models."""
+    raw = json.dumps({
+        "character_name": "Lucy Ricardo",
+        "core_traits": [
+            {"trait": "Ambitious", "description": "Always seeking fame"},
+            {"trait": "Creative", "description": "Thinks outside the box"},
+            {"trait": "Loyal", "description": "Devoted to loved ones"}
+        ],
+        "catchphrases": ["Ricky!"]
+    })
+    
+    result = AIResponseValidator.validate_character_analysis_lite(raw.encode())
+    
+    assert isinstance(result, dict)
+    assert result["catchphrases"] == ["Ricky!"]
+    assert AIResponseValidator.validate_character_analysis_lite("{not json") is None
+    assert AIResponseValidator.validate_character_analysis_lite(
+        json.dumps({"character_name": "Lucy", "core_traits": []})
+    ) is None
+
+
+def test_shared_list_fields_keep_independent_defaults():
+    """Test shared Field constants still give each instance its own list."""
+    first = CharacterTrait(trait="Loyal", description="Devoted to loved ones")
+    second = CharacterTrait(trait="Brave", description="Faces every challenge")
+    
+    first.examples.append("Sticks by Ethel")
+    
+    assert second.examples == []
+    assert CharacterTrait.model_fields["examples"].metadata
+
+
+def test_validator_has_no_instance_dict():
+    """Test the stateless validator allocates no per-instance __dict__."""
+    assert not hasattr(AIResponseValidator(), "__dict__")
+
+
+def test_validate_character_analyses_batch():
+    """Test a list of analyses validates in one call, all-or-nothing."""
+    traits = [
+        {"trait": "Ambitious", "description": "Always seeking fame"},
+        {"trait": "Creative", "description": "Thinks outside the box"},
+        {"trait": "Loyal", "description": "Devoted to loved ones"}
+    ]
+    batch = [
+        {"character_name": "Lucy Ricardo", "core_traits": traits},
+        {"character_name": "Ethel Mertz", "core_traits": traits}
+    ]
+    
+    result = AIResponseValidator.validate_character_analyses_batch(batch)
+    from_json = AIResponseValidator.validate_character_analyses_batch(json.dumps(batch))
+    
+    assert [r.character_name for r in result] == ["Lucy Ricardo", "Ethel Mertz"]
+    assert from_json == result
+    
+    batch.append({"character_name": "Ricky", "core_traits": []})
+    assert AIResponseValidator.validate_character_analyses_batch(batch) is None
+
+
+def test_strict_validation_falls_back_to_coercion():
+    """Test schemas are strict but a stringly-typed number still validates."""
+    from src.services.creative.response_validators import PlotStructure
+    
+    data = {
+        "show_title": "I Love Lucy",
+        "plot_structure": {
+            "structure_type": "episodic",
+            "act_breakdown": {"act_1": "Setup"},
+            "typical_runtime": "22"
+        }
+    }
+    
+    assert PlotStructure.model_config["strict"] is True
+    result = AIResponseValidator.validate_narrative_analysis(data)
+    
+    assert result is not None
+    assert result.plot_structure.typical_runtime == 22
+
+
+def test_schema_preflight_builds_valid_dicts_without_pydantic():
+    """Test dicts passing the JSON Schema check skip model_validate."""
+    pytest.importorskip("fastjsonschema")
+    from unittest.mock import patch
+    
+    data = {
+        "character_name": "Lucy Ricardo",
+        "core_traits": [
+            {"trait": "Ambitious", "description": "Always seeking fame"},
+            {"trait": "Creative", "description": "Thinks outside the box"},
+            {"trait": "Loyal", "description": "Devoted to loved ones"}
+        ],
+        "confidence": 0.9
+    }
+    
+    with patch.object(
+        CharacterAnalysisResponse, "model_validate",
+        side_effect=AssertionError("pre-flight should have passed"),
+    ):
+        result = AIResponseValidator.validate_character_analysis(data)
+    
+    assert isinstance(result.core_traits[0], CharacterTrait)
+    assert result.speech_patterns == []
+    assert not hasattr(result, "confidence")
+    assert "speech_patterns" not in data
+    
+    data["core_traits"] = data["core_traits"][:1]
+    assert AIResponseValidator.validate_character_analysis(data) is None
+
+
+def test_schema_preflight_converts_integral_floats():
+    """Test the pre-flight path stores ints as the validated path does."""
+    pytest.importorskip("fastjsonschema")
+    
+    data = {
+        "show_title": "I Love Lucy",
+        "plot_structure": {
+            "structure_type": "episodic",
+            "act_breakdown": {"act_1": "Setup"},
+            "typical_runtime": 22.0
+        }
+    }
+    
+    result = AIResponseValidator.validate_narrative_analysis(data)
+    
+    assert result.plot_structure.typical_runtime == 22
+    assert type(result.plot_structure.typical_runtime) is int
+    assert data["plot_structure"]["typical_runtime"] == 22.0
+
+
+def test_schemas_reexported_from_validators():
+    """Test schema classes stay importable from response_validators."""
+    from src.services.creative import response_schemas, response_validators
+    
+    for model in response_schemas._RESPONSE_MODELS:
+        assert getattr(response_validators, model.__name__) is model
@@ -7,11 +7,21 @@ Tests component coordination, scene generation, refinement loop,
 export formats, and data model serialization.
 """
 
+import asyncio
+import copy
+import json
+import httpx
 import pytest
 from unittest.mock import Mock, patch, AsyncMock, MagicMock
 from datetime import datetime
 
-from src.services.creative.script_generator import ScriptGenerator
+from src.services.creative.script_generator import (
+    ScriptGenerator,
+    _canonical_json,
+    _count_comedy_lines,
+)
+from src.services.creative.claude_client import ClaudeClient
+from src.services.creative.openai_client import OpenAIClient
 from src.services.creative.script_models import (
     SceneScript,
     RefinementIteration,
@@ -409,6 +419,13 @@ def create_mock_comedy_analysis():
     return mock
 
 
+def refine_with_new_comedy(generator, comedy_analysis):
+    """Make every refinement pass return a freshly re-scored comedy analysis."""
+    async def refine(scene_scripts, all_dialogues, profiles, report):
+        return scene_scripts, copy.copy(comedy_analysis), set()
+    generator._refine_script = AsyncMock(side_effect=refine)
+
+
 def create_mock_validation_report(passing=True):
     """Create mock validation report."""
     mock = Mock()
@@ -518,6 +535,120 @@ class TestSceneGeneration:
         assert scene_script.stage_directions == mock_stage_directions
         assert scene_script.estimated_runtime == 60.0
 
+    @pytest.mark.asyncio
+    async def test_scene_cache_reuses_unchanged_scenes(
+        self,
+        script_generator,
+        sample_episode_outline,
+        sample_voice_profiles,
+        mock_scene_dialogue,
+        mock_stage_directions,
+    ):
+        """Test cached scenes are reused until the outline or profiles change."""
+        from src.services.caching import RedisCacheManager
+        script_generator.scene_cache = RedisCacheManager(enable_redis=False)
+        script_generator.dialogue_generator.generate_dialogue = AsyncMock(
+            return_value=mock_scene_dialogue
+        )
+        script_generator.stage_direction_generator.generate_stage_directions = (
+            AsyncMock(return_value=mock_stage_directions)
+        )
+        scene_outline = sample_episode_outline["scenes"][0]
+        
+        first = await script_generator._generate_scene_script(
+            scene_outline, sample_voice_profiles
+        )
+        second = await script_generator._generate_scene_script(
+            scene_outline, sample_voice_profiles
+        )
+        
+        assert script_generator.dialogue_generator.generate_dialogue.await_count == 1
+        assert second.to_dict() == first.to_dict()
+        assert second is not first
+        
+        # Entries are plain JSON, and hits never share state
+        cached = script_generator.scene_cache.memory_cache.cache
+        assert json.loads(json.dumps(list(cached.values())[0]))
+        second.characters_present.append("Gerald")
+        second.production_notes.append("Edited")
+        third = await script_generator._generate_scene_script(
+            scene_outline, sample_voice_profiles
+        )
+        assert "Gerald" not in third.characters_present
+        assert third.production_notes == []
+        
+        # Editing the outline invalidates the scene
+        await script_generator._generate_scene_script(
+            {**scene_outline, "description": "Something else entirely"},
+            sample_voice_profiles,
+        )
+        assert script_generator.dialogue_generator.generate_dialogue.await_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_dialogue_and_staging_run_concurrently(
+        self,
+        script_generator,
+        sample_episode_outline,
+        sample_voice_profiles,
+    ):
+        """Staging starts before dialogue finishes and falls back on error."""
+        dialogue_started = asyncio.Event()
+        staging_started = asyncio.Event()
+
+        async def slow_dialogue(**kwargs):
+            dialogue_started.set()
+            await asyncio.wait_for(staging_started.wait(), timeout=1)
+            return create_mock_dialogue()
+
+        async def failing_staging(**kwargs):
+            staging_started.set()
+            assert kwargs["scene_dialogue"] is None
+            raise RuntimeError("staging unavailable")
+
+        script_generator.dialogue_generator.generate_dialogue = slow_dialogue
+        script_generator.stage_direction_generator.generate_stage_directions = (
+            failing_staging
+        )
+
+        scene_script = await script_generator._generate_scene_script(
+            sample_episode_outline["scenes"][0], sample_voice_profiles
+        )
+
+        assert dialogue_started.is_set()
+        assert scene_script.stage_directions.action_beats == []
+        assert scene_script.stage_directions.opening_description.startswith(
+            "Scene at"
+        )
+
+    def test_comedy_beat_count(
+        self,
+        script_generator,
+        sample_episode_outline,
+        mock_scene_dialogue,
+        mock_stage_directions,
+    ):
+        """Lines with a comedy keyword or !/? count as comedy beats."""
+        lines = ["WHOOPS", "Then we leave.", "That's it.", "Fine", "Really?"]
+        mock_scene_dialogue.dialogue_lines = [
+            DialogueLine(character="Luna", line=line, emotion="neutral")
+            for line in lines
+        ]
+
+        scene_script = script_generator._assemble_scene_script(
+            sample_episode_outline["scenes"][0],
+            mock_scene_dialogue,
+            mock_stage_directions,
+        )
+
+        # Case-insensitive substring match: "That's" contains "ha"
+        assert scene_script.comedy_beat_count == 3
+
+    def test_comedy_beat_count_counts_each_line_once(self):
+        """Several keywords on one line, or a multi-line line, count once."""
+        assert _count_comedy_lines([]) == 0
+        assert _count_comedy_lines(["Ha! Oh? Wow!", "Fine"]) == 1
+        assert _count_comedy_lines(["Fine\nOh no!", "Whoops\nhaha"]) == 2
+
 
 # ============================================================================
 # FULL SCRIPT GENERATION TESTS
@@ -585,6 +716,9 @@ class TestFullScriptGeneration:
         assert full_script.final_quality_score == 0.88
         assert full_script.final_validation_report.validation_passed
         assert len(full_script.refinement_iterations) == 0  # Passed first time
+        assert full_script.total_runtime == sum(
+            scene.estimated_runtime for scene in full_script.scenes
+        )
     
     @pytest.mark.asyncio
     @patch('src.services.creative.script_generator.ScriptValidator')
@@ -619,16 +753,19 @@ class TestFullScriptGeneration:
         mock_joke_opt.return_value.optimize_script_comedy = AsyncMock(
             return_value=mock_comedy_analysis
         )
-        mock_validator.return_value.validate_script.side_effect = [
-            mock_validation_report_failing,  # First validation fails
-            mock_validation_report_passing,  # After refinement passes
-        ]
+        mock_validator.return_value.validate_script.return_value = (
+            mock_validation_report_failing  # First validation fails
+        )
+        mock_validator.return_value.revalidate_comedy.return_value = (
+            mock_validation_report_passing  # After refinement passes
+        )
         
         # Update generator components
         script_generator.dialogue_generator = mock_dialogue_gen.return_value
         script_generator.stage_direction_generator = mock_stage_gen.return_value
         script_generator.joke_optimizer = mock_joke_opt.return_value
         script_generator.script_validator = mock_validator.return_value
+        refine_with_new_comedy(script_generator, mock_comedy_analysis)
         
         # Generate script
         full_script = await script_generator.generate_full_script(
@@ -687,6 +824,9 @@ class TestRefinementLoop:
         mock_validator.return_value.validate_script.return_value = (
             mock_validation_report_failing
         )
+        mock_validator.return_value.revalidate_comedy.return_value = (
+            mock_validation_report_failing
+        )
         
         # Update generator components
         script_generator.dialogue_generator = mock_dialogue_gen.return_value
@@ -694,6 +834,8 @@ class TestRefinementLoop:
         script_generator.joke_optimizer = mock_joke_opt.return_value
         script_generator.script_validator = mock_validator.return_value
         
+        refine_with_new_comedy(script_generator, mock_comedy_analysis)
+        
         # Set max iterations to 3
         script_generator.max_refinement_iterations = 3
         
@@ -709,6 +851,144 @@ class TestRefinementLoop:
         assert len(full_script.refinement_iterations) == 3
         assert not full_script.final_validation_report.validation_passed
         assert full_script.final_quality_score == 0.65
+        
+        # Refinement changed no dialogue, so only comedy was re-scored
+        assert mock_validator.return_value.validate_script.call_count == 1
+        assert mock_validator.return_value.revalidate_comedy.call_count == 3
+        # ...and the unchanged dialogue was never re-optimized
+        assert mock_joke_opt.return_value.optimize_script_comedy.call_count == 1
+        assert all(
+            it.scenes_modified == [] for it in full_script.refinement_iterations
+        )
+
+    @pytest.mark.asyncio
+    @patch('src.services.creative.script_generator.ScriptValidator')
+    @patch('src.services.creative.script_generator.JokeOptimizer')
+    @patch('src.services.creative.script_generator.StageDirectionGenerator')
+    @patch('src.services.creative.script_generator.DialogueGenerator')
+    async def test_refinement_stops_when_nothing_changes(
+        self,
+        mock_dialogue_gen,
+        mock_stage_gen,
+        mock_joke_opt,
+        mock_validator,
+        script_generator,
+        sample_episode_outline,
+        sample_voice_profiles,
+        sample_show_metadata,
+        mock_scene_dialogue,
+        mock_stage_directions,
+        mock_comedy_analysis,
+        mock_validation_report_failing,
+        caplog,
+    ):
+        """Test a refinement pass that changes nothing ends the loop unrecorded."""
+        mock_dialogue_gen.return_value.generate_dialogue = AsyncMock(
+            return_value=mock_scene_dialogue
+        )
+        mock_stage_gen.return_value.generate_stage_directions.return_value = (
+            mock_stage_directions
+        )
+        mock_joke_opt.return_value.optimize_script_comedy = AsyncMock(
+            return_value=mock_comedy_analysis
+        )
+        mock_validator.return_value.validate_script.return_value = (
+            mock_validation_report_failing
+        )
+        
+        script_generator.dialogue_generator = mock_dialogue_gen.return_value
+        script_generator.stage_direction_generator = mock_stage_gen.return_value
+        script_generator.joke_optimizer = mock_joke_opt.return_value
+        script_generator.script_validator = mock_validator.return_value
+        script_generator.max_refinement_iterations = 3
+        
+        with caplog.at_level("WARNING"):
+            full_script = await script_generator.generate_full_script(
+                script_id="test_stalled",
+                episode_outline=sample_episode_outline,
+                character_profiles=sample_voice_profiles,
+                show_metadata=sample_show_metadata,
+            )
+        
+        # No scene changed and the comedy memo was reused: one attempt, and
+        # no fake iteration or re-score
+        assert full_script.refinement_iterations == []
+        assert full_script.final_quality_score == 0.65
+        assert mock_validator.return_value.revalidate_comedy.call_count == 0
+        assert mock_joke_opt.return_value.optimize_script_comedy.call_count == 1
+        assert "cannot make further progress" in caplog.text
+        assert any(
+            "stopped early" in note for note in full_script.generation_notes
+        )
+
+    @pytest.mark.asyncio
+    @patch('src.services.creative.script_generator.ScriptValidator')
+    @patch('src.services.creative.script_generator.JokeOptimizer')
+    @patch('src.services.creative.script_generator.StageDirectionGenerator')
+    @patch('src.services.creative.script_generator.DialogueGenerator')
+    async def test_validation_runs_off_event_loop(
+        self,
+        mock_dialogue_gen,
+        mock_stage_gen,
+        mock_joke_opt,
+        mock_validator,
+        script_generator,
+        sample_episode_outline,
+        sample_voice_profiles,
+        sample_show_metadata,
+        mock_scene_dialogue,
+        mock_stage_directions,
+        mock_comedy_analysis,
+        mock_validation_report_failing,
+        mock_validation_report_passing,
+    ):
+        """Test that synchronous validation never blocks the event loop thread."""
+        import threading
+        from unittest.mock import AsyncMock
+        loop_thread = threading.get_ident()
+        validator_threads = []
+
+        def record_thread(report):
+            def _call(*args, **kwargs):
+                validator_threads.append(threading.get_ident())
+                return report
+            return _call
+
+        mock_dialogue_gen.return_value.generate_dialogue = AsyncMock(
+            return_value=mock_scene_dialogue
+        )
+        mock_stage_gen.return_value.generate_stage_directions.return_value = (
+            mock_stage_directions
+        )
+        mock_joke_opt.return_value.optimize_script_comedy = AsyncMock(
+            return_value=mock_comedy_analysis
+        )
+        mock_validator.return_value.validate_noncomedy.side_effect = (
+            record_thread(None)
+        )
+        mock_validator.return_value.validate_script.side_effect = (
+            record_thread(mock_validation_report_failing)
+        )
+        mock_validator.return_value.revalidate_comedy.side_effect = (
+            record_thread(mock_validation_report_passing)
+        )
+
+        script_generator.dialogue_generator = mock_dialogue_gen.return_value
+        script_generator.stage_direction_generator = mock_stage_gen.return_value
+        script_generator.joke_optimizer = mock_joke_opt.return_value
+        script_generator.script_validator = mock_validator.return_value
+        refine_with_new_comedy(script_generator, mock_comedy_analysis)
+
+        await script_generator.generate_full_script(
+            script_id="test_thread",
+            episode_outline=sample_episode_outline,
+            character_profiles=sample_voice_profiles,
+            show_metadata=sample_show_metadata,
+        )
+
+        # noncomedy pass, full validation, one comedy re-score
+        assert len(validator_threads) == 3
+        assert loop_thread not in validator_threads
 
 
 # ============================================================================
@@ -798,6 +1078,225 @@ class TestExportFormats:
         assert "TEST EPISODE" in content  # Title is uppercase in screenplay
         assert "SCENE 1" in content
         assert "LUNA" in content
+    
+    def test_scene_screenplay_layout(self, mock_scene_dialogue, mock_stage_directions):
+        """Test the exact screenplay text of one scene."""
+        mock_scene_dialogue.dialogue_lines[1].emotion = ""
+        scene = SceneScript(
+            scene_number=2,
+            scene_title="Big Idea",
+            location="Control Room",
+            time_of_day="Night",
+            characters_present=["Luna", "Rick"],
+            dialogue=mock_scene_dialogue,
+            stage_directions=mock_stage_directions,
+            estimated_runtime=60.0,
+            comedy_beat_count=1,
+        )
+        
+        assert scene.to_screenplay_format() == (
+            "\n\nSCENE 2 - BIG IDEA\n"
+            "INT./EXT. CONTROL ROOM - NIGHT\n"
+            "\nModern space station control room\n"
+            "\nLUNA\n(excited)\nRick, I have the most wonderful idea!\n"
+            "\nRICK\nLuna, what are you planning now?\n"
+            "\nLuna bounces excitedly\n"
+        )
+    
+    def test_scene_screenplay_rendered_once_across_formats(
+        self, monkeypatch, mock_scene_dialogue, mock_stage_directions
+    ):
+        """Test the production format reuses the cached screenplay."""
+        scene = SceneScript(
+            scene_number=1,
+            scene_title="Big Idea",
+            location="Control Room",
+            time_of_day="Day",
+            characters_present=["Luna", "Rick"],
+            dialogue=mock_scene_dialogue,
+            stage_directions=mock_stage_directions,
+            estimated_runtime=60.0,
+            comedy_beat_count=1,
+        )
+        renders = []
+        original = SceneScript._iter_screenplay_format
+        
+        def counting_iter(self):
+            renders.append(self.scene_number)
+            return original(self)
+        
+        monkeypatch.setattr(SceneScript, "_iter_screenplay_format", counting_iter)
+        
+        screenplay = scene.to_screenplay_format()
+        production = scene.to_production_format()
+        
+        assert renders == [1]
+        assert production.endswith(screenplay)
+        assert SceneScript.from_dict(scene.to_dict())._screenplay_cache is None
+    
+    def test_markdown_reuses_scene_screenplays(
+        self, monkeypatch, mock_scene_dialogue, mock_stage_directions
+    ):
+        """Test Markdown export embeds screenplays already rendered."""
+        scenes = [
+            SceneScript(
+                scene_number=number,
+                scene_title=f"Scene {number}",
+                location="Control Room",
+                time_of_day="Day",
+                characters_present=["Luna", "Rick"],
+                dialogue=mock_scene_dialogue,
+                stage_directions=mock_stage_directions,
+                estimated_runtime=60.0,
+                comedy_beat_count=1,
+            )
+            for number in (1, 2)
+        ]
+        full_script = FullScript(
+            script_id="test_markdown",
+            episode_title="Test Episode",
+            show_title="Test Show",
+            episode_number=1,
+            season_number=1,
+            writers=["Test Writer"],
+            original_show="Test Original",
+            doppelganger_setting="Test Setting",
+            scenes=scenes,
+            generation_timestamp=datetime(2025, 1, 1, 12, 0),
+            total_runtime=120.0,
+            total_comedy_beats=2,
+            final_validation_report=Mock(),
+            final_quality_score=0.85,
+            budget_estimate="low",
+            location_count=1,
+            special_effects_count=0,
+        )
+        renders = []
+        original = SceneScript._iter_screenplay_format
+        
+        def counting_iter(self):
+            renders.append(self.scene_number)
+            return original(self)
+        
+        monkeypatch.setattr(SceneScript, "_iter_screenplay_format", counting_iter)
+        
+        full_script.to_screenplay_format()
+        markdown = full_script._to_markdown()
+        
+        assert renders == [1, 2]
+        assert "## Scenes\n\n### Scene 1: Scene 1\n\n" in markdown
+        for scene in scenes:
+            assert f"```\n{scene.to_screenplay_format()}\n```" in markdown
+    
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_export_json_matches_to_dict(
+        self,
+        monkeypatch,
+        tmp_path,
+        use_orjson,
+        mock_scene_dialogue,
+        mock_stage_directions,
+    ):
+        """Test JSON export writes to_dict() with either encoder."""
+        import json
+        import src.services.creative.script_models as script_models_module
+        if use_orjson and not script_models_module.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(script_models_module, "ORJSON_AVAILABLE", use_orjson)
+        
+        scene = SceneScript(
+            scene_number=1,
+            scene_title="Café Scene",
+            location="Control Room",
+            time_of_day="Day",
+            characters_present=["Luna", "Rick"],
+            dialogue=mock_scene_dialogue,
+            stage_directions=mock_stage_directions,
+            estimated_runtime=60.0,
+            comedy_beat_count=1,
+        )
+        full_script = FullScript(
+            script_id="test_json",
+            episode_title="Test Episode",
+            show_title="Test Show",
+            episode_number=1,
+            season_number=1,
+            writers=["Test Writer"],
+            original_show="Test Original",
+            doppelganger_setting="Test Setting",
+            scenes=[scene],
+            generation_timestamp=datetime(2025, 1, 1, 12, 0),
+            total_runtime=60.0,
+            total_comedy_beats=1,
+            final_validation_report=Mock(
+                to_dict=Mock(return_value={"overall_quality_score": 0.85})
+            ),
+            final_quality_score=0.85,
+            budget_estimate="low",
+            location_count=1,
+            special_effects_count=0,
+        )
+        
+        output_path = tmp_path / "script.json"
+        full_script.export(ScriptFormat.JSON, str(output_path))
+        
+        content = output_path.read_text(encoding="utf-8")
+        assert json.loads(content) == full_script.to_dict()
+        assert content.startswith('{\n  "')
+    
+    @pytest.mark.parametrize("script_format, render", [
+        (ScriptFormat.SCREENPLAY, FullScript.to_screenplay_format),
+        (ScriptFormat.PRODUCTION, FullScript.to_production_script),
+        (ScriptFormat.MARKDOWN, FullScript._to_markdown),
+    ])
+    def test_text_export_written_in_blocks(
+        self, monkeypatch, tmp_path, script_format, render,
+        mock_scene_dialogue, mock_stage_directions
+    ):
+        """Test block-encoded export matches the rendered text byte for byte."""
+        import src.services.creative.script_models as script_models_module
+        # Small blocks so the export spans many encode-and-write steps
+        monkeypatch.setattr(script_models_module, "_WRITE_BLOCK_CHARS", 16)
+        
+        scene = SceneScript(
+            scene_number=1,
+            scene_title="Café Scene",
+            location="Control Room",
+            time_of_day="Day",
+            characters_present=["Luna", "Rick"],
+            dialogue=mock_scene_dialogue,
+            stage_directions=mock_stage_directions,
+            estimated_runtime=60.0,
+            comedy_beat_count=1,
+        )
+        full_script = FullScript(
+            script_id="test_blocks",
+            episode_title="Test Episode",
+            show_title="Test Show",
+            episode_number=1,
+            season_number=1,
+            writers=["Test Writer"],
+            original_show="Test Original",
+            doppelganger_setting="Test Setting",
+            scenes=[scene],
+            generation_timestamp=datetime(2025, 1, 1, 12, 0),
+            total_runtime=60.0,
+            total_comedy_beats=1,
+            final_validation_report=Mock(
+                overall_quality_score=0.85,
+                validation_passed=True,
+                recommendations=[],
+            ),
+            final_quality_score=0.85,
+            budget_estimate="low",
+            location_count=1,
+            special_effects_count=0,
+        )
+        
+        output_path = tmp_path / "script.txt"
+        full_script.export(script_format, str(output_path))
+        
+        assert output_path.read_bytes() == render(full_script).encode("utf-8")
 
 
 # ============================================================================
@@ -864,6 +1363,96 @@ class TestDataModelSerialization:
         
         assert restored.iteration_number == iteration.iteration_number
         assert restored.quality_score == iteration.quality_score
+    
+    def test_full_script_round_trip(
+        self,
+        mock_scene_dialogue,
+        mock_stage_directions,
+        mock_validation_report_passing,
+    ):
+        """Test FullScript survives to_dict/from_dict unchanged."""
+        scene = SceneScript(
+            scene_number=1,
+            scene_title="Test",
+            location="Room",
+            time_of_day="Day",
+            characters_present=["Luna", "Rick"],
+            dialogue=mock_scene_dialogue,
+            stage_directions=mock_stage_directions,
+            estimated_runtime=60.0,
+            comedy_beat_count=1,
+            production_notes=["1 camera setups"],
+        )
+        full_script = FullScript(
+            script_id="round_trip",
+            episode_title="Test Episode",
+            show_title="Test Show",
+            episode_number=2,
+            season_number=1,
+            writers=["Test Writer"],
+            original_show="Test Original",
+            doppelganger_setting="Test Setting",
+            scenes=[scene],
+            generation_timestamp=datetime(2025, 1, 1, 12, 0),
+            total_runtime=60.0,
+            total_comedy_beats=1,
+            final_validation_report=mock_validation_report_passing,
+            final_quality_score=0.88,
+            refinement_iterations=[
+                RefinementIteration(
+                    iteration_number=1,
+                    timestamp=datetime(2025, 1, 1, 12, 1),
+                    validation_report=mock_validation_report_passing,
+                    quality_score=0.88,
+                    validation_passed=True,
+                    issues_addressed=[],
+                    improvements_made=["Quality improved by 0.10"],
+                    scenes_modified=[1],
+                )
+            ],
+            budget_estimate="low",
+            location_count=1,
+            special_effects_count=0,
+            generation_notes=["Generated in 1.0s"],
+        )
+        
+        data = full_script.to_dict()
+        restored = FullScript.from_dict(data)
+        
+        assert restored.to_dict() == data
+        
+        # Already-parsed timestamps pass straight through
+        data["generation_timestamp"] = full_script.generation_timestamp
+        data["refinement_iterations"][0]["timestamp"] = datetime(2025, 1, 1, 12, 1)
+        restored = FullScript.from_dict(data)
+        assert restored.generation_timestamp == full_script.generation_timestamp
+        assert restored.refinement_iterations[0].timestamp == datetime(
+            2025, 1, 1, 12, 1
+        )
+        assert restored.generated_date == full_script.generation_timestamp.strftime(
+            '%B %d, %Y'
+        )
+    
+    def test_scene_script_slots_and_pickling(
+        self, mock_scene_dialogue, mock_stage_directions
+    ):
+        """Test slotted SceneScript has no __dict__ and still pickles."""
+        import pickle
+        scene = SceneScript(
+            scene_number=1,
+            scene_title="Test",
+            location="Room",
+            time_of_day="Day",
+            characters_present=["Luna"],
+            dialogue=mock_scene_dialogue,
+            stage_directions=mock_stage_directions,
+            estimated_runtime=60.0,
+            comedy_beat_count=1,
+        )
+        
+        assert not hasattr(scene, "__dict__")
+        restored = pickle.loads(pickle.dumps(scene))
+        assert restored.to_dict() == scene.to_dict()
 
 
 # ============================================================================
@@ -1050,6 +1639,167 @@ class TestHelperMethods:
         # Get Docking Bay scenes
         docking_scenes = full_script.get_scenes_by_location("Docking Bay")
         assert len(docking_scenes) == 1
+    
+    def test_scene_lookups_after_scene_edit(
+        self, mock_scene_dialogue, mock_stage_directions
+    ):
+        """Test lookups use the index and see scenes added after a reset."""
+        def make_scene(number, characters, location):
+            return SceneScript(
+                scene_number=number,
+                scene_title=f"Scene {number}",
+                location=location,
+                time_of_day="Day",
+                characters_present=characters,
+                dialogue=mock_scene_dialogue,
+                stage_directions=mock_stage_directions,
+                estimated_runtime=30.0,
+                comedy_beat_count=1,
+            )
+        
+        full_script = FullScript(
+            script_id="test",
+            episode_title="Test",
+            show_title="Test",
+            episode_number=1,
+            season_number=1,
+            writers=["Test"],
+            original_show="Test",
+            doppelganger_setting="Test",
+            scenes=[make_scene(1, ["Luna", "Luna"], "Control Room")],
+            generation_timestamp=datetime.now(),
+            total_runtime=30.0,
+            total_comedy_beats=1,
+            final_validation_report=Mock(),
+            final_quality_score=0.8,
+            budget_estimate="low",
+            location_count=1,
+            special_effects_count=0,
+        )
+        
+        # A character listed twice still yields the scene once
+        assert len(full_script.get_scenes_by_character("Luna")) == 1
+        assert full_script.get_scenes_by_location("CONTROL ROOM")[0].scene_number == 1
+        
+        # Growing or replacing the scenes list is picked up without help
+        full_script.scenes.append(make_scene(2, ["Rick"], "Docking Bay"))
+        
+        assert full_script.get_scene(2).scene_number == 2
+        assert len(full_script.get_scenes_by_character("Rick")) == 1
+        assert full_script.get_scene(3) is None
+        
+        full_script.scenes = full_script.scenes[1:]
+        assert full_script.get_scene(1) is None
+        
+        # Editing a scene in place needs an explicit invalidate()
+        full_script.scenes[0].location = "Bridge"
+        full_script.invalidate()
+        assert full_script.get_scenes_by_location("bridge")[0].scene_number == 2
+        assert full_script.get_scenes_by_location("Docking Bay") == []
+    
+    def test_refresh_totals_after_scene_edit(
+        self, mock_scene_dialogue, mock_stage_directions
+    ):
+        """Test refresh_totals re-derives runtime and locations from scenes."""
+        def make_scene(number, location, runtime):
+            return SceneScript(
+                scene_number=number,
+                scene_title=f"Scene {number}",
+                location=location,
+                time_of_day="Day",
+                characters_present=["Luna"],
+                dialogue=mock_scene_dialogue,
+                stage_directions=mock_stage_directions,
+                estimated_runtime=runtime,
+                comedy_beat_count=1,
+            )
+        
+        full_script = FullScript(
+            script_id="test",
+            episode_title="Test",
+            show_title="Test",
+            episode_number=1,
+            season_number=1,
+            writers=["Test"],
+            original_show="Test",
+            doppelganger_setting="Test",
+            scenes=[make_scene(1, "Control Room", 30.0)],
+            generation_timestamp=datetime.now(),
+            total_runtime=30.0,
+            total_comedy_beats=4,
+            final_validation_report=Mock(),
+            final_quality_score=0.8,
+            budget_estimate="low",
+            location_count=1,
+            special_effects_count=0,
+        )
+        assert full_script.get_scene(2) is None
+        assert full_script.runtime_minutes == "0.5"
+        
+        full_script.scenes.append(make_scene(2, "Docking Bay", 45.0))
+        full_script.scenes.append(make_scene(3, "Control Room", 15.0))
+        full_script.refresh_totals()
+        
+        assert full_script.total_runtime == 90.0
+        assert full_script.location_count == 2
+        assert full_script.runtime_minutes == "1.5"
+        # Comedy beats come from the comedy analysis, not the scenes
+        assert full_script.total_comedy_beats == 4
+        assert full_script.get_scene(2).scene_number == 2
+    
+    def test_exports_follow_edits(
+        self, mock_scene_dialogue, mock_stage_directions
+    ):
+        """Test edits after an export show up in the next export."""
+        scene = SceneScript(
+            scene_number=1,
+            scene_title="Scene 1",
+            location="Control Room",
+            time_of_day="Day",
+            characters_present=["Luna"],
+            dialogue=mock_scene_dialogue,
+            stage_directions=mock_stage_directions,
+            estimated_runtime=30.0,
+            comedy_beat_count=1,
+        )
+        full_script = FullScript(
+            script_id="test",
+            episode_title="Test",
+            show_title="Test",
+            episode_number=1,
+            season_number=1,
+            writers=["Ann"],
+            original_show="Test",
+            doppelganger_setting="Test",
+            scenes=[scene],
+            generation_timestamp=datetime(2025, 1, 1),
+            total_runtime=30.0,
+            total_comedy_beats=1,
+            final_validation_report=Mock(),
+            final_quality_score=0.8,
+            budget_estimate="low",
+            location_count=1,
+            special_effects_count=0,
+        )
+        full_script.to_screenplay_format()
+        
+        # Plain fields are never cached across exports
+        full_script.writers.append("Bea")
+        full_script.generation_timestamp = datetime(2025, 2, 1)
+        full_script.total_runtime = 90.0
+        scene.characters_present.append("Rick")
+        
+        screenplay = full_script.to_screenplay_format()
+        assert "Written by: Ann, Bea" in screenplay
+        assert "Generated: February 01, 2025" in screenplay
+        assert "Characters: Luna, Rick" in scene.to_production_format()
+        assert full_script.runtime_minutes == "1.5"
+        
+        # Rendered scene text is reused until invalidated
+        mock_scene_dialogue.dialogue_lines[0].line = "A brand new line"
+        assert "A brand new line" not in full_script.to_screenplay_format()
+        full_script.invalidate()
+        assert "A brand new line" in full_script.to_screenplay_format()
 
 
 # ============================================================================
@@ -1314,7 +2064,7 @@ class TestParallelSceneGeneration:
             progress_callback=progress_callback,
         )
         
-        # Verify progress updates - should have 3 updates (one per scene start)
+        # Verify progress updates - should have 3 updates (one per scene done)
         assert len(progress_updates) == 3, (
             f"Should have 3 progress updates, got {len(progress_updates)}"
         )
@@ -1324,20 +2074,62 @@ class TestParallelSceneGeneration:
             update['total'] == 3 for update in progress_updates
         ), "All updates should have total=3"
         
-        current_indices = [update['current'] for update in progress_updates]
-        assert current_indices == [0, 1, 2], (
-            "Should have current indices 0, 1, 2"
+        completed_counts = [update['current'] for update in progress_updates]
+        assert completed_counts == [1, 2, 3], (
+            "Should report 1, 2, 3 scenes completed"
         )
         
         # Verify status messages
         assert all(
-            'Generating scene' in update['status']
+            'Completed scene' in update['status']
             for update in progress_updates
-        ), "All statuses should mention 'Generating scene'"
+        ), "All statuses should mention 'Completed scene'"
         
         # Verify all scenes generated
         assert len(script.scenes) == 3
     
+    @pytest.mark.asyncio
+    async def test_scenes_reported_as_completed_in_episode_order(
+        self,
+        script_generator,
+        sample_episode_outline,
+        sample_voice_profiles,
+        mock_scene_dialogue,
+        mock_stage_directions,
+    ):
+        """Progress follows completion order; results keep outline order."""
+        async def generate_scene(
+            scene_outline, character_profiles, rendered_profiles=None
+        ):
+            # Later scenes finish first
+            await asyncio.sleep(0.01 * (4 - scene_outline["scene_number"]))
+            return script_generator._assemble_scene_script(
+                scene_outline, mock_scene_dialogue, mock_stage_directions
+            )
+        
+        script_generator._generate_scene_script = generate_scene
+        script_generator.joke_optimizer.optimize_script_comedy = AsyncMock(
+            return_value=create_mock_comedy_analysis()
+        )
+        statuses = []
+        
+        script = await script_generator.generate_full_script(
+            script_id="test_order",
+            episode_outline=sample_episode_outline,
+            character_profiles=sample_voice_profiles,
+            show_metadata={},
+            progress_callback=lambda status, done, total: statuses.append(
+                (status, done)
+            ),
+        )
+        
+        assert statuses == [
+            ("Completed scene 3", 1),
+            ("Completed scene 2", 2),
+            ("Completed scene 1", 3),
+        ]
+        assert [scene.scene_number for scene in script.scenes] == [1, 2, 3]
+    
     @pytest.mark.asyncio
     @patch('src.services.creative.script_generator.ScriptValidator')
     @patch('src.services.creative.script_generator.JokeOptimizer')
@@ -1396,3 +2188,162 @@ class TestParallelSceneGeneration:
         assert call_count >= 2, (
             "Should have attempted at least 2 scenes before failure"
         )
+
+
+# ============================================================================
+# BATCHED SCENE GENERATION TESTS
+# ============================================================================
+
+class TestBatchedSceneGeneration:
+    """Test packing several scenes into one LLM request."""
+    
+    @pytest.mark.asyncio
+    async def test_batches_share_one_request(
+        self,
+        script_generator,
+        sample_episode_outline,
+        sample_voice_profiles,
+    ):
+        """Test each batch is one request and fills every scene it returns."""
+        def batch_response(scene_numbers):
+            return {
+                "scenes": [
+                    {
+                        "scene_number": number,
+                        "dialogue": [
+                            {
+                                "character": "Luna",
+                                "line": f"Scene {number}, oh wow!",
+                                "emotion": "excited",
+                            }
+                        ],
+                        "stage_directions": {
+                            "opening_description": "Control room",
+                            "action_beats": [
+                                {
+                                    "timing": "BEFORE LINE",
+                                    "description": "Luna bounces",
+                                    "duration_estimate": 2.0,
+                                    "involves_characters": ["Luna"],
+                                }
+                            ],
+                            "closing_description": "Fade out",
+                        },
+                    }
+                    for number in scene_numbers
+                ]
+            }
+        
+        script_generator.claude_client.generate_json = AsyncMock(
+            side_effect=[batch_response([1, 2]), batch_response([3])]
+        )
+        
+        finished = []
+        scenes = await script_generator._generate_scenes_batched(
+            sample_episode_outline["scenes"],
+            sample_voice_profiles,
+            batch_size=2,
+            on_scene=finished.append,
+        )
+        
+        assert [scene.scene_number for scene in scenes] == [1, 2, 3]
+        assert sorted(scene.scene_number for scene in finished) == [1, 2, 3]
+        assert script_generator.claude_client.generate_json.await_count == 2
+        script_generator.dialogue_generator.generate_dialogue.assert_not_called()
+        assert scenes[2].dialogue.dialogue_lines[0].line == "Scene 3, oh wow!"
+        assert scenes[0].stage_directions.action_beats[0].description == "Luna bounces"
+        # Scored like the per-scene path: both characters have profiles
+        assert scenes[0].dialogue.confidence_score == 1.0
+        
+        # The batch's outlines are embedded as indented JSON
+        first_prompt = (
+            script_generator.claude_client.generate_json.await_args_list[0]
+            .kwargs["prompt"]
+        )
+        assert json.dumps(
+            sample_episode_outline["scenes"][:2], indent=2, ensure_ascii=False
+        ) in first_prompt
+    
+    @pytest.mark.asyncio
+    async def test_missing_scenes_fall_back_per_scene(
+        self,
+        script_generator,
+        sample_episode_outline,
+        sample_voice_profiles,
+    ):
+        """Test scenes absent from the batched response use the per-scene path."""
+        script_generator.claude_client.generate_json = AsyncMock(
+            return_value={"scenes": [{"scene_number": 1, "dialogue": []}]}
+        )
+        
+        scenes = await script_generator._generate_scenes_batched(
+            sample_episode_outline["scenes"], sample_voice_profiles, batch_size=3
+        )
+        
+        assert [scene.scene_number for scene in scenes] == [1, 2, 3]
+        assert script_generator.dialogue_generator.generate_dialogue.await_count == 2
+
+
+def test_rate_limiter_shared_by_clients():
+    """Test one RPM/TPM limiter is passed to every AI client."""
+    with patch('src.services.creative.script_generator.ClaudeClient') as mock_claude, \
+         patch('src.services.creative.script_generator.OpenAIClient') as mock_openai, \
+         patch('src.services.creative.script_generator.DialogueGenerator'), \
+         patch('src.services.creative.script_generator.StageDirectionGenerator'), \
+         patch('src.services.creative.script_generator.JokeOptimizer'), \
+         patch('src.services.creative.script_generator.ScriptValidator'):
+        generator = ScriptGenerator(requests_per_minute=50, tokens_per_minute=40000)
+    
+    assert generator.rate_limiter is not None
+    assert generator.rate_limiter.tokens_per_minute == 40000
+    mock_claude.assert_called_once_with(
+        http_client=generator.http_client, rate_limiter=generator.rate_limiter
+    )
+    mock_openai.assert_called_once_with(
+        http_client=generator.http_client, rate_limiter=generator.rate_limiter
+    )
+
+
+@pytest.mark.asyncio
+async def test_close_releases_shared_connection_pool(script_generator):
+    """Test close() shuts the AI clients and then their shared pool."""
+    script_generator.claude_client.close = AsyncMock()
+    script_generator.gpt_client.close = AsyncMock()
+    
+    await script_generator.close()
+    
+    script_generator.claude_client.close.assert_awaited_once()
+    script_generator.gpt_client.close.assert_awaited_once()
+    assert script_generator.http_client.is_closed
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("client_class", [ClaudeClient, OpenAIClient])
+async def test_client_close_leaves_injected_pool_open(client_class):
+    """Test a client only closes the HTTP pool it created itself."""
+    pool = httpx.AsyncClient()
+    kwargs = {"enable_caching": False} if client_class is ClaudeClient else {}
+    
+    await client_class(api_key="test", http_client=pool, **kwargs).close()
+    assert not pool.is_closed
+    
+    owned = client_class(api_key="test", **kwargs)
+    await owned.close()
+    assert owned.client.is_closed()
+    
+    await pool.aclose()
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_canonical_json_ignores_key_order(monkeypatch, use_orjson):
+    """Test cache-key serialization is order-independent with either encoder."""
+    import src.services.creative.script_generator as script_generator_module
+    if use_orjson and not script_generator_module.ORJSON_AVAILABLE:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(script_generator_module, "ORJSON_AVAILABLE", use_orjson)
+    
+    first = {"scene_number": 1, "characters": ["Luna"], "when": datetime(2025, 1, 1)}
+    second = {"when": datetime(2025, 1, 1), "characters": ["Luna"], "scene_number": 1}
+    
+    assert _canonical_json(first) == _canonical_json(second)
+    assert _canonical_json(first) != _canonical_json({**first, "scene_number": 2})
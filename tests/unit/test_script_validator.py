@@ -4,6 +4,7 @@ Copyright (c) 2025 DOPPELGANGER STUDIO. All Rights Reserved.
 Unit tests for ScriptValidator component.
 """
 
+import json
 import pytest
 from datetime import datetime
 from unittest.mock import Mock, AsyncMock, patch
@@ -18,6 +19,7 @@ from src.services.creative.validation_models import (
     ProductionComplexityAssessment,
     PlotCoherenceScore,
     ScriptValidationReport,
+    PartialValidationReport,
 )
 from src.services.creative.character_voice_profiles import (
     DialogueLine,
@@ -302,6 +304,27 @@ class TestScriptValidator:
         assert 0.0 <= luna_score.catchphrase_usage <= 1.0
         assert 0.0 <= luna_score.relationship_consistency <= 1.0
     
+    def test_voice_match_averages_scenes_present(
+        self, validator, sample_scene_dialogues, sample_voice_profiles
+    ):
+        """Test voice match averages confidence over the scenes a character is in."""
+        # Riko leaves scene 3 and Luna is listed twice in scene 2
+        sample_scene_dialogues[1].characters_present = ["Luna", "Luna", "Riko"]
+        sample_scene_dialogues[2].characters_present = ["Luna"]
+        
+        character_scores = validator._score_character_consistency(
+            sample_scene_dialogues, sample_voice_profiles, []
+        )
+        
+        assert character_scores["Luna"].voice_match_score == pytest.approx(
+            (0.95 + 0.85 + 0.90) / 3
+        )
+        assert character_scores["Riko"].voice_match_score == pytest.approx(
+            (0.95 + 0.85) / 2
+        )
+        # Riko still speaks in scene 3, so it stays in Riko's scene list
+        assert character_scores["Riko"].scene_numbers == [1, 2, 3]
+    
     def test_vocabulary_consistency_scoring(self, validator, sample_voice_profiles):
         """Test vocabulary level consistency."""
         # Simple vocabulary (short words)
@@ -985,6 +1008,176 @@ class TestScriptValidator:
         assert "character" in summary_lower or "comedy" in summary_lower
         assert "quality" in summary_lower or "score" in summary_lower
 
+    def test_revalidate_comedy_matches_full_validation(
+        self,
+        validator,
+        sample_scene_dialogues,
+        sample_voice_profiles,
+        sample_comedy_analysis,
+        sample_episode_metadata,
+    ):
+        """Comedy-only re-validation agrees with a full validation pass."""
+        report = validator.validate_script(
+            script_id="test_revalidate",
+            scene_dialogues=sample_scene_dialogues,
+            voice_profiles=sample_voice_profiles,
+            comedy_analysis=sample_comedy_analysis,
+            episode_metadata=sample_episode_metadata,
+        )
+
+        sample_comedy_analysis.timing_analysis.clusters = ["Scene 1"]
+        sample_comedy_analysis.timing_analysis.pacing_score = 0.4
+
+        revalidated = validator.revalidate_comedy(
+            report, sample_scene_dialogues, sample_comedy_analysis
+        )
+        expected = validator.validate_script(
+            script_id="test_revalidate",
+            scene_dialogues=sample_scene_dialogues,
+            voice_profiles=sample_voice_profiles,
+            comedy_analysis=sample_comedy_analysis,
+            episode_metadata=sample_episode_metadata,
+        )
+
+        assert revalidated is not report
+        assert revalidated.overall_quality_score == pytest.approx(
+            expected.overall_quality_score
+        )
+        assert revalidated.validation_passed == expected.validation_passed
+        assert revalidated.comedy_distribution == expected.comedy_distribution
+        assert sorted(i.issue_id for i in revalidated.validation_issues) == sorted(
+            i.issue_id for i in expected.validation_issues
+        )
+        assert revalidated.summary == expected.summary
+        assert revalidated.recommendations == expected.recommendations
+        assert revalidated.character_consistency is report.character_consistency
+
+    def test_report_cache_reuses_unchanged_scripts(
+        self,
+        validator,
+        sample_scene_dialogues,
+        sample_voice_profiles,
+        sample_comedy_analysis,
+        sample_episode_metadata,
+    ):
+        """Test cached reports are reused until the dialogue changes."""
+        from src.services.caching import RedisCacheManager
+        validator.report_cache = RedisCacheManager(enable_redis=False)
+        validator._score_character_consistency = Mock(
+            wraps=validator._score_character_consistency
+        )
+        
+        def validate():
+            return validator.validate_script(
+                script_id="test_script_001",
+                scene_dialogues=sample_scene_dialogues,
+                voice_profiles=sample_voice_profiles,
+                comedy_analysis=sample_comedy_analysis,
+                episode_metadata=sample_episode_metadata,
+            )
+        
+        first = validate()
+        second = validate()
+        
+        assert validator._score_character_consistency.call_count == 1
+        assert second.to_dict() == first.to_dict()
+        assert second is not first
+        
+        # Entries are plain JSON, and hits never share state
+        cached = validator.report_cache.memory_cache.cache
+        assert json.loads(json.dumps(list(cached.values())[0]))
+        assert second.validation_issues
+        second.validation_issues.clear()
+        assert validate().validation_issues == first.validation_issues
+        
+        # Editing a line invalidates the report
+        sample_scene_dialogues[0].dialogue_lines[0].line = "Something else"
+        validate()
+        assert validator._score_character_consistency.call_count == 2
+    
+    def test_validate_script_with_precomputed_noncomedy(
+        self,
+        validator,
+        sample_scene_dialogues,
+        sample_voice_profiles,
+        sample_comedy_analysis,
+        sample_episode_metadata,
+    ):
+        """A validate_noncomedy result completes to the same report."""
+        noncomedy = validator.validate_noncomedy(
+            "test_split",
+            sample_scene_dialogues,
+            sample_voice_profiles,
+            sample_episode_metadata,
+        )
+        assert isinstance(noncomedy, PartialValidationReport)
+        
+        split = validator.validate_script(
+            script_id="test_split",
+            scene_dialogues=sample_scene_dialogues,
+            voice_profiles=sample_voice_profiles,
+            comedy_analysis=sample_comedy_analysis,
+            episode_metadata=sample_episode_metadata,
+            noncomedy=noncomedy,
+        )
+        full = validator.validate_script(
+            script_id="test_split",
+            scene_dialogues=sample_scene_dialogues,
+            voice_profiles=sample_voice_profiles,
+            comedy_analysis=sample_comedy_analysis,
+            episode_metadata=sample_episode_metadata,
+        )
+        
+        assert split.overall_quality_score == full.overall_quality_score
+        assert split.comedy_distribution == full.comedy_distribution
+        assert split.summary == full.summary
+        assert split.recommendations == full.recommendations
+
+    def test_prior_report_reused_for_untouched_characters(
+        self,
+        validator,
+        sample_scene_dialogues,
+        sample_voice_profiles,
+        sample_comedy_analysis,
+        sample_episode_metadata,
+    ):
+        """Only characters in dirty scenes are re-scored."""
+        kwargs = dict(
+            script_id="test_prior",
+            scene_dialogues=sample_scene_dialogues,
+            voice_profiles=sample_voice_profiles,
+            comedy_analysis=sample_comedy_analysis,
+            episode_metadata=sample_episode_metadata,
+        )
+        report = validator.validate_script(**kwargs)
+        assert report.character_consistency["Luna"].scene_numbers == [1, 2, 3]
+        
+        scored = []
+        original = validator._score_vocabulary_consistency
+        
+        def counting(lines, profile, issues):
+            scored.append(profile.character_name)
+            return original(lines, profile, issues)
+        
+        validator._score_vocabulary_consistency = counting
+        
+        reused = validator.validate_script(
+            **kwargs, prior_report=report, dirty_scene_numbers=set()
+        )
+        assert scored == []
+        assert reused.character_consistency["Luna"] is (
+            report.character_consistency["Luna"]
+        )
+        assert sorted(i.issue_id for i in reused.validation_issues) == sorted(
+            i.issue_id for i in report.validation_issues
+        )
+        assert reused.overall_quality_score == report.overall_quality_score
+        
+        validator.validate_script(
+            **kwargs, prior_report=report, dirty_scene_numbers={2}
+        )
+        assert sorted(scored) == ["Luna", "Riko"]
+
 
 class TestValidationIssue:
     """Test ValidationIssue dataclass."""
@@ -1031,6 +1224,32 @@ class TestValidationIssue:
         assert restored.issue_id == issue.issue_id
         assert restored.category == issue.category
         assert restored.severity == issue.severity
+    
+    def test_validation_issue_slots_and_pickling(self):
+        """Test slotted ValidationIssue has no __dict__ and still pickles."""
+        import pickle
+        issue = ValidationIssue(
+            issue_id="test_003",
+            category=ValidationCategory.PACING,
+            severity=ValidationSeverity.INFO,
+            message="Pacing note",
+            location="Scene 2",
+            suggestion="Tighten the scene",
+        )
+        
+        assert not hasattr(issue, "__dict__")
+        assert pickle.loads(pickle.dumps(issue)) == issue
+    
+    def test_severity_keeps_string_value_and_ranks(self):
+        """Test severities serialize as strings and rank critical first."""
+        assert ValidationSeverity("error") is ValidationSeverity.ERROR
+        assert ValidationSeverity.ERROR.value == "error"
+        assert sorted(ValidationSeverity, key=lambda s: s.rank) == [
+            ValidationSeverity.CRITICAL,
+            ValidationSeverity.ERROR,
+            ValidationSeverity.WARNING,
+            ValidationSeverity.INFO,
+        ]
 
 
 class TestCharacterConsistencyScore:
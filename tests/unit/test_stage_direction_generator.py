@@ -5,6 +5,7 @@ Tests visual scene descriptions, physical comedy choreography,
 and camera suggestions.
 """
 
+import asyncio
 import pytest
 from unittest.mock import AsyncMock, Mock
 import json
@@ -325,6 +326,242 @@ class TestStageDirectionGenerator:
         assert len(directions.physical_comedy_sequences) == 0
         assert directions.total_visual_runtime == 0.0
     
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("cache_mode", ["read_write", "read_only", "off"])
+    async def test_generate_stage_directions_reuses_cached_result(
+        self,
+        mock_claude_client,
+        sample_scene,
+        sample_scene_dialogue,
+        mock_stage_directions_response,
+        cache_mode
+    ):
+        """Test unchanged scenes reuse the stored result per cache mode."""
+        store = {}
+        db = Mock()
+        db.cache_get = AsyncMock(side_effect=store.get)
+        db.cache_set = AsyncMock(
+            side_effect=lambda key, value, ttl=None: store.__setitem__(key, value)
+        )
+        mock_claude_client.generate = AsyncMock(
+            return_value=mock_stage_directions_response
+        )
+        generator = StageDirectionGenerator(
+            claude_client=mock_claude_client,
+            database_manager=db,
+            cache_mode=cache_mode
+        )
+        
+        first = await generator.generate_stage_directions(
+            sample_scene, sample_scene_dialogue, ["Luna trips over cables"]
+        )
+        second = await generator.generate_stage_directions(
+            sample_scene, sample_scene_dialogue, ["Luna trips over cables"]
+        )
+        
+        expected_calls = 1 if cache_mode == "read_write" else 2
+        assert mock_claude_client.generate.call_count == expected_calls
+        assert len(store) == (cache_mode == "read_write")
+        assert all(isinstance(value, str) for value in store.values())
+        assert second.format_for_screenplay() == first.format_for_screenplay()
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("entry", [b"{not json", b'{"scene_number": 1}'])
+    async def test_unusable_cache_entry_is_a_miss(
+        self,
+        mock_claude_client,
+        sample_scene,
+        mock_stage_directions_response,
+        entry
+    ):
+        """Test corrupt or outdated cache entries fall through to the model."""
+        db = Mock()
+        db.cache_get = AsyncMock(return_value=entry)
+        db.cache_set = AsyncMock()
+        mock_claude_client.generate = AsyncMock(
+            return_value=mock_stage_directions_response
+        )
+        generator = StageDirectionGenerator(
+            claude_client=mock_claude_client,
+            database_manager=db
+        )
+        
+        directions = await generator.generate_stage_directions(sample_scene, None)
+        sequence = await generator._generate_physical_comedy_sequence(
+            "Luna trips", ["Luna"], "Lab"
+        )
+        
+        assert mock_claude_client.generate.call_count == 2
+        assert directions.action_beats
+        assert sequence.beat_name
+        assert db.cache_set.call_count == 2
+    
+    def test_rejects_unknown_cache_mode(self, mock_claude_client):
+        """Test an unknown cache mode is refused."""
+        with pytest.raises(ValueError):
+            StageDirectionGenerator(
+                claude_client=mock_claude_client,
+                cache_mode="write_only"
+            )
+    
+    @pytest.mark.asyncio
+    async def test_generate_stage_directions_fills_missing_keys(
+        self,
+        stage_direction_generator,
+        mock_claude_client,
+        sample_scene
+    ):
+        """Test keys the model leaves out fall back to defaults."""
+        mock_claude_client.generate = AsyncMock(return_value=json.dumps({
+            'action_beats': [{'description': 'Luna waves', 'camera_suggestion': {}}],
+            'physical_comedy_sequences': [{'setup_actions': [{}]}],
+            'camera_suggestions': [{'focus': 'Luna'}, {}]
+        }))
+        
+        directions = await stage_direction_generator.generate_stage_directions(
+            sample_scene, None
+        )
+        
+        beat = directions.action_beats[0]
+        assert (beat.timing, beat.duration_estimate, beat.visual_gag) == (
+            'CONTINUOUS', 1.0, False
+        )
+        assert beat.camera_suggestion is None
+        sequence = directions.physical_comedy_sequences[0]
+        assert sequence.beat_name == 'Physical Comedy'
+        assert sequence.setup_actions[0].visual_gag
+        assert sequence.climax_action.duration_estimate == 2.0
+        assert sequence.total_duration == 10.0
+        assert directions.camera_suggestions[0].shot_type == 'MEDIUM'
+        assert directions.camera_suggestions[1] == CameraSuggestion(
+            'MEDIUM', '', ''
+        )
+        assert directions.to_dict()['camera_suggestions'][1]['shot_type'] == 'MEDIUM'
+        assert directions.total_visual_runtime == 11.0
+    
+    @pytest.mark.asyncio
+    async def test_generate_stage_directions_streaming(
+        self,
+        mock_claude_client,
+        sample_scene,
+        sample_scene_dialogue,
+        mock_stage_directions_response
+    ):
+        """Test streamed replies parse the same as whole ones."""
+        async def stream(**kwargs):
+            for start in range(0, len(mock_stage_directions_response), 7):
+                yield mock_stage_directions_response[start:start + 7]
+        
+        mock_claude_client.generate = AsyncMock(
+            return_value=mock_stage_directions_response
+        )
+        mock_claude_client.generate_stream = Mock(side_effect=stream)
+        whole = await StageDirectionGenerator(
+            claude_client=mock_claude_client
+        ).generate_stage_directions(sample_scene, sample_scene_dialogue)
+        streamed = await StageDirectionGenerator(
+            claude_client=mock_claude_client,
+            stream_responses=True
+        ).generate_stage_directions(sample_scene, sample_scene_dialogue)
+        
+        assert mock_claude_client.generate.call_count == 1
+        assert mock_claude_client.generate_stream.call_count == 1
+        assert streamed.format_for_screenplay() == whole.format_for_screenplay()
+    
+    @pytest.mark.asyncio
+    async def test_streaming_abandons_malformed_reply(
+        self,
+        mock_claude_client,
+        sample_scene
+    ):
+        """Test a reply that is not JSON ends the stream early."""
+        sent = []
+        
+        async def stream(**kwargs):
+            for delta in ["Sure! Here are", " the stage directions:", " {"]:
+                sent.append(delta)
+                yield delta
+        
+        mock_claude_client.generate_stream = Mock(side_effect=stream)
+        generator = StageDirectionGenerator(
+            claude_client=mock_claude_client,
+            stream_responses=True
+        )
+        
+        directions = await generator.generate_stage_directions(sample_scene, None)
+        
+        assert sent == ["Sure! Here are"]
+        assert directions.action_beats == []
+        assert directions.opening_description == sample_scene['location']
+    
+    @pytest.mark.asyncio
+    async def test_generate_stage_directions_batch(
+        self,
+        stage_direction_generator,
+        mock_claude_client,
+        sample_scene
+    ):
+        """Test batch staging keeps scene order and bounds concurrency."""
+        in_flight = 0
+        peak = 0
+        
+        async def slow_failure(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            raise Exception("API Error")
+        
+        mock_claude_client.generate = slow_failure
+        scenes = [
+            ({**sample_scene, 'scene_number': number}, None, None)
+            for number in range(1, 6)
+        ]
+        
+        directions = await stage_direction_generator.generate_stage_directions_batch(
+            scenes, max_concurrency=2
+        )
+        
+        assert [d.scene_number for d in directions] == [1, 2, 3, 4, 5]
+        assert peak == 2
+    
+    @pytest.mark.asyncio
+    async def test_generate_stage_directions_batch_offline(
+        self,
+        stage_direction_generator,
+        mock_claude_client,
+        sample_scene
+    ):
+        """Test offline batch parses each result and falls back per scene."""
+        mock_claude_client.generate_batch = AsyncMock(return_value={
+            'scene-0': json.dumps({
+                'opening_description': 'The lab hums',
+                'action_beats': [
+                    {'description': 'Luna waves', 'duration_estimate': 2.0}
+                ]
+            }),
+            'scene-1': None
+        })
+        scenes = [
+            ({**sample_scene, 'scene_number': 1}, None, None),
+            ({**sample_scene, 'scene_number': 2}, None, ['Luna trips'])
+        ]
+        
+        directions = await stage_direction_generator.generate_stage_directions_batch_offline(
+            scenes, poll_interval=0
+        )
+        
+        assert [d.scene_number for d in directions] == [1, 2]
+        assert directions[0].opening_description == 'The lab hums'
+        assert directions[0].total_visual_runtime == 2.0
+        assert directions[1].action_beats == []
+        
+        call = mock_claude_client.generate_batch.call_args
+        assert set(call.args[0]) == {'scene-0', 'scene-1'}
+        assert 'Luna trips' in call.args[0]['scene-1']
+        assert call.kwargs['cached_prefix']
+    
     @pytest.mark.asyncio
     async def test_generate_physical_comedy_sequence(
         self,
@@ -375,6 +612,12 @@ class TestStageDirectionGenerator:
         assert isinstance(sequence, PhysicalComedySequence)
         assert 'Cable Trip' in sequence.beat_name or 'Luna trips' in sequence.beat_name
         assert sequence.total_duration > 0
+        
+        # Choreography instructions are a shared prefix; only the gag varies
+        call = mock_claude_client.generate.call_args
+        assert 'choreographer' in call.kwargs['cached_prefix']
+        assert 'Luna trips over cable' not in call.kwargs['cached_prefix']
+        assert 'Luna trips over cable' in call.kwargs['prompt']
     
     @pytest.mark.asyncio
     async def test_generate_physical_comedy_sequence_fallback(
@@ -814,6 +1057,28 @@ class TestSceneStageDirections:
         # 1 action beat + 4 from sequence = 5 total
         assert len(all_directions) == 5
     
+    def test_timing_index_groups_beats_in_order(self):
+        """Test action beats are indexed by timing, keeping beat order."""
+        directions = SceneStageDirections(
+            scene_number=1,
+            opening_description='Open',
+            action_beats=[
+                StageDirection('BEFORE', 'Luna enters', 1.0, ['Luna'], False),
+                StageDirection('AFTER', 'Rick sighs', 1.0, ['Rick'], False),
+                StageDirection('BEFORE', 'Lights flicker', 1.0, [], False),
+            ],
+            physical_comedy_sequences=[],
+            closing_description='Close',
+            camera_suggestions=[],
+            total_visual_runtime=3.0
+        )
+        
+        assert directions.timing_index == {
+            'BEFORE': ['Luna enters', 'Lights flicker'],
+            'AFTER': ['Rick sighs'],
+        }
+        assert directions.timing_index is directions.timing_index
+    
     def test_format_for_screenplay(self):
         """Test scene stage directions screenplay formatting."""
         action_beats = [
@@ -866,3 +1131,42 @@ class TestSceneStageDirections:
         assert len(data['action_beats']) == 1
         assert data['total_visual_runtime'] == 5.0
         assert 'generated_at' in data
+    
+    def test_to_json_bytes_matches_to_dict(self):
+        """Test JSON bytes decode to the to_dict() form."""
+        camera = CameraSuggestion('CLOSE-UP', 'Luna', 'Reaction', 'PUSH IN')
+        beat = StageDirection(
+            'DURING', 'Luna gasps — café', 1.0, ['Luna'], True, camera
+        )
+        directions = SceneStageDirections(
+            scene_number=3,
+            opening_description='Scene opens',
+            action_beats=[beat],
+            physical_comedy_sequences=[
+                PhysicalComedySequence('Trip', [beat], [], beat, beat, 4.0)
+            ],
+            closing_description='Scene closes',
+            camera_suggestions=[camera],
+            total_visual_runtime=5.0
+        )
+        
+        assert json.loads(directions.to_json_bytes()) == directions.to_dict()
+    
+    def test_to_json_bytes_ignores_cached_timing_index(self):
+        """Test a computed timing index does not leak into the JSON bytes."""
+        beat = StageDirection('DURING', 'Luna gasps', 1.0, ['Luna'], True)
+        directions = SceneStageDirections(
+            scene_number=3,
+            opening_description='Scene opens',
+            action_beats=[beat],
+            physical_comedy_sequences=[],
+            closing_description='Scene closes',
+            camera_suggestions=[],
+            total_visual_runtime=1.0
+        )
+        
+        assert directions.timing_index
+        payload = json.loads(directions.to_json_bytes())
+        
+        assert 'timing_index' not in payload
+        assert payload == directions.to_dict()